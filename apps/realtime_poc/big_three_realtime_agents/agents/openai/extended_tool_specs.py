@@ -145,6 +145,20 @@ def build_workflow_tool_specs() -> List[Dict[str, Any]]:
                                 "agent_id": {"type": "string"},
                                 "duration": {"type": "number"},
                                 "dependencies": {"type": "array", "items": {"type": "string"}},
+                                "cacheable": {
+                                    "type": "boolean",
+                                    "description": (
+                                        "Reuse the result of an identical earlier run "
+                                        "(read-only tasks such as analysis or review)"
+                                    ),
+                                },
+                                "timeout": {
+                                    "type": "number",
+                                    "description": (
+                                        "Max execution seconds "
+                                        "(default: derived from the duration estimate)"
+                                    ),
+                                },
                             },
                             "required": ["description", "agent_id"],
                         },
@@ -154,6 +168,14 @@ def build_workflow_tool_specs() -> List[Dict[str, Any]]:
                         "enum": ["sequential", "parallel"],
                         "description": "Overall execution strategy"
                     },
+                    "failure_policy": {
+                        "type": "string",
+                        "enum": ["continue_on_error", "fail_fast"],
+                        "description": (
+                            "On a failed task: let the others finish (default) "
+                            "or cancel running tasks and stop"
+                        ),
+                    },
                 },
                 "required": ["goal", "tasks"],
             },
@@ -7,7 +7,7 @@ Provides tools for planning and executing multi-agent workflows.
 import logging
 from typing import Dict, Any, List, Optional
 
-from ...workflow.workflow_models import ExecutionStrategy
+from ...workflow.workflow_models import ExecutionStrategy, FailurePolicy
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +83,8 @@ class WorkflowTools:
         self,
         goal: str,
         tasks: List[Dict[str, Any]],
-        strategy: str = "sequential"
+        strategy: str = "sequential",
+        failure_policy: str = "continue_on_error",
     ) -> Dict[str, Any]:
         """
         Create multi-task workflow.
@@ -92,13 +93,16 @@ class WorkflowTools:
             goal: Overall goal
             tasks: List of task dicts
             strategy: Execution strategy
+            failure_policy: "continue_on_error" or "fail_fast"
 
         Returns:
             Dict with plan details
         """
         try:
             exec_strategy = ExecutionStrategy(strategy)
-            plan = self.planner.create_multi_task_plan(goal, tasks, exec_strategy)
+            plan = self.planner.create_multi_task_plan(
+                goal, tasks, exec_strategy, FailurePolicy(failure_policy)
+            )
 
             # Store plan
             self.active_workflows[plan.plan_id] = plan
@@ -152,6 +156,27 @@ class WorkflowTools:
             self.logger.error(f"Failed to execute workflow: {exc}")
             return {"ok": False, "error": str(exc)}
 
+    async def resume_workflow(self, execution_id: str) -> Dict[str, Any]:
+        """
+        Resume an interrupted workflow execution from its journal.
+
+        Args:
+            execution_id: Execution identifier
+
+        Returns:
+            Dict with execution result
+        """
+        try:
+            result = await self.engine.resume(execution_id)
+            return {
+                "ok": True,
+                **result
+            }
+
+        except Exception as exc:
+            self.logger.error(f"Failed to resume workflow: {exc}")
+            return {"ok": False, "error": str(exc)}
+
     def get_workflow_status(self, plan_id: str) -> Dict[str, Any]:
         """
         Get status of active workflow.
@@ -10,6 +10,7 @@ from typing import List, Dict, Optional
 import re
 
 from .expert_definition import ExpertDefinition
+from ...text_normalization import tokenize, contains_phrase
 
 logger = logging.getLogger(__name__)
 
@@ -103,40 +104,36 @@ class IntelligentAgentSelector:
     ) -> Dict[str, float]:
         """Score all experts for task relevance."""
         scores = {}
-        task_lower = task.lower()
-        context_lower = (context or "").lower()
+        task_words = set(tokenize(task))
 
         for agent_id, expert in self.experts.items():
             score = 0.0
 
             # Score trigger keywords (weight: 3.0)
             for trigger in expert.triggers:
-                trigger_lower = trigger.lower()
-                if trigger_lower in task_lower:
+                if contains_phrase(task, trigger):
                     score += 3.0
-                elif any(word in task_lower for word in trigger_lower.split()):
+                elif task_words.intersection(tokenize(trigger)):
                     score += 1.0
 
             # Score description match (weight: 2.0)
-            desc_words = set(expert.description.lower().split())
-            task_words = set(task_lower.split())
+            desc_words = set(tokenize(expert.description))
             overlap = len(desc_words & task_words)
             score += overlap * 0.5
 
             # Score category match (weight: 1.0)
-            if expert.category.lower() in task_lower:
+            if contains_phrase(task, expert.category):
                 score += 1.0
 
             # Score focus areas (weight: 2.0)
             for area in expert.focus_areas:
-                area_lower = area.lower()
-                if area_lower in task_lower:
+                if contains_phrase(task, area):
                     score += 2.0
 
             # Context scoring if provided
             if context:
                 for trigger in expert.triggers:
-                    if trigger.lower() in context_lower:
+                    if contains_phrase(context, trigger):
                         score += 1.0
 
             scores[agent_id] = score
@@ -151,7 +148,7 @@ class IntelligentAgentSelector:
 
         matched_triggers = [
             t for t in expert.triggers
-            if t.lower() in task.lower()
+            if contains_phrase(task, t)
         ]
 
         explanation = f"Selected '{expert.name}' because:\n"
@@ -9,6 +9,7 @@ import json
 from typing import Optional, List, Dict, Any
 
 from .agent_pool import AgentPoolManager, ExpertDefinition
+from ...text_normalization import contains_phrase
 
 
 logger = logging.getLogger(__name__)
@@ -83,9 +84,7 @@ class ExpertSelector:
         Returns:
             Selected expert_id or None
         """
-        task_lower = task_description.lower()
-
-        # Keyword matching
+        # Keyword matching (whole normalized words/phrases)
         keywords_map = {
             "BackendExpert": ["backend", "api", "server", "database", "fastapi", "django"],
             "FrontendExpert": ["frontend", "ui", "react", "vue", "component", "page"],
@@ -102,12 +101,12 @@ class ExpertSelector:
             keywords = keywords_map.get(expert.expert_id, [])
 
             for keyword in keywords:
-                if keyword in task_lower:
+                if contains_phrase(task_description, keyword):
                     score += 1
 
             # Also check skills
             for skill in expert.skills:
-                if skill.lower() in task_lower:
+                if contains_phrase(task_description, skill):
                     score += 0.5
 
             if score > 0:
@@ -159,9 +158,8 @@ class ExpertSelector:
             "mobile": {"expert_id": "MobileExpert", "name": "Mobile Development Expert"},
         }
 
-        task_lower = task_description.lower()
         for keyword, expert_def in specialized_keywords.items():
-            if keyword in task_lower:
+            if contains_phrase(task_description, keyword):
                 # Check if not already in pool
                 if expert_def["expert_id"] not in [e.expert_id for e in existing_experts]:
                     return {
@@ -70,13 +70,17 @@ class InstanceExecutor:
             task_summary = result.get("output", "")[:500]  # First 500 chars
             self.pool_manager.release_instance(instance_id, task_summary)
 
-            return {
+            response = {
                 "success": True,
                 "instance_id": instance_id,
                 "output": result.get("output", ""),
                 "files_modified": result.get("files_modified", []),
                 "task_count": len(instance.task_history),
             }
+            if result.get("error"):
+                # Coder raised; output holds the error text
+                response["error"] = result["error"]
+            return response
 
         except Exception as exc:
             self.logger.error(f"Task execution failed for {instance_id}: {exc}")
@@ -128,7 +132,11 @@ class InstanceExecutor:
             return result
         except Exception as exc:
             self.logger.error(f"Claude execution error: {exc}")
-            return {"output": f"Execution error: {str(exc)}", "files_modified": []}
+            return {
+                "output": f"Execution error: {str(exc)}",
+                "files_modified": [],
+                "error": str(exc),
+            }
 
     def _update_instance_after_execution(
         self, instance: AgentInstance, task: str, result: Dict[str, Any]
@@ -88,6 +88,12 @@ class WorkflowTaskError(WorkflowError):
     pass
 
 
+class WorkflowTimeoutError(WorkflowExecutionError):
+    """Workflow task or workflow deadline timed out."""
+
+    pass
+
+
 # ============================================================================
 # Memory Errors
 # ============================================================================
@@ -7,6 +7,14 @@ recommendations for improved agent and workflow performance.
 Modules:
     learning_manager: Central learning coordinator
     outcome_tracker: Track success/failure patterns
+    outcome_stats: Incremental per-agent/task-type statistics
+    outcome_rollups: Hourly/daily trend buckets and regression detection
+    columnar_outcomes: NumPy column store for vectorized analytics
+    task_types: Coarse task categorization
+    minhash_lsh: Approximate similar-task lookup
+    expert_bandit: Latency- and cost-aware expert selection
+    duration_predictor: Learned P50/P90 task duration estimates
+    train_duration_model: Offline duration model training entry point
     pattern_analyzer: Analyze and extract patterns
     recommender: Suggest approaches based on history
 
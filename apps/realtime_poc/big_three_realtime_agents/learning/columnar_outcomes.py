@@ -0,0 +1,332 @@
+"""
+Columnar outcomes - NumPy column store for vectorized outcome analytics.
+
+Outcomes are kept as parallel arrays (timestamp, duration, success flag,
+interned agent / task-type / task-text codes) instead of lists of dicts,
+so group-by success rates and latency percentiles over 100k+ outcomes are
+a few NumPy calls. Columns persist as .npy files that are memory-mapped on
+load; strings (agent IDs, task types, task texts) live in a string table.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Sequence
+
+import numpy as np
+
+from .task_types import infer_task_type
+
+logger = logging.getLogger(__name__)
+
+COLUMNS_VERSION = 1
+
+_DTYPES = {
+    "timestamp": np.float64,   # POSIX seconds (NaN if unknown)
+    "duration": np.float64,    # seconds (NaN if not reported)
+    "success": np.bool_,
+    "agent": np.int32,         # code into strings["agent"]
+    "task_type": np.int32,     # code into strings["task_type"]
+    "task": np.int32,          # code into strings["task"]
+}
+_STRING_COLUMNS = ("agent", "task_type", "task")
+
+_INITIAL_CAPACITY = 1024
+
+
+def _to_epoch(timestamp: Optional[str]) -> float:
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class ColumnarOutcomes:
+    """
+    Column store of outcomes with vectorized aggregations.
+
+    Files (in storage_dir):
+        <column>.npy    - one array per column (memory-mapped on load)
+        strings.json    - string tables and row count (watermark)
+
+    Example:
+        >>> columns = ColumnarOutcomes(Path("memory/learning/columnar"))
+        >>> columns.catch_up(outcomes)
+        >>> columns.success_rates(by="agent")
+        {'backend-architect': {'total': 120, 'successes': 110, 'success_rate': 0.92}}
+    """
+
+    def __init__(self, storage_dir: Optional[Path] = None):
+        """
+        Initialize store, memory-mapping persisted columns if present.
+
+        Args:
+            storage_dir: Optional directory for persisted columns
+        """
+        self.storage_dir = Path(storage_dir) if storage_dir else None
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._size = 0
+        self._saved_size = 0
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=dtype) for name, dtype in _DTYPES.items()
+        }
+        self._strings: Dict[str, List[str]] = {name: [] for name in _STRING_COLUMNS}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in _STRING_COLUMNS}
+
+        self._load()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def catch_up(self, outcomes: Sequence[Dict[str, Any]]) -> None:
+        """
+        Append outcomes beyond the stored row count.
+
+        Rebuilds if the history is shorter than the stored columns.
+
+        Args:
+            outcomes: Full outcome history, oldest first
+        """
+        if self._size > len(outcomes):
+            self.logger.warning("Outcome history shorter than columnar store, rebuilding")
+            self.rebuild(outcomes)
+            return
+
+        for outcome in outcomes[self._size:]:
+            self.append(outcome)
+
+    def rebuild(self, outcomes: Iterable[Dict[str, Any]]) -> None:
+        """Reset and append outcomes."""
+        with self._lock:
+            self._size = 0
+            self._saved_size = -1
+            self._columns = {name: np.empty(0, dtype=dtype) for name, dtype in _DTYPES.items()}
+            self._strings = {name: [] for name in _STRING_COLUMNS}
+            self._codes = {name: {} for name in _STRING_COLUMNS}
+        for outcome in outcomes:
+            self.append(outcome)
+
+    def append(self, outcome: Dict[str, Any]) -> None:
+        """Append one outcome record."""
+        duration = outcome.get("duration")
+        row = {
+            "timestamp": _to_epoch(outcome.get("timestamp")),
+            "duration": float("nan") if duration is None else duration,
+            "success": outcome.get("status") == "success",
+            "agent": outcome.get("agent_id", "unknown"),
+            "task_type": outcome.get("task_type") or infer_task_type(outcome.get("task", "")),
+            "task": outcome.get("task", ""),
+        }
+
+        with self._lock:
+            self._ensure_capacity(self._size + 1)
+            for name in _DTYPES:
+                value = row[name]
+                if name in _STRING_COLUMNS:
+                    value = self._intern(name, value)
+                self._columns[name][self._size] = value
+            self._size += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of a column (string columns hold codes)."""
+        view = self._columns[name][:self._size].view()
+        view.flags.writeable = False
+        return view
+
+    def strings(self, name: str) -> List[str]:
+        """String table for an interned column."""
+        return list(self._strings[name])
+
+    def mask(
+        self,
+        agent_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """
+        Boolean row filter.
+
+        Args:
+            agent_id: Optional agent filter
+            task_type: Optional task type filter
+            since: Optional inclusive start time
+            until: Optional exclusive end time
+
+        Returns:
+            Boolean array with one entry per outcome
+        """
+        with self._lock:
+            selected = np.ones(self._size, dtype=bool)
+            for name, value in (("agent", agent_id), ("task_type", task_type)):
+                if value is not None:
+                    code = self._codes[name].get(value, -1)
+                    selected &= self._columns[name][:self._size] == code
+
+            timestamps = self._columns["timestamp"][:self._size]
+            if since is not None:
+                selected &= timestamps >= since.timestamp()
+            if until is not None:
+                selected &= timestamps < until.timestamp()
+        return selected
+
+    def success_rates(
+        self, by: str = "agent", mask: Optional[np.ndarray] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Group-by success rates.
+
+        Args:
+            by: "agent" or "task_type"
+            mask: Optional row filter (see mask())
+
+        Returns:
+            Dict of group -> {total, successes, success_rate}
+        """
+        with self._lock:
+            codes = self._columns[by][:self._size]
+            success = self._columns["success"][:self._size]
+            if mask is not None:
+                codes, success = codes[mask], success[mask]
+
+            groups = len(self._strings[by])
+            totals = np.bincount(codes, minlength=groups)
+            successes = np.bincount(codes, weights=success, minlength=groups)
+            names = self._strings[by]
+
+        return {
+            names[code]: {
+                "total": int(totals[code]),
+                "successes": int(successes[code]),
+                "success_rate": float(successes[code] / totals[code]),
+            }
+            for code in np.flatnonzero(totals)
+        }
+
+    def duration_percentiles(
+        self,
+        by: str = "agent",
+        quantiles: Sequence[float] = (0.5, 0.9),
+        mask: Optional[np.ndarray] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Group-by exact duration percentiles (outcomes without a duration are ignored).
+
+        Args:
+            by: "agent" or "task_type"
+            quantiles: Quantiles in [0, 1]
+            mask: Optional row filter (see mask())
+
+        Returns:
+            Dict of group -> {"p50": ..., "p90": ..., "count": n}
+        """
+        with self._lock:
+            codes = self._columns[by][:self._size]
+            durations = self._columns["duration"][:self._size]
+            valid = ~np.isnan(durations)
+            if mask is not None:
+                valid &= mask
+            codes, durations = codes[valid], durations[valid]
+            names = self._strings[by]
+
+        if not len(codes):
+            return {}
+
+        # Sort by group then duration, so each group is a contiguous sorted run
+        order = np.lexsort((durations, codes))
+        codes, durations = codes[order], durations[order]
+        group_codes, starts, counts = np.unique(codes, return_index=True, return_counts=True)
+
+        results = {}
+        for code, start, count in zip(group_codes, starts, counts):
+            run = durations[start:start + count]
+            values = np.quantile(run, quantiles)
+            results[names[code]] = {
+                **{f"p{round(q * 100)}": float(v) for q, v in zip(quantiles, values)},
+                "count": int(count),
+            }
+        return results
+
+    def save(self) -> None:
+        """Persist columns and string tables (no-op if unchanged)."""
+        if not self.storage_dir:
+            return
+
+        with self._lock:
+            if self._size == self._saved_size:
+                return
+            columns = {name: np.array(array[:self._size]) for name, array in self._columns.items()}
+            meta = {"version": COLUMNS_VERSION, "count": self._size, "strings": self._strings}
+            meta_text = json.dumps(meta)
+            size = self._size
+
+        try:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            for name, array in columns.items():
+                tmp_file = self.storage_dir / f"{name}.tmp.npy"
+                np.save(tmp_file, array)
+                tmp_file.replace(self.storage_dir / f"{name}.npy")
+
+            # Written last: its count is the watermark for the columns above
+            tmp_file = self.storage_dir / "strings.tmp"
+            tmp_file.write_text(meta_text)
+            tmp_file.replace(self.storage_dir / "strings.json")
+            self._saved_size = size
+        except Exception as exc:
+            self.logger.error(f"Failed to save columnar outcomes: {exc}")
+
+    def _intern(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._strings[name])
+            self._strings[name].append(value)
+        return code
+
+    def _ensure_capacity(self, size: int) -> None:
+        """Grow columns geometrically (also copies memory-mapped columns into memory)."""
+        capacity = len(self._columns["success"])
+        if size <= capacity and self._columns["success"].flags.writeable:
+            return
+
+        new_capacity = max(_INITIAL_CAPACITY, capacity * 2, size)
+        for name, array in self._columns.items():
+            grown = np.empty(new_capacity, dtype=_DTYPES[name])
+            grown[:self._size] = array[:self._size]
+            self._columns[name] = grown
+
+    def _load(self) -> None:
+        if not self.storage_dir:
+            return
+
+        meta_file = self.storage_dir / "strings.json"
+        if not meta_file.exists():
+            return
+
+        try:
+            meta = json.loads(meta_file.read_text())
+            if meta.get("version") != COLUMNS_VERSION:
+                self.logger.warning("Columnar outcome format changed, rebuilding")
+                return
+
+            count = meta["count"]
+            columns = {}
+            for name in _DTYPES:
+                array = np.load(self.storage_dir / f"{name}.npy", mmap_mode="r")
+                if len(array) < count:
+                    raise ValueError(f"column {name} has {len(array)} rows, expected {count}")
+                columns[name] = array
+
+            self._columns = columns
+            self._strings = {name: list(meta["strings"][name]) for name in _STRING_COLUMNS}
+            self._codes = {
+                name: {value: code for code, value in enumerate(values)}
+                for name, values in self._strings.items()
+            }
+            self._size = self._saved_size = count
+        except Exception as exc:
+            self.logger.error(f"Failed to load columnar outcomes, rebuilding: {exc}")
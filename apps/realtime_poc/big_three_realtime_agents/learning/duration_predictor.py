@@ -0,0 +1,282 @@
+"""
+Duration predictor - Learned P50/P90 task duration estimates.
+
+Fits a ridge regression on log duration from past outcomes (OutcomeTracker)
+and workflow task results (WorkflowMemory), using the expert, task length,
+task-type keyword categories and expert tier as features. The P90 estimate
+adds the empirical 90th percentile of the training residuals. Training is
+offline (see the train_duration_model entry point, or
+OrchestratorIntegration.train_duration_model); the fitted model is a small
+JSON file loaded by the workflow planner.
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Callable
+
+import numpy as np
+
+from ..text_normalization import tokenize
+from .task_types import task_type_hits
+
+logger = logging.getLogger(__name__)
+
+MODEL_VERSION = 2
+
+# Minimum samples with a duration before a model is fitted
+DEFAULT_MIN_SAMPLES = 10
+
+# Experts with fewer samples share the "unknown expert" baseline
+DEFAULT_MIN_AGENT_SAMPLES = 3
+
+DEFAULT_RIDGE_ALPHA = 1.0
+
+TIERS = ("tier1-core", "tier2-specialized", "tier3-experimental")
+
+
+@dataclass
+class DurationEstimate:
+    """
+    Predicted task duration.
+
+    Attributes:
+        p50: Median duration in seconds
+        p90: 90th percentile duration in seconds
+    """
+    p50: int
+    p90: int
+
+
+def _tier_name(tier: Any) -> Optional[str]:
+    """Normalize an AgentTier enum or string to its value."""
+    if tier is None:
+        return None
+    return getattr(tier, "value", tier)
+
+
+def collect_training_samples(
+    outcome_tracker=None,
+    workflow_memory=None,
+    tier_lookup: Optional[Callable[[str], Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Gather (task, agent_id, duration, tier) samples from history.
+
+    Args:
+        outcome_tracker: Optional OutcomeTracker (successful outcomes with a
+            duration, read from its column store)
+        workflow_memory: Optional WorkflowMemory (task results with duration_seconds)
+        tier_lookup: Optional agent_id -> tier function
+
+    Returns:
+        List of sample dicts
+    """
+    samples = []
+
+    if outcome_tracker is not None:
+        samples.extend(_outcome_samples(outcome_tracker.columns))
+
+    if workflow_memory is not None:
+        for entry in workflow_memory.get_recent(workflow_memory.count()):
+            execution = workflow_memory.get_execution(entry["execution_id"]) or {}
+            for stage in execution.get("stage_results", []):
+                for result in stage.get("task_results", []):
+                    if result.get("status") == "completed" and result.get("duration_seconds"):
+                        samples.append({
+                            "task": result.get("description", ""),
+                            "agent_id": result.get("agent_id", "unknown"),
+                            "duration": result["duration_seconds"],
+                        })
+
+    if tier_lookup is not None:
+        for sample in samples:
+            sample["tier"] = _tier_name(tier_lookup(sample["agent_id"]))
+
+    return samples
+
+
+def _outcome_samples(columns) -> List[Dict[str, Any]]:
+    """Successful outcomes with a duration, selected from the column store."""
+    count = len(columns)
+    durations = columns.column("duration")[:count]
+    rows = np.flatnonzero(columns.column("success")[:count] & (durations > 0))
+
+    agents, tasks = columns.strings("agent"), columns.strings("task")
+    agent_codes = columns.column("agent")[rows]
+    task_codes = columns.column("task")[rows]
+    return [
+        {"task": tasks[task], "agent_id": agents[agent], "duration": float(duration)}
+        for task, agent, duration in zip(task_codes, agent_codes, durations[rows])
+    ]
+
+
+class DurationPredictor:
+    """
+    Ridge regression on log duration with residual quantiles.
+
+    Example:
+        >>> predictor = DurationPredictor()
+        >>> predictor.fit(collect_training_samples(tracker, workflow_memory))
+        >>> predictor.predict("Build REST API", "backend-architect")
+        DurationEstimate(p50=240, p90=610)
+    """
+
+    def __init__(
+        self,
+        ridge_alpha: float = DEFAULT_RIDGE_ALPHA,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        min_agent_samples: int = DEFAULT_MIN_AGENT_SAMPLES,
+    ):
+        """
+        Initialize (untrained) predictor.
+
+        Args:
+            ridge_alpha: L2 regularization strength
+            min_samples: Samples required to fit a model
+            min_agent_samples: Samples required for an expert-specific feature
+        """
+        self.ridge_alpha = ridge_alpha
+        self.min_samples = min_samples
+        self.min_agent_samples = min_agent_samples
+        self.logger = logger
+
+        self.agents: List[str] = []
+        self.weights: Optional[np.ndarray] = None
+        self.residual_p50 = 0.0
+        self.residual_p90 = 0.0
+        self.sample_count = 0
+
+    @property
+    def is_trained(self) -> bool:
+        return self.weights is not None
+
+    def fit(self, samples: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Fit the model on samples (dicts with task, agent_id, duration, tier).
+
+        Returns:
+            False if there were too few samples (model left unchanged)
+        """
+        samples = [s for s in samples if s.get("duration") and s["duration"] > 0]
+        if len(samples) < self.min_samples:
+            self.logger.info(
+                f"Not enough duration samples to fit ({len(samples)} < {self.min_samples})"
+            )
+            return False
+
+        agent_counts: Dict[str, int] = {}
+        for sample in samples:
+            agent_counts[sample["agent_id"]] = agent_counts.get(sample["agent_id"], 0) + 1
+        agents = sorted(a for a, n in agent_counts.items() if n >= self.min_agent_samples)
+
+        X = np.array([
+            self._features(s["task"], s["agent_id"], s.get("tier"), agents) for s in samples
+        ])
+        y = np.log(np.array([float(s["duration"]) for s in samples]))
+
+        # Don't regularize the intercept
+        penalty = self.ridge_alpha * np.eye(X.shape[1])
+        penalty[0, 0] = 0.0
+        weights = np.linalg.solve(X.T @ X + penalty, X.T @ y)
+
+        residuals = y - X @ weights
+        self.agents = agents
+        self.weights = weights
+        self.residual_p50 = float(np.quantile(residuals, 0.5))
+        self.residual_p90 = float(np.quantile(residuals, 0.9))
+        self.sample_count = len(samples)
+
+        self.logger.info(
+            f"Fitted duration model on {len(samples)} samples ({len(agents)} experts)"
+        )
+        return True
+
+    def predict(
+        self, task: str, agent_id: str, tier: Any = None
+    ) -> Optional[DurationEstimate]:
+        """
+        Predict task duration.
+
+        Args:
+            task: Task description
+            agent_id: Expert that will run the task
+            tier: Optional expert tier (AgentTier or its value)
+
+        Returns:
+            DurationEstimate, or None if the model is untrained
+        """
+        if not self.is_trained:
+            return None
+
+        log_duration = float(
+            np.dot(self._features(task, agent_id, _tier_name(tier), self.agents), self.weights)
+        )
+        p50 = math.exp(log_duration + self.residual_p50)
+        p90 = math.exp(log_duration + max(self.residual_p90, self.residual_p50))
+        return DurationEstimate(p50=max(1, round(p50)), p90=max(1, round(p90)))
+
+    def save(self, path: Path) -> None:
+        """Save the fitted model as JSON."""
+        if not self.is_trained:
+            return
+
+        data = {
+            "version": MODEL_VERSION,
+            "agents": self.agents,
+            "weights": self.weights.tolist(),
+            "residual_p50": self.residual_p50,
+            "residual_p90": self.residual_p90,
+            "sample_count": self.sample_count,
+        }
+        try:
+            Path(path).write_text(json.dumps(data, indent=2))
+        except Exception as exc:
+            self.logger.error(f"Failed to save duration model: {exc}")
+
+    @classmethod
+    def load(cls, path: Path) -> "DurationPredictor":
+        """
+        Load a fitted model (untrained predictor if missing or incompatible).
+        """
+        predictor = cls()
+        path = Path(path)
+        if not path.exists():
+            return predictor
+
+        try:
+            data = json.loads(path.read_text())
+            weights = np.array(data["weights"])
+            expected = len(cls._features("", "", None, data["agents"]))
+            if data.get("version") != MODEL_VERSION or len(weights) != expected:
+                logger.warning("Duration model is incompatible, ignoring")
+                return predictor
+
+            predictor.agents = data["agents"]
+            predictor.weights = weights
+            predictor.residual_p50 = data["residual_p50"]
+            predictor.residual_p90 = data["residual_p90"]
+            predictor.sample_count = data.get("sample_count", 0)
+        except Exception as exc:
+            logger.error(f"Failed to load duration model: {exc}")
+
+        return predictor
+
+    @staticmethod
+    def _features(
+        task: str, agent_id: str, tier: Optional[str], agents: List[str]
+    ) -> List[float]:
+        """Intercept, length, task-type keyword hits, tier and expert one-hots."""
+        words = tokenize(task, remove_stop_words=False, stemmed=False)
+
+        features = [1.0, math.log1p(len(words)), math.log1p(len(task))]
+
+        hits = list(task_type_hits(task).values())
+        features.extend(min(h, 3) / 3 for h in hits)
+        features.append(0.0 if any(hits) else 1.0)
+
+        features.extend(1.0 if tier == name else 0.0 for name in TIERS)
+        features.extend(1.0 if agent_id == agent else 0.0 for agent in agents)
+        return features
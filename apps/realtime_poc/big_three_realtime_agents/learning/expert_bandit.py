@@ -0,0 +1,289 @@
+"""
+Expert bandit - Latency- and cost-aware expert selection.
+
+Per task category, each candidate expert is an arm of a Thompson-sampling
+bandit with a Beta posterior over a reward that combines success, latency
+and token cost. Exploration is capped by configuration, and every
+decision and reward is appended to a JSONL log for offline evaluation.
+Rewards carry the decision_id of the decision they score: the outcome's
+own decision_id if it has one, else the oldest open decision for the
+same category and expert.
+"""
+
+import json
+import logging
+import random
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from .task_types import infer_task_type
+
+logger = logging.getLogger(__name__)
+
+# Unrewarded decisions remembered per (category, agent) for reward matching
+MAX_OPEN_DECISIONS = 100
+
+# Latency credit for an outcome whose duration was not measured
+NEUTRAL_LATENCY_CREDIT = 0.5
+
+
+@dataclass
+class BanditConfig:
+    """
+    Expert bandit configuration.
+
+    Attributes:
+        success_weight: Reward weight of task success
+        latency_weight: Reward weight of speed (1 - duration / latency_scale)
+        cost_weight: Reward weight of cheapness (1 - cost / cost_scale)
+        latency_scale: Duration (seconds) at which the latency credit reaches 0
+        cost_scale: Token cost at which the cost credit reaches 0
+        max_exploration: Upper bound on the probability of picking an arm
+            other than the current best posterior mean (0 = always greedy)
+        prior_alpha: Beta prior successes for unseen arms
+        prior_beta: Beta prior failures for unseen arms
+        seed: Optional RNG seed (reproducible decisions)
+    """
+    success_weight: float = 1.0
+    latency_weight: float = 0.3
+    cost_weight: float = 0.2
+    latency_scale: float = 300.0
+    cost_scale: float = 50_000.0
+    max_exploration: float = 0.2
+    prior_alpha: float = 1.0
+    prior_beta: float = 1.0
+    seed: Optional[int] = None
+
+
+class ExpertBandit:
+    """
+    Contextual (per task category) Thompson-sampling expert selector.
+
+    Rewards are in [0, 1]; failures earn 0, successes earn success credit
+    plus latency and cost credit. Fractional rewards update the Beta
+    posterior as alpha += r, beta += 1 - r.
+
+    Example:
+        >>> bandit = ExpertBandit(tracker, BanditConfig(), log_file=Path("decisions.jsonl"))
+        >>> agent_id = bandit.select("Build REST API", ["backend", "fullstack"])
+    """
+
+    def __init__(
+        self,
+        outcome_tracker=None,
+        config: Optional[BanditConfig] = None,
+        log_file: Optional[Path] = None,
+    ):
+        """
+        Initialize bandit.
+
+        Replays the tracker's history into the posteriors, then learns
+        from each newly recorded outcome.
+
+        Args:
+            outcome_tracker: Optional OutcomeTracker to learn from
+            config: Bandit configuration
+            log_file: Optional JSONL file for decisions and rewards
+        """
+        self.config = config or BanditConfig()
+        self.log_file = Path(log_file) if log_file else None
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+
+        # (category, agent_id) -> [alpha, beta, pulls]
+        self._arms: Dict[Tuple[str, str], List[float]] = {}
+        # (category, agent_id) -> decision IDs awaiting a reward, oldest first
+        self._open_decisions: Dict[Tuple[str, str], deque] = {}
+
+        if outcome_tracker is not None:
+            if hasattr(outcome_tracker, "iter_outcomes"):
+                for outcome in outcome_tracker.iter_outcomes(include_pending=True):
+                    self._update_from_outcome(outcome, log=False)
+            if hasattr(outcome_tracker, "add_listener"):
+                outcome_tracker.add_listener(self._update_from_outcome)
+
+    def reward(
+        self, success: bool, duration: Optional[float] = None, cost: Optional[float] = None
+    ) -> float:
+        """
+        Scalar reward in [0, 1] for an outcome.
+
+        Args:
+            success: Whether the task succeeded
+            duration: Execution time in seconds (unknown = neutral latency credit)
+            cost: Token cost (unknown = no cost penalty)
+        """
+        if not success:
+            return 0.0
+
+        cfg = self.config
+        if duration is None:
+            latency_credit = NEUTRAL_LATENCY_CREDIT
+        else:
+            latency_credit = 1 - min(1.0, duration / cfg.latency_scale)
+        cost_credit = 1 - min(1.0, (cost or 0) / cfg.cost_scale)
+        total_weight = cfg.success_weight + cfg.latency_weight + cfg.cost_weight
+        if total_weight <= 0:
+            return 1.0
+
+        return (
+            cfg.success_weight
+            + cfg.latency_weight * latency_credit
+            + cfg.cost_weight * cost_credit
+        ) / total_weight
+
+    def select(self, task: str, candidates: List[str], category: Optional[str] = None) -> Optional[str]:
+        """
+        Choose an expert for task by Thompson sampling.
+
+        Args:
+            task: Task description
+            candidates: Candidate agent IDs
+            category: Task category (inferred from task if omitted)
+
+        Returns:
+            Chosen agent ID (None if no candidates)
+        """
+        if not candidates:
+            return None
+
+        category = category or infer_task_type(task)
+
+        with self._lock:
+            posteriors = {agent: self._posterior(category, agent) for agent in candidates}
+            samples = {
+                agent: self._rng.betavariate(alpha, beta)
+                for agent, (alpha, beta) in posteriors.items()
+            }
+            means = {
+                agent: alpha / (alpha + beta) for agent, (alpha, beta) in posteriors.items()
+            }
+
+            greedy = max(candidates, key=lambda agent: (means[agent], -candidates.index(agent)))
+            sampled = max(candidates, key=lambda agent: samples[agent])
+
+            # Cap exploration: keep a non-greedy sample only with max_exploration probability
+            chosen = sampled
+            if sampled != greedy and self._rng.random() >= self.config.max_exploration:
+                chosen = greedy
+
+            decision_id = f"dec_{uuid.uuid4().hex[:10]}"
+            self._open_decisions.setdefault(
+                (category, chosen), deque(maxlen=MAX_OPEN_DECISIONS)
+            ).append(decision_id)
+
+        self._log({
+            "event": "decision",
+            "decision_id": decision_id,
+            "task": task[:200],
+            "category": category,
+            "candidates": list(candidates),
+            "posterior_means": means,
+            "samples": samples,
+            "greedy": greedy,
+            "chosen": chosen,
+            "explored": chosen != greedy,
+        })
+
+        logger.info(
+            f"Bandit chose {chosen} for '{category}' "
+            f"(greedy: {greedy}, mean: {means[chosen]:.2f})"
+        )
+        return chosen
+
+    def update(
+        self,
+        category: str,
+        agent_id: str,
+        success: bool,
+        duration: Optional[float] = None,
+        cost: Optional[float] = None,
+    ) -> float:
+        """
+        Update an arm's posterior with an observed outcome.
+
+        Returns:
+            Reward applied
+        """
+        reward = self.reward(success, duration, cost)
+
+        with self._lock:
+            arm = self._arms.setdefault(
+                (category, agent_id),
+                [self.config.prior_alpha, self.config.prior_beta, 0],
+            )
+            arm[0] += reward
+            arm[1] += 1 - reward
+            arm[2] += 1
+
+        return reward
+
+    def get_arm_stats(self, category: str) -> Dict[str, Dict[str, float]]:
+        """Posterior mean and pull count per agent for a category."""
+        with self._lock:
+            return {
+                agent: {"mean": alpha / (alpha + beta), "pulls": pulls}
+                for (arm_category, agent), (alpha, beta, pulls) in self._arms.items()
+                if arm_category == category
+            }
+
+    def _posterior(self, category: str, agent_id: str) -> Tuple[float, float]:
+        arm = self._arms.get((category, agent_id))
+        if arm is None:
+            return self.config.prior_alpha, self.config.prior_beta
+        return arm[0], arm[1]
+
+    def _update_from_outcome(self, outcome: Dict[str, Any], log: bool = True) -> None:
+        """Fold a tracker outcome record into the posteriors."""
+        category = outcome.get("task_type") or infer_task_type(outcome.get("task", ""))
+        agent_id = outcome.get("agent_id", "unknown")
+        success = outcome.get("status") == "success"
+        metadata = outcome.get("metadata") or {}
+        cost = outcome.get("cost", metadata.get("tokens_used"))
+
+        reward = self.update(category, agent_id, success, outcome.get("duration"), cost)
+
+        if log:
+            decision_id = outcome.get("decision_id", metadata.get("decision_id"))
+            self._log({
+                "event": "reward",
+                "decision_id": self._close_decision(category, agent_id, decision_id),
+                "category": category,
+                "agent_id": agent_id,
+                "success": success,
+                "duration": outcome.get("duration"),
+                "cost": cost,
+                "reward": reward,
+            })
+
+    def _close_decision(
+        self, category: str, agent_id: str, decision_id: Optional[str]
+    ) -> Optional[str]:
+        """Remove and return the decision a reward scores (None if not from select)."""
+        with self._lock:
+            open_decisions = self._open_decisions.get((category, agent_id))
+            if not open_decisions:
+                return decision_id
+            if decision_id is None:
+                return open_decisions.popleft()
+            if decision_id in open_decisions:
+                open_decisions.remove(decision_id)
+            return decision_id
+
+    def _log(self, record: Dict[str, Any]) -> None:
+        """Append a decision/reward record for offline evaluation."""
+        if not self.log_file:
+            return
+
+        record = {"timestamp": datetime.now().isoformat(), **record}
+        try:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except Exception as exc:
+            logger.error(f"Failed to log bandit record: {exc}")
@@ -11,6 +11,9 @@ from pathlib import Path
 
 from .outcome_tracker import OutcomeTracker
 from .pattern_analyzer import PatternAnalyzer
+from .expert_bandit import ExpertBandit, BanditConfig
+from .duration_predictor import DurationPredictor, collect_training_samples
+from .task_types import infer_task_type
 
 logger = logging.getLogger(__name__)
 
@@ -28,18 +31,29 @@ class LearningManager:
         >>> recommendations = learning.get_recommendations(new_task)
     """
 
-    def __init__(self, storage_dir: Path):
+    def __init__(self, storage_dir: Path, bandit_config: Optional[BanditConfig] = None):
         """
         Initialize learning manager.
 
         Args:
             storage_dir: Directory for learning data storage
+            bandit_config: Enables latency/cost-aware bandit selection among
+                candidate agents (decisions logged to bandit_decisions.jsonl)
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         self.tracker = OutcomeTracker(self.storage_dir)
         self.analyzer = PatternAnalyzer(self.tracker)
+        self.bandit = (
+            ExpertBandit(
+                self.tracker,
+                bandit_config,
+                log_file=self.storage_dir / "bandit_decisions.jsonl",
+            )
+            if bandit_config
+            else None
+        )
 
         self.logger = logger
         self.logger.info("Learning manager initialized")
@@ -114,49 +128,125 @@ class LearningManager:
 
         return recommendations
 
+    def train_duration_predictor(
+        self, workflow_memory=None, tier_lookup=None
+    ) -> DurationPredictor:
+        """
+        Fit the task duration model offline and save it (duration_model.json).
+
+        Args:
+            workflow_memory: Optional WorkflowMemory with task durations
+            tier_lookup: Optional agent_id -> tier function
+
+        Returns:
+            Fitted (or, with too little history, untrained) DurationPredictor
+        """
+        self.tracker.flush()
+        samples = collect_training_samples(self.tracker, workflow_memory, tier_lookup)
+
+        predictor = DurationPredictor()
+        if predictor.fit(samples):
+            predictor.save(self.storage_dir / "duration_model.json")
+        return predictor
+
     def get_learning_stats(self) -> Dict[str, Any]:
         """Get learning system statistics."""
         patterns = self.analyzer.analyze_agent_task_patterns()
 
         return {
-            "total_outcomes": len(self.tracker._outcomes),
+            "total_outcomes": self.tracker.stats.overall.count,
+            "success_rate": self.tracker.get_success_rate(),
             "agents_tracked": len(patterns["agent_success_rates"]),
             "top_keywords": patterns["task_keywords"].most_common(10),
             "agent_performance": patterns["agent_success_rates"],
+            "agent_latency": self.tracker.duration_percentiles(by="agent"),
+            "task_type_performance": self.tracker.success_rates(by="task_type"),
         }
 
     def suggest_agent_for_task(
         self,
         task: str,
-        pool_selector
+        pool_selector=None,
+        available_agents: Optional[List[str]] = None,
     ) -> str:
         """
         Suggest best agent combining history and pool selection.
 
         Args:
             task: Task description
-            pool_selector: IntelligentAgentSelector instance
+            pool_selector: Optional IntelligentAgentSelector instance
+            available_agents: Optional candidate agent IDs, ranked by their
+                success on this task type (O(1) stats lookups per candidate)
 
         Returns:
             Recommended agent ID
         """
+        # Bandit trades off success, latency and cost among candidates
+        if self.bandit:
+            candidates = available_agents or self._pool_candidates(task, pool_selector)
+            if candidates:
+                return self.bandit.select(task, candidates)
+
         # Get historical recommendation
         best_from_history, confidence = self.analyzer.get_best_agent_for_task(task)
 
         # If high confidence from history, use it
-        if confidence > 0.7:
+        if confidence > 0.7 and (
+            not available_agents or best_from_history in available_agents
+        ):
             self.logger.info(
                 f"Using historical recommendation: {best_from_history} "
                 f"(confidence: {confidence:.2f})"
             )
             return best_from_history
 
+        # Rank candidates by per-task-type (then overall) success
+        if available_agents:
+            best_candidate = self._rank_candidates(task, available_agents)
+            if best_candidate:
+                return best_candidate
+
         # Otherwise use intelligent selection
-        best_from_pool = pool_selector.select_best_agent(task)
+        best_from_pool = pool_selector.select_best_agent(task) if pool_selector else None
 
         self.logger.info(
             f"Using pool selection: {best_from_pool} "
             f"(low historical confidence: {confidence:.2f})"
         )
 
-        return best_from_pool or best_from_history
+        if best_from_pool:
+            return best_from_pool
+        if available_agents:
+            return available_agents[0]
+        return best_from_history
+
+    def _pool_candidates(self, task: str, pool_selector) -> List[str]:
+        """Candidate agents from the pool selector (if it can list several)."""
+        if pool_selector is None or not hasattr(pool_selector, "select_multiple_agents"):
+            return []
+        try:
+            return pool_selector.select_multiple_agents(task)
+        except Exception as exc:
+            self.logger.warning(f"Pool candidate selection failed: {exc}")
+            return []
+
+    def _rank_candidates(self, task: str, available_agents: List[str]) -> Optional[str]:
+        """Best candidate by smoothed success rate, or None without history."""
+        task_type = infer_task_type(task)
+        stats = self.tracker.stats
+
+        scored = []
+        for agent_id in available_agents:
+            agent_stats = stats.agent_task_type(agent_id, task_type) or stats.agent(agent_id)
+            if agent_stats:
+                scored.append((agent_stats.smoothed_success_rate, agent_stats.count, agent_id))
+
+        if not scored:
+            return None
+
+        rate, count, agent_id = max(scored)
+        self.logger.info(
+            f"Using candidate statistics: {agent_id} "
+            f"({rate:.2f} smoothed success over {count} outcomes, type '{task_type}')"
+        )
+        return agent_id
@@ -0,0 +1,180 @@
+"""
+MinHash LSH - Approximate similar-task lookup without embeddings.
+
+Each task description is reduced to a MinHash signature over its keyword
+set; signatures are split into bands and bucketed (locality-sensitive
+hashing), so tasks whose Jaccard similarity exceeds a threshold are found
+by bucket lookups instead of scanning the history.
+"""
+
+import random
+import threading
+import zlib
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from ..text_normalization import tokenize
+
+# Large Mersenne prime for universal hashing
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_THRESHOLD = 0.3
+
+
+def shingles(text: str) -> Set[str]:
+    """Keyword set used for similarity (normalized tokens, no stop words)."""
+    return {token for token in tokenize(text) if len(token) > 1}
+
+
+def _optimal_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows == num_perm whose LSH threshold
+    (1/bands) ** (1/rows) is closest to the requested Jaccard threshold.
+    """
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with an LSH banding index.
+
+    Example:
+        >>> index = MinHashLSH(threshold=0.4)
+        >>> index.add("exec_1", "Build REST API for blog posts")
+        >>> index.query("Build blog REST API")
+        [('exec_1', 0.8)]
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        seed: int = 1,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of query results
+            num_perm: Signature length (more = more accurate, slower)
+            seed: Seed for the hash permutations (fixed for stable signatures)
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _optimal_bands(num_perm, threshold)
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], Set[Hashable]]] = [
+            {} for _ in range(self.bands)
+        ]
+        self._lock = threading.Lock()
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of text (None if it has no keywords)."""
+        tokens = shingles(text)
+        if not tokens:
+            return None
+
+        hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+        return tuple(
+            min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+    def add(self, key: Hashable, text: str) -> bool:
+        """
+        Index text under key (replacing any previous entry).
+
+        Returns:
+            False if text has no keywords (not indexed)
+        """
+        signature = self.signature(text)
+
+        with self._lock:
+            self._remove_locked(key)
+            if signature is None:
+                return False
+
+            self._signatures[key] = signature
+            for band, bucket_key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(bucket_key, set()).add(key)
+        return True
+
+    def remove(self, key: Hashable) -> None:
+        """Remove key from the index (unknown keys are ignored)."""
+        with self._lock:
+            self._remove_locked(key)
+
+    def query(
+        self, text: str, limit: Optional[int] = None, threshold: Optional[float] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Find indexed entries similar to text.
+
+        Args:
+            text: Query text
+            limit: Max results (None = all)
+            threshold: Override minimum estimated Jaccard similarity
+
+        Returns:
+            (key, estimated Jaccard similarity) pairs, most similar first
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return []
+
+        minimum = self.threshold if threshold is None else threshold
+
+        with self._lock:
+            candidates: Set[Hashable] = set()
+            for band, bucket_key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(bucket_key, ()))
+
+            scored = []
+            for key in candidates:
+                similarity = self._similarity(signature, self._signatures[key])
+                if similarity >= minimum:
+                    scored.append((key, similarity))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit] if limit is not None else scored
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield signature[band * self.rows:(band + 1) * self.rows]
+
+    def _similarity(self, first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        return sum(1 for a, b in zip(first, second) if a == b) / self.num_perm
+
+    def _remove_locked(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+
+        for band, bucket_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(bucket_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][bucket_key]
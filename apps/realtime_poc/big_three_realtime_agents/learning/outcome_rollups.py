@@ -0,0 +1,397 @@
+"""
+Outcome rollups - Time-bucketed outcome aggregates for trend queries.
+
+Each outcome is folded into an hourly and a daily bucket keyed by
+(agent, task type), holding count, successes and duration totals. Buckets
+are persisted compactly (rollups.json) together with a watermark of how
+many outcomes they cover, so restarts only fold outcomes recorded since
+the last save. Window queries ("last 24h vs previous week") read a few
+hundred buckets instead of scanning the outcome history.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+from .task_types import infer_task_type
+
+logger = logging.getLogger(__name__)
+
+ROLLUPS_VERSION = 1
+
+HOUR = "hour"
+DAY = "day"
+_BUCKET_FORMATS = {HOUR: "%Y-%m-%dT%H", DAY: "%Y-%m-%d"}
+_BUCKET_STEPS = {HOUR: timedelta(hours=1), DAY: timedelta(days=1)}
+
+# Hourly buckets older than this are pruned (daily buckets are kept)
+DEFAULT_HOURLY_RETENTION_DAYS = 30
+
+# Regression detection defaults
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_SUCCESS_DROP = 0.15
+DEFAULT_LATENCY_INCREASE = 1.5
+
+# Bucket cell: [count, successes, duration_count, duration_sum]
+_Cell = List[float]
+_SEPARATOR = "\t"
+
+
+def _floor(moment: datetime, granularity: str) -> datetime:
+    if granularity == HOUR:
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _summarize(cell: _Cell) -> Dict[str, Any]:
+    count, successes, duration_count, duration_sum = cell
+    return {
+        "total": int(count),
+        "successes": int(successes),
+        "failures": int(count - successes),
+        "success_rate": successes / count if count else 0.0,
+        "mean_duration": duration_sum / duration_count if duration_count else None,
+    }
+
+
+class OutcomeRollups:
+    """
+    Hourly and daily outcome buckets per agent and task type.
+
+    Example:
+        >>> rollups = OutcomeRollups(Path("memory/learning/rollups.json"))
+        >>> rollups.catch_up(outcomes)
+        >>> rollups.compare_windows(timedelta(hours=24), timedelta(days=7),
+        ...                         agent_id="backend-architect")
+    """
+
+    def __init__(
+        self,
+        storage_file: Optional[Path] = None,
+        hourly_retention_days: int = DEFAULT_HOURLY_RETENTION_DAYS,
+    ):
+        """
+        Initialize rollups, loading persisted buckets if present.
+
+        Args:
+            storage_file: Optional JSON file for persisted buckets
+            hourly_retention_days: Days of hourly buckets to keep
+        """
+        self.storage_file = Path(storage_file) if storage_file else None
+        self.hourly_retention = timedelta(days=hourly_retention_days)
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.watermark = 0
+        self._buckets: Dict[str, Dict[str, Dict[Tuple[str, str], _Cell]]] = {
+            HOUR: {},
+            DAY: {},
+        }
+
+        self._load()
+
+    def catch_up(self, outcomes: List[Dict[str, Any]]) -> None:
+        """
+        Fold outcomes beyond the persisted watermark.
+
+        Rebuilds from scratch if the history is shorter than the watermark
+        (e.g. the log was truncated or replaced).
+
+        Args:
+            outcomes: Full outcome history, oldest first
+        """
+        if self.watermark > len(outcomes):
+            self.logger.warning("Outcome history shorter than rollup watermark, rebuilding")
+            self.rebuild(outcomes)
+            return
+
+        for outcome in outcomes[self.watermark:]:
+            self.update(outcome)
+
+    def rebuild(self, outcomes: Iterable[Dict[str, Any]]) -> None:
+        """Reset and fold outcomes."""
+        with self._lock:
+            self._buckets = {HOUR: {}, DAY: {}}
+            self.watermark = 0
+            self._dirty = True
+        for outcome in outcomes:
+            self.update(outcome)
+
+    def update(self, outcome: Dict[str, Any]) -> None:
+        """Fold one outcome into its hourly and daily buckets."""
+        with self._lock:
+            self.watermark += 1
+            self._dirty = True
+
+            try:
+                moment = datetime.fromisoformat(outcome.get("timestamp", ""))
+            except (TypeError, ValueError):
+                return
+
+            key = (
+                outcome.get("agent_id", "unknown"),
+                outcome.get("task_type") or infer_task_type(outcome.get("task", "")),
+            )
+            success = outcome.get("status") == "success"
+            duration = outcome.get("duration")
+
+            for granularity, buckets in self._buckets.items():
+                bucket = _floor(moment, granularity).strftime(_BUCKET_FORMATS[granularity])
+                cell = buckets.setdefault(bucket, {}).setdefault(key, [0, 0, 0, 0.0])
+                cell[0] += 1
+                if success:
+                    cell[1] += 1
+                if duration:
+                    cell[2] += 1
+                    cell[3] += duration
+
+    def window_stats(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+        agent_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Aggregate outcomes in [start, end).
+
+        Resolution is one hour within the hourly retention period and one
+        day beyond it; partial buckets at the edges are included whole.
+
+        Args:
+            start: Window start
+            end: Window end (default: now)
+            agent_id: Optional agent filter
+            task_type: Optional task type filter
+
+        Returns:
+            Dict with total, successes, failures, success_rate, mean_duration
+        """
+        end = end or datetime.now()
+        granularity = HOUR if start >= datetime.now() - self.hourly_retention else DAY
+        total: _Cell = [0, 0, 0, 0.0]
+
+        with self._lock:
+            for cell in self._cells(granularity, start, end, agent_id, task_type):
+                for i in range(4):
+                    total[i] += cell[i]
+
+        return _summarize(total)
+
+    def trend(
+        self,
+        granularity: str = DAY,
+        since: Optional[datetime] = None,
+        agent_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-bucket series for charts.
+
+        Args:
+            granularity: "hour" or "day"
+            since: Optional start (default: all buckets)
+            agent_id: Optional agent filter
+            task_type: Optional task type filter
+
+        Returns:
+            List of bucket summaries (with "bucket" label), oldest first
+        """
+        if granularity not in self._buckets:
+            raise ValueError(f"Unknown granularity: {granularity}")
+
+        floor = _floor(since, granularity).strftime(_BUCKET_FORMATS[granularity]) if since else ""
+        series = []
+        with self._lock:
+            for bucket in sorted(self._buckets[granularity]):
+                if bucket < floor:
+                    continue
+                total: _Cell = [0, 0, 0, 0.0]
+                for (agent, kind), cell in self._buckets[granularity][bucket].items():
+                    if (agent_id and agent != agent_id) or (task_type and kind != task_type):
+                        continue
+                    for i in range(4):
+                        total[i] += cell[i]
+                if total[0]:
+                    series.append({"bucket": bucket, **_summarize(total)})
+        return series
+
+    def compare_windows(
+        self,
+        current: timedelta = timedelta(hours=24),
+        baseline: timedelta = timedelta(days=7),
+        agent_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compare the most recent window against the window preceding it.
+
+        Args:
+            current: Length of the recent window (e.g. last 24h)
+            baseline: Length of the preceding window (e.g. previous week)
+            agent_id: Optional agent filter
+            task_type: Optional task type filter
+            now: Reference time (default: now)
+
+        Returns:
+            Dict with "current" and "baseline" stats, "success_rate_delta"
+            (current - baseline) and "duration_ratio" (current / baseline)
+        """
+        now = now or datetime.now()
+        split = now - current
+        current_stats = self.window_stats(split, now, agent_id, task_type)
+        baseline_stats = self.window_stats(split - baseline, split, agent_id, task_type)
+
+        duration_ratio = None
+        if current_stats["mean_duration"] and baseline_stats["mean_duration"]:
+            duration_ratio = current_stats["mean_duration"] / baseline_stats["mean_duration"]
+
+        return {
+            "current": current_stats,
+            "baseline": baseline_stats,
+            "success_rate_delta": current_stats["success_rate"] - baseline_stats["success_rate"],
+            "duration_ratio": duration_ratio,
+        }
+
+    def detect_regressions(
+        self,
+        current: timedelta = timedelta(hours=24),
+        baseline: timedelta = timedelta(days=7),
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        success_drop: float = DEFAULT_SUCCESS_DROP,
+        latency_increase: float = DEFAULT_LATENCY_INCREASE,
+        now: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find agents (per task type) whose recent window degraded.
+
+        A regression is a success rate drop of at least success_drop, or a
+        mean duration at least latency_increase times the baseline, with
+        min_samples outcomes in both windows.
+
+        Returns:
+            List of dicts with agent_id, task_type, reasons and the comparison
+        """
+        now = now or datetime.now()
+        start = now - current - baseline
+        granularity = HOUR if start >= datetime.now() - self.hourly_retention else DAY
+
+        with self._lock:
+            keys = {
+                key
+                for cells in self._range(granularity, start, now)
+                for key in cells
+            }
+
+        regressions = []
+        for agent_id, task_type in sorted(keys):
+            comparison = self.compare_windows(current, baseline, agent_id, task_type, now)
+            if min(comparison["current"]["total"], comparison["baseline"]["total"]) < min_samples:
+                continue
+
+            reasons = []
+            if comparison["success_rate_delta"] <= -success_drop:
+                reasons.append("success_rate")
+            if comparison["duration_ratio"] and comparison["duration_ratio"] >= latency_increase:
+                reasons.append("latency")
+
+            if reasons:
+                regressions.append({
+                    "agent_id": agent_id,
+                    "task_type": task_type,
+                    "reasons": reasons,
+                    **comparison,
+                })
+
+        if regressions:
+            self.logger.warning(f"Detected {len(regressions)} outcome regressions")
+        return regressions
+
+    def save(self) -> None:
+        """Persist buckets and watermark (no-op if unchanged)."""
+        if not self.storage_file:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            self._prune_locked()
+            data = {
+                "version": ROLLUPS_VERSION,
+                "watermark": self.watermark,
+                **{
+                    granularity: {
+                        bucket: {_SEPARATOR.join(key): cell for key, cell in cells.items()}
+                        for bucket, cells in buckets.items()
+                    }
+                    for granularity, buckets in self._buckets.items()
+                },
+            }
+            self._dirty = False
+
+        try:
+            tmp_file = self.storage_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(data, separators=(",", ":")))
+            tmp_file.replace(self.storage_file)
+        except Exception as exc:
+            self.logger.error(f"Failed to save outcome rollups: {exc}")
+            self._dirty = True
+
+    def _cells(
+        self,
+        granularity: str,
+        start: datetime,
+        end: datetime,
+        agent_id: Optional[str],
+        task_type: Optional[str],
+    ) -> Iterable[_Cell]:
+        for cells in self._range(granularity, start, end):
+            for (agent, kind), cell in cells.items():
+                if (agent_id and agent != agent_id) or (task_type and kind != task_type):
+                    continue
+                yield cell
+
+    def _range(self, granularity: str, start: datetime, end: datetime):
+        """Bucket cell maps whose bucket starts in [floor(start), end)."""
+        buckets = self._buckets[granularity]
+        fmt, step = _BUCKET_FORMATS[granularity], _BUCKET_STEPS[granularity]
+        moment = _floor(start, granularity)
+        while moment < end:
+            cells = buckets.get(moment.strftime(fmt))
+            if cells:
+                yield cells
+            moment += step
+
+    def _prune_locked(self) -> None:
+        cutoff = _floor(datetime.now() - self.hourly_retention, HOUR).strftime(_BUCKET_FORMATS[HOUR])
+        hourly = self._buckets[HOUR]
+        for bucket in [b for b in hourly if b < cutoff]:
+            del hourly[bucket]
+
+    def _load(self) -> None:
+        if not self.storage_file or not self.storage_file.exists():
+            return
+
+        try:
+            data = json.loads(self.storage_file.read_text())
+            if data.get("version") != ROLLUPS_VERSION:
+                self.logger.warning("Outcome rollups version changed, rebuilding")
+                return
+
+            for granularity in self._buckets:
+                self._buckets[granularity] = {
+                    bucket: {
+                        tuple(key.split(_SEPARATOR, 1)): cell for key, cell in cells.items()
+                    }
+                    for bucket, cells in data.get(granularity, {}).items()
+                }
+            self.watermark = data.get("watermark", 0)
+        except Exception as exc:
+            self.logger.error(f"Failed to load outcome rollups, rebuilding: {exc}")
+            self._buckets = {HOUR: {}, DAY: {}}
+            self.watermark = 0
@@ -0,0 +1,249 @@
+"""
+Outcome statistics - Incremental per-agent and per-task-type aggregates.
+
+Each recorded outcome is folded into running counters (count, successes,
+duration sum and sum of squares) and streaming P² percentile sketches,
+so success rates and duration percentiles are O(1) reads instead of
+scans over the outcome history.
+"""
+
+import math
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+from .task_types import infer_task_type
+
+# Duration percentiles tracked per aggregate
+TRACKED_PERCENTILES = (0.5, 0.9)
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate (P² algorithm, Jain & Chlamtac 1985).
+
+    Keeps five markers regardless of how many observations are added.
+
+    Example:
+        >>> p90 = P2Quantile(0.9)
+        >>> for duration in durations:
+        ...     p90.add(duration)
+        >>> p90.value()
+    """
+
+    def __init__(self, quantile: float):
+        """
+        Initialize estimator.
+
+        Args:
+            quantile: Target quantile in (0, 1)
+        """
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, x: float) -> None:
+        """Add an observation."""
+        self.count += 1
+
+        if self.count <= 5:
+            self._heights.append(x)
+            self._heights.sort()
+            return
+
+        heights, positions = self._heights, self._positions
+
+        # Find cell k containing x, extending extremes if needed
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if heights[i] <= x < heights[i + 1])
+
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Adjust interior markers toward their desired positions
+        for i in range(1, 4):
+            delta = self._desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or (
+                delta <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if delta > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = self._linear(i, step)
+                heights[i] = candidate
+                positions[i] += step
+
+    def value(self) -> Optional[float]:
+        """Current quantile estimate (None before any observation)."""
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            index = min(len(self._heights) - 1, int(round(self.quantile * (self.count - 1))))
+            return self._heights[index]
+        return self._heights[2]
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+
+class RunningStats:
+    """
+    Running outcome aggregate for one agent, task type or pair.
+
+    Durations are only aggregated for outcomes that report one.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.successes = 0
+        self.duration_count = 0
+        self.duration_sum = 0.0
+        self.duration_sq_sum = 0.0
+        self.last_timestamp: Optional[str] = None
+        self._percentiles = {q: P2Quantile(q) for q in TRACKED_PERCENTILES}
+
+    def update(
+        self, success: bool, duration: Optional[float] = None, timestamp: Optional[str] = None
+    ) -> None:
+        """Fold one outcome into the aggregate."""
+        self.count += 1
+        if success:
+            self.successes += 1
+        if duration:
+            self.duration_count += 1
+            self.duration_sum += duration
+            self.duration_sq_sum += duration * duration
+            for sketch in self._percentiles.values():
+                sketch.add(duration)
+        if timestamp:
+            self.last_timestamp = timestamp
+
+    @property
+    def failures(self) -> int:
+        return self.count - self.successes
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.count if self.count else 0.0
+
+    @property
+    def smoothed_success_rate(self) -> float:
+        """Laplace-smoothed success rate (0.5 with no data) for ranking."""
+        return (self.successes + 1) / (self.count + 2)
+
+    @property
+    def mean_duration(self) -> Optional[float]:
+        return self.duration_sum / self.duration_count if self.duration_count else None
+
+    @property
+    def duration_stddev(self) -> Optional[float]:
+        if self.duration_count < 2:
+            return None
+        mean = self.duration_sum / self.duration_count
+        variance = (self.duration_sq_sum - self.duration_count * mean * mean) / (
+            self.duration_count - 1
+        )
+        return math.sqrt(max(0.0, variance))
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Estimated duration percentile (only TRACKED_PERCENTILES are available)."""
+        sketch = self._percentiles.get(quantile)
+        return sketch.value() if sketch else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.count,
+            "successes": self.successes,
+            "failures": self.failures,
+            "success_rate": self.success_rate,
+            "mean_duration": self.mean_duration,
+            "duration_stddev": self.duration_stddev,
+            "p50_duration": self.percentile(0.5),
+            "p90_duration": self.percentile(0.9),
+            "last_timestamp": self.last_timestamp,
+        }
+
+
+class OutcomeStatsIndex:
+    """
+    Incremental aggregates keyed by agent, task type and (agent, task type).
+
+    Example:
+        >>> index = OutcomeStatsIndex()
+        >>> index.update(outcome)
+        >>> index.agent("backend-architect").success_rate
+        0.92
+    """
+
+    def __init__(self):
+        self.overall = RunningStats()
+        self._by_agent: Dict[str, RunningStats] = {}
+        self._by_task_type: Dict[str, RunningStats] = {}
+        self._by_agent_task_type: Dict[Tuple[str, str], RunningStats] = {}
+
+    def update(self, outcome: Dict[str, Any]) -> None:
+        """Fold an outcome record into all aggregates."""
+        agent_id = outcome.get("agent_id", "unknown")
+        task_type = outcome.get("task_type") or infer_task_type(outcome.get("task", ""))
+        success = outcome.get("status") == "success"
+        duration = outcome.get("duration")
+        timestamp = outcome.get("timestamp")
+
+        for stats in (
+            self.overall,
+            self._get_or_create(self._by_agent, agent_id),
+            self._get_or_create(self._by_task_type, task_type),
+            self._get_or_create(self._by_agent_task_type, (agent_id, task_type)),
+        ):
+            stats.update(success, duration, timestamp)
+
+    def rebuild(self, outcomes: Iterable[Dict[str, Any]]) -> None:
+        """Reset and fold outcomes (e.g. streamed from the log)."""
+        self.clear()
+        for outcome in outcomes:
+            self.update(outcome)
+
+    def clear(self) -> None:
+        self.overall = RunningStats()
+        self._by_agent.clear()
+        self._by_task_type.clear()
+        self._by_agent_task_type.clear()
+
+    def agent(self, agent_id: str) -> Optional[RunningStats]:
+        return self._by_agent.get(agent_id)
+
+    def task_type(self, task_type: str) -> Optional[RunningStats]:
+        return self._by_task_type.get(task_type)
+
+    def agent_task_type(self, agent_id: str, task_type: str) -> Optional[RunningStats]:
+        return self._by_agent_task_type.get((agent_id, task_type))
+
+    def agents(self) -> List[str]:
+        return list(self._by_agent)
+
+    def task_types(self) -> List[str]:
+        return list(self._by_task_type)
+
+    @staticmethod
+    def _get_or_create(table: Dict, key) -> RunningStats:
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = RunningStats()
+        return stats
@@ -2,16 +2,57 @@
 Outcome tracker - Record task execution results.
 
 Tracks success/failure outcomes for pattern analysis and learning.
+Outcomes are appended to a JSONL log (outcomes.jsonl) in batches, so
+recording costs O(1) I/O instead of rewriting the full history. The log
+rotates by size and is streamed line by line on load; only a bounded
+window of recent outcomes stays in memory. Per-agent and per-task-type
+statistics are maintained incrementally (see outcome_stats), as are
+hourly/daily rollups for trend queries (see outcome_rollups) and a NumPy
+column store for vectorized analytics (see columnar_outcomes).
 """
 
+import atexit
 import json
 import logging
+import threading
+import time
+import weakref
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterator, Callable, Sequence
+from datetime import datetime, timedelta
+
+from .columnar_outcomes import ColumnarOutcomes
+from .outcome_rollups import OutcomeRollups
+from .outcome_stats import OutcomeStatsIndex, RunningStats
+from .task_types import infer_task_type
 
 logger = logging.getLogger(__name__)
 
+# Rotate the active log once it grows past this size
+DEFAULT_MAX_LOG_BYTES = 10 * 1024 * 1024
+
+# Buffered outcomes are flushed when either limit is reached
+DEFAULT_FLUSH_BATCH_SIZE = 20
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+# Min seconds between rollup saves on flush (unsaved buckets are re-folded
+# from the log past the watermark on restart, so a crash loses nothing)
+DEFAULT_ROLLUP_SAVE_INTERVAL = 60.0
+
+# Most recent outcomes kept in memory (older ones are streamed from disk)
+DEFAULT_RECENT_WINDOW = 1000
+
+# Trackers still open at interpreter exit (one atexit hook for all of them)
+_open_trackers: "weakref.WeakSet[OutcomeTracker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_trackers() -> None:
+    """Don't lose buffered outcomes (or unsaved aggregates) on normal exit."""
+    for tracker in list(_open_trackers):
+        tracker.close()
+
 
 class OutcomeTracker:
     """
@@ -19,49 +60,155 @@ class OutcomeTracker:
 
     Records success/failure results for learning and pattern analysis.
 
+    Files (in storage_dir):
+        outcomes.jsonl      - active append-only log
+        outcomes.N.jsonl    - rotated segments (oldest first)
+        outcomes.json       - legacy format, migrated on first load
+        rollups.json        - hourly/daily buckets with a watermark (saved periodically)
+        columnar/           - memory-mapped outcome columns (saved on close)
+
     Example:
         >>> tracker = OutcomeTracker(storage_dir="memory/learning")
         >>> tracker.record_success("Build API", "backend-architect", result)
+        >>> tracker.flush()
     """
 
-    def __init__(self, storage_dir: Path):
+    def __init__(
+        self,
+        storage_dir: Path,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_log_bytes: int = DEFAULT_MAX_LOG_BYTES,
+        recent_window: int = DEFAULT_RECENT_WINDOW,
+        rollup_save_interval: float = DEFAULT_ROLLUP_SAVE_INTERVAL,
+    ):
         """
         Initialize outcome tracker.
 
         Args:
             storage_dir: Directory for outcome storage
+            flush_batch_size: Buffered outcomes that trigger a flush (1 = write-through)
+            flush_interval: Max seconds an outcome stays buffered (checked on record)
+            max_log_bytes: Active log size that triggers rotation
+            recent_window: Recent outcomes kept in memory
+            rollup_save_interval: Min seconds between rollup saves on flush
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self._outcomes_file = self.storage_dir / "outcomes.json"
-        self._outcomes = self._load_outcomes()
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.flush_interval = flush_interval
+        self.max_log_bytes = max_log_bytes
+        self.rollup_save_interval = rollup_save_interval
 
-    def record_success(
+        self._log_file = self.storage_dir / "outcomes.jsonl"
+        self._legacy_file = self.storage_dir / "outcomes.json"
+        self._lock = threading.RLock()
+        self._pending: List[Dict[str, Any]] = []
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._last_flush = time.monotonic()
+        self._last_rollup_save = self._last_flush
+
+        self._migrate_legacy()
+        self._recover_partial_line()
+
+        self.stats = OutcomeStatsIndex()
+        self.rollups = OutcomeRollups(self.storage_dir / "rollups.json")
+        self.columns = ColumnarOutcomes(self.storage_dir / "columnar")
+        self._recent: deque = deque(maxlen=max(1, recent_window))
+        self._count = 0
+
+        # Single streaming pass: stats fold everything, persisted aggregates
+        # only the outcomes past their watermark
+        rollups_from = self.rollups.watermark
+        columns_from = len(self.columns)
+        for outcome in self.iter_outcomes():
+            self.stats.update(outcome)
+            self._recent.append(outcome)
+            if self._count >= rollups_from:
+                self.rollups.update(outcome)
+            if self._count >= columns_from:
+                self.columns.append(outcome)
+            self._count += 1
+
+        # Log shorter than the aggregates (truncated or replaced): rebuild them
+        if rollups_from > self._count:
+            logger.warning("Outcome history shorter than rollup watermark, rebuilding")
+            self.rollups.rebuild(self.iter_outcomes())
+        if columns_from > self._count:
+            logger.warning("Outcome history shorter than columnar store, rebuilding")
+            self.columns.rebuild(self.iter_outcomes())
+
+        _open_trackers.add(self)
+
+    def record_outcome(
         self,
         task: str,
         agent_id: str,
-        result: Dict[str, Any]
-    ) -> None:
+        success: bool,
+        duration: Optional[float] = None,
+        task_type: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        cost: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
-        Record successful task execution.
+        Record a task execution outcome.
 
         Args:
             task: Task description
             agent_id: Agent that executed task
-            result: Execution result
+            success: Whether the task succeeded
+            duration: Execution time in seconds
+            task_type: Task type (inferred from task if omitted)
+            result: Execution result (stored as metadata)
+            error: Error message for failures
+            cost: Token cost of the execution
+
+        Returns:
+            The stored outcome record
         """
+        status = "success" if success else "failure"
         outcome = {
-            "outcome_id": f"success_{len(self._outcomes)}",
+            "outcome_id": f"{status}_{self._count}",
             "timestamp": datetime.now().isoformat(),
-            "status": "success",
+            "status": status,
             "task": task,
+            "task_type": task_type or infer_task_type(task),
             "agent_id": agent_id,
-            "duration": result.get("duration_seconds", 0),
-            "metadata": result,
         }
+        if duration is not None:
+            outcome["duration"] = duration
+        if result is not None:
+            outcome["metadata"] = result
+        if error is not None:
+            outcome["error"] = error
+        if cost is not None:
+            outcome["cost"] = cost
 
-        self._outcomes.append(outcome)
-        self._save_outcomes()
+        self._append(outcome)
+        return outcome
+
+    def record_success(
+        self,
+        task: str,
+        agent_id: str,
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Record successful task execution.
+
+        Args:
+            task: Task description
+            agent_id: Agent that executed task
+            result: Execution result
+        """
+        self.record_outcome(
+            task,
+            agent_id,
+            success=True,
+            duration=result.get("duration_seconds"),
+            result=result,
+        )
 
         logger.info(f"Recorded success: {agent_id} on '{task[:50]}'")
 
@@ -79,34 +226,25 @@ class OutcomeTracker:
             agent_id: Agent that attempted task
             error: Error message
         """
-        outcome = {
-            "outcome_id": f"failure_{len(self._outcomes)}",
-            "timestamp": datetime.now().isoformat(),
-            "status": "failure",
-            "task": task,
-            "agent_id": agent_id,
-            "error": error,
-        }
-
-        self._outcomes.append(outcome)
-        self._save_outcomes()
+        self.record_outcome(task, agent_id, success=False, error=error)
 
         logger.warning(f"Recorded failure: {agent_id} on '{task[:50]}': {error}")
 
     def get_outcomes_for_agent(self, agent_id: str) -> List[Dict[str, Any]]:
-        """Get all outcomes for specific agent."""
+        """Get all outcomes for specific agent (streamed from disk)."""
         return [
-            o for o in self._outcomes
+            o for o in self.iter_outcomes(include_pending=True)
             if o.get("agent_id") == agent_id
         ]
 
     def get_recent_outcomes(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get recent outcomes."""
-        return self._outcomes[-limit:] if self._outcomes else []
+        """Get recent outcomes (at most recent_window)."""
+        with self._lock:
+            return list(self._recent)[-limit:] if limit > 0 else []
 
     def get_success_rate(self, agent_id: Optional[str] = None) -> float:
         """
-        Calculate success rate.
+        Get success rate (O(1), from incremental stats).
 
         Args:
             agent_id: Optional agent filter
@@ -114,34 +252,276 @@ class OutcomeTracker:
         Returns:
             Success rate (0.0 to 1.0)
         """
-        outcomes = (
-            self.get_outcomes_for_agent(agent_id)
-            if agent_id
-            else self._outcomes
+        stats = self.stats.agent(agent_id) if agent_id else self.stats.overall
+        return stats.success_rate if stats else 0.0
+
+    def get_agent_stats(
+        self, agent_id: str, task_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get aggregate statistics for an agent.
+
+        Args:
+            agent_id: Agent ID
+            task_type: Optional task type filter
+
+        Returns:
+            Dict with total, successes, failures, success_rate and
+            duration mean/stddev/p50/p90 (zeros/None if no data)
+        """
+        stats = (
+            self.stats.agent_task_type(agent_id, task_type)
+            if task_type
+            else self.stats.agent(agent_id)
         )
+        return (stats or RunningStats()).to_dict()
+
+    def get_task_type_stats(self, task_type: str) -> Dict[str, Any]:
+        """Get aggregate statistics for a task type across agents."""
+        return (self.stats.task_type(task_type) or RunningStats()).to_dict()
 
-        if not outcomes:
-            return 0.0
+    def success_rates(
+        self,
+        by: str = "agent",
+        agent_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Group-by success rates over any filter or time range (vectorized).
+
+        Args:
+            by: "agent" or "task_type"
+            agent_id: Optional agent filter
+            task_type: Optional task type filter
+            since: Optional inclusive start time
+            until: Optional exclusive end time
+
+        Returns:
+            Dict of group -> {total, successes, success_rate}
+        """
+        mask = self.columns.mask(agent_id, task_type, since, until)
+        return self.columns.success_rates(by=by, mask=mask)
+
+    def duration_percentiles(
+        self,
+        by: str = "agent",
+        quantiles: Sequence[float] = (0.5, 0.9),
+        agent_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Group-by exact duration percentiles over any filter or time range (vectorized).
+
+        Args:
+            by: "agent" or "task_type"
+            quantiles: Quantiles in [0, 1]
+            agent_id: Optional agent filter
+            task_type: Optional task type filter
+            since: Optional inclusive start time
+            until: Optional exclusive end time
+
+        Returns:
+            Dict of group -> {"p50": ..., "p90": ..., "count": n}
+        """
+        mask = self.columns.mask(agent_id, task_type, since, until)
+        return self.columns.duration_percentiles(by=by, quantiles=quantiles, mask=mask)
+
+    def rebuild_stats(self) -> None:
+        """Rebuild incremental statistics from the persisted log."""
+        with self._lock:
+            self.flush()
+            self.stats.rebuild(self.iter_outcomes())
+            self.rollups.rebuild(self.iter_outcomes())
+            self.rollups.save()
+            self.columns.rebuild(self.iter_outcomes())
+            self.columns.save()
+        logger.info(f"Rebuilt outcome statistics ({self.stats.overall.count} outcomes)")
+
+    def compare_windows(
+        self,
+        current: timedelta = timedelta(hours=24),
+        baseline: timedelta = timedelta(days=7),
+        agent_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compare recent outcomes against the preceding window.
+
+        Args:
+            current: Recent window length (default: last 24h)
+            baseline: Preceding window length (default: previous week)
+            agent_id: Optional agent filter
+            task_type: Optional task type filter
+
+        Returns:
+            Dict with current/baseline stats, success_rate_delta and duration_ratio
+        """
+        return self.rollups.compare_windows(current, baseline, agent_id, task_type)
 
-        successes = sum(1 for o in outcomes if o["status"] == "success")
-        return successes / len(outcomes)
+    def detect_regressions(self, **kwargs) -> List[Dict[str, Any]]:
+        """Agents whose recent success rate or latency degraded (see OutcomeRollups)."""
+        return self.rollups.detect_regressions(**kwargs)
 
-    def _load_outcomes(self) -> List[Dict[str, Any]]:
-        """Load outcomes from storage."""
-        if not self._outcomes_file.exists():
-            return []
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call listener with each newly recorded outcome (for incremental consumers)."""
+        self._listeners.append(listener)
 
+    def iter_outcomes(self, include_pending: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream persisted outcomes from disk, oldest first.
+
+        Corrupt lines are skipped.
+
+        Args:
+            include_pending: Also yield buffered outcomes not yet flushed
+        """
+        for log_file in self._log_segments():
+            try:
+                with open(log_file, "r", encoding="utf-8") as f:
+                    for line_number, line in enumerate(f, start=1):
+                        if not line.strip():
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning(
+                                f"Skipping corrupt outcome at {log_file.name}:{line_number}"
+                            )
+            except OSError as exc:
+                logger.error(f"Failed to read {log_file.name}: {exc}")
+
+        if include_pending:
+            with self._lock:
+                pending = list(self._pending)
+            yield from pending
+
+    def flush(self) -> None:
+        """Write buffered outcomes to the log."""
+        with self._lock:
+            if not self._pending:
+                return
+
+            lines = "".join(json.dumps(o) + "\n" for o in self._pending)
+            try:
+                with open(self._log_file, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                self._pending.clear()
+                self._last_flush = time.monotonic()
+            except Exception as exc:
+                logger.error(f"Failed to save outcomes: {exc}")
+                return
+
+            if self._last_flush - self._last_rollup_save >= self.rollup_save_interval:
+                self.rollups.save()
+                self._last_rollup_save = self._last_flush
+            self._maybe_rotate()
+
+    def close(self) -> None:
+        """Flush buffered outcomes and save aggregates."""
+        self.flush()
+        self.rollups.save()
+        self.columns.save()
+        _open_trackers.discard(self)
+
+    def _append(self, outcome: Dict[str, Any]) -> None:
+        """Add outcome to the recent window and the write buffer."""
+        with self._lock:
+            self._recent.append(outcome)
+            self._count += 1
+            self._pending.append(outcome)
+            self.stats.update(outcome)
+            self.rollups.update(outcome)
+            self.columns.append(outcome)
+
+            for listener in self._listeners:
+                try:
+                    listener(outcome)
+                except Exception as exc:
+                    logger.error(f"Outcome listener failed: {exc}")
+
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+            if len(self._pending) >= self.flush_batch_size or due:
+                self.flush()
+
+    def _log_segments(self) -> List[Path]:
+        """Rotated segments (oldest first) followed by the active log."""
+        numbered = {}
+        for path in self.storage_dir.glob("outcomes.*.jsonl"):
+            index = path.name[len("outcomes."):-len(".jsonl")]
+            if index.isdigit():
+                numbered[int(index)] = path
+
+        segments = [numbered[index] for index in sorted(numbered)]
+        if self._log_file.exists():
+            segments.append(self._log_file)
+        return segments
+
+    def _maybe_rotate(self) -> None:
+        """Move the active log to the next numbered segment if too large."""
         try:
-            return json.loads(self._outcomes_file.read_text())
-        except Exception as exc:
-            logger.error(f"Failed to load outcomes: {exc}")
-            return []
+            if self._log_file.stat().st_size < self.max_log_bytes:
+                return
+        except FileNotFoundError:
+            return
+
+        index = len(self._log_segments())
+        rotated = self.storage_dir / f"outcomes.{index}.jsonl"
+        while rotated.exists():
+            index += 1
+            rotated = self.storage_dir / f"outcomes.{index}.jsonl"
+
+        self._log_file.replace(rotated)
+        logger.info(f"Rotated outcome log to {rotated.name}")
+
+    def _recover_partial_line(self) -> None:
+        """Truncate a trailing partial line left by a crash mid-write."""
+        if not self._log_file.exists():
+            return
+
+        try:
+            with open(self._log_file, "rb+") as f:
+                size = f.seek(0, 2)
+                if size == 0:
+                    return
+
+                f.seek(size - 1)
+                if f.read(1) == b"\n":
+                    return
+
+                # Scan back to the last complete line
+                position = size
+                while position > 0:
+                    step = min(4096, position)
+                    position -= step
+                    f.seek(position)
+                    newline = f.read(step).rfind(b"\n")
+                    if newline != -1:
+                        position += newline + 1
+                        break
+
+                f.truncate(position)
+                logger.warning(
+                    f"Recovered outcome log: dropped {size - position} bytes of partial record"
+                )
+        except OSError as exc:
+            logger.error(f"Failed to recover outcome log: {exc}")
+
+    def _migrate_legacy(self) -> None:
+        """Convert legacy outcomes.json into the JSONL log (once)."""
+        if not self._legacy_file.exists() or self._log_file.exists():
+            return
 
-    def _save_outcomes(self) -> None:
-        """Save outcomes to storage."""
         try:
-            self._outcomes_file.write_text(
-                json.dumps(self._outcomes, indent=2)
-            )
+            outcomes = json.loads(self._legacy_file.read_text())
+            with open(self._log_file, "w", encoding="utf-8") as f:
+                for outcome in outcomes:
+                    f.write(json.dumps(outcome) + "\n")
+            self._legacy_file.replace(self._legacy_file.with_suffix(".json.migrated"))
+            logger.info(f"Migrated {len(outcomes)} outcomes to {self._log_file.name}")
         except Exception as exc:
-            logger.error(f"Failed to save outcomes: {exc}")
+            logger.error(f"Failed to migrate legacy outcomes: {exc}")
@@ -2,15 +2,32 @@
 Pattern analyzer - Identify patterns in execution outcomes.
 
 Analyzes outcome history to identify successful patterns
-and failure modes.
+and failure modes. Each outcome is folded into maintained aggregates
+(keyword counts, keyword co-occurrence, per-keyword agent success with
+exponentially decayed weights) as it is recorded, so analysis reflects
+the full history at O(1) update cost instead of re-scanning a window.
+Similar tasks are looked up through a MinHash LSH index over all outcomes.
 """
 
 import logging
-from typing import Dict, Any, List, Tuple
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Iterable
 from collections import Counter
 
+from ..text_normalization import extract_keywords, phrase_key
+from .minhash_lsh import MinHashLSH, DEFAULT_THRESHOLD
+
 logger = logging.getLogger(__name__)
 
+# Number of outcomes after which an outcome's weight halves
+DEFAULT_HALF_LIFE = 500
+
+# Rescale decayed counters before the weight scale overflows
+_MAX_SCALE = 1e100
+
+# Outcome fields kept per indexed task for similar-task results
+_SIMILAR_TASK_FIELDS = ("task", "agent_id", "status", "timestamp")
+
 
 class PatternAnalyzer:
     """
@@ -23,145 +40,228 @@ class PatternAnalyzer:
         >>> patterns = analyzer.analyze_agent_task_patterns()
     """
 
-    def __init__(self, outcome_tracker):
+    def __init__(
+        self,
+        outcome_tracker,
+        half_life: float = DEFAULT_HALF_LIFE,
+        similarity_threshold: float = DEFAULT_THRESHOLD,
+    ):
         """
         Initialize pattern analyzer.
 
+        Folds existing history once, then subscribes to new outcomes.
+
         Args:
             outcome_tracker: OutcomeTracker instance
+            half_life: Outcomes after which older signals weigh half as much
+            similarity_threshold: Min Jaccard similarity for find_similar_tasks
         """
         self.tracker = outcome_tracker
         self.logger = logger
+        self.half_life = half_life
+
+        self._lock = threading.Lock()
+        self._growth = 2 ** (1 / half_life)
+        self._scale = 1.0
+        self._outcome_count = 0
+
+        # Raw (undecayed) aggregates
+        self._agent_totals: Counter = Counter()
+        self._agent_successes: Counter = Counter()
+        self._keyword_counts: Counter = Counter()
+        self._cooccurrence: Dict[str, Counter] = {}
+
+        # Decayed aggregates: keyword -> agent -> weight
+        self._keyword_agent_totals: Dict[str, Counter] = {}
+        self._keyword_agent_successes: Dict[str, Counter] = {}
+        self._agent_weighted_totals: Counter = Counter()
+        self._agent_weighted_successes: Counter = Counter()
+
+        # Similar-task lookup over the full history: outcome number -> summary
+        self._task_index = MinHashLSH(threshold=similarity_threshold)
+        self._indexed_outcomes: Dict[int, Dict[str, Any]] = {}
+
+        if hasattr(outcome_tracker, "iter_outcomes"):
+            self._fold_all(outcome_tracker.iter_outcomes(include_pending=True))
+        if hasattr(outcome_tracker, "add_listener"):
+            outcome_tracker.add_listener(self.fold_outcome)
+
+    def fold_outcome(self, outcome: Dict[str, Any]) -> None:
+        """Fold one outcome into the maintained aggregates."""
+        agent_id = outcome.get("agent_id", "unknown")
+        success = outcome.get("status") == "success"
+        keywords = set(extract_keywords(outcome.get("task", "")))
+
+        with self._lock:
+            self._outcome_count += 1
+            if self._task_index.add(self._outcome_count, outcome.get("task", "")):
+                self._indexed_outcomes[self._outcome_count] = {
+                    field: outcome.get(field) for field in _SIMILAR_TASK_FIELDS
+                }
+
+            self._scale *= self._growth
+            if self._scale > _MAX_SCALE:
+                self._rescale()
+            weight = self._scale
+
+            self._agent_totals[agent_id] += 1
+            self._agent_weighted_totals[agent_id] += weight
+            if success:
+                self._agent_successes[agent_id] += 1
+                self._agent_weighted_successes[agent_id] += weight
+
+            self._keyword_counts.update(keywords)
+            for keyword in keywords:
+                related = self._cooccurrence.setdefault(keyword, Counter())
+                related.update(k for k in keywords if k != keyword)
+
+                self._keyword_agent_totals.setdefault(keyword, Counter())[agent_id] += weight
+                if success:
+                    self._keyword_agent_successes.setdefault(keyword, Counter())[agent_id] += weight
 
     def analyze_agent_task_patterns(self) -> Dict[str, Any]:
         """
         Analyze which agents excel at which tasks.
 
         Returns:
-            Dict with agent-task patterns
+            Dict with agent-task patterns. Agent "rate" covers all history;
+            "weighted_rate" favors recent outcomes.
         """
-        outcomes = self.tracker.get_recent_outcomes(limit=100)
-
-        patterns = {
-            "agent_success_rates": {},
-            "task_keywords": Counter(),
-            "best_agents_by_keyword": {},
-        }
-
-        # Analyze success rates by agent
-        for outcome in outcomes:
-            agent_id = outcome.get("agent_id", "unknown")
-            status = outcome.get("status")
-
-            if agent_id not in patterns["agent_success_rates"]:
+        with self._lock:
+            patterns = {
+                "agent_success_rates": {},
+                "task_keywords": Counter(self._keyword_counts),
+                "best_agents_by_keyword": {},
+            }
+
+            for agent_id, total in self._agent_totals.items():
+                successes = self._agent_successes[agent_id]
+                weighted_total = self._agent_weighted_totals[agent_id]
                 patterns["agent_success_rates"][agent_id] = {
-                    "total": 0,
-                    "successes": 0,
-                    "rate": 0.0,
+                    "total": total,
+                    "successes": successes,
+                    "rate": successes / total if total > 0 else 0.0,
+                    "weighted_rate": (
+                        self._agent_weighted_successes[agent_id] / weighted_total
+                        if weighted_total > 0 else 0.0
+                    ),
                 }
 
-            patterns["agent_success_rates"][agent_id]["total"] += 1
-            if status == "success":
-                patterns["agent_success_rates"][agent_id]["successes"] += 1
-
-            # Extract task keywords
-            task = outcome.get("task", "").lower()
-            keywords = self._extract_keywords(task)
-            patterns["task_keywords"].update(keywords)
-
-        # Calculate success rates
-        for agent_id, stats in patterns["agent_success_rates"].items():
-            stats["rate"] = (
-                stats["successes"] / stats["total"]
-                if stats["total"] > 0 else 0.0
-            )
+            for keyword, _ in self._keyword_counts.most_common(50):
+                best = self._best_agents_locked([keyword])
+                if best:
+                    agent_id, successes, total = best[0]
+                    patterns["best_agents_by_keyword"][keyword] = {
+                        "agent_id": agent_id,
+                        "rate": successes / total if total > 0 else 0.0,
+                    }
 
         self.logger.info(
-            f"Analyzed {len(outcomes)} outcomes, "
+            f"Analyzed {self._outcome_count} outcomes, "
             f"{len(patterns['agent_success_rates'])} agents"
         )
 
         return patterns
 
+    def get_related_keywords(self, keyword: str, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        Keywords that most often appear in the same tasks as keyword.
+
+        Args:
+            keyword: Keyword
+            limit: Max results
+
+        Returns:
+            List of (keyword, co-occurrence count)
+        """
+        with self._lock:
+            related = self._cooccurrence.get(phrase_key(keyword))
+            return related.most_common(limit) if related else []
+
     def find_similar_tasks(
         self,
         task: str,
-        limit: int = 5
+        limit: int = 5,
+        threshold: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Find similar previously executed tasks.
+        Find similar previously executed tasks across the full history.
+
+        Uses MinHash LSH (approximate Jaccard similarity of task keywords),
+        so lookup cost does not grow with a scan of the history.
 
         Args:
             task: Task description
             limit: Max results
+            threshold: Override minimum Jaccard similarity
 
         Returns:
-            List of similar task outcomes
+            List of similar task summaries (task, agent_id, status,
+            timestamp), most similar (then most recent) first
         """
-        task_keywords = set(self._extract_keywords(task.lower()))
-        outcomes = self.tracker.get_recent_outcomes(limit=50)
-
-        # Score by keyword overlap
-        scored = []
-        for outcome in outcomes:
-            outcome_task = outcome.get("task", "").lower()
-            outcome_keywords = set(self._extract_keywords(outcome_task))
+        matches = self._task_index.query(task, threshold=threshold)
+        matches.sort(key=lambda item: (item[1], item[0]), reverse=True)
 
-            overlap = len(task_keywords & outcome_keywords)
-            if overlap > 0:
-                scored.append((outcome, overlap))
-
-        # Sort by relevance
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        return [outcome for outcome, _ in scored[:limit]]
+        with self._lock:
+            return [self._indexed_outcomes[key] for key, _ in matches[:limit]]
 
     def get_best_agent_for_task(self, task: str) -> Tuple[str, float]:
         """
         Get best performing agent for task type.
 
+        Uses decayed per-keyword agent outcomes over the full history.
+
         Args:
             task: Task description
 
         Returns:
-            Tuple of (agent_id, confidence_score)
+            Tuple of (agent_id, confidence_score): confidence is the best
+            agent's share of successful outcomes among similar tasks
         """
-        similar_tasks = self.find_similar_tasks(task, limit=10)
-
-        if not similar_tasks:
-            return ("unknown", 0.0)
+        keywords = set(extract_keywords(task))
 
-        # Count successful agents
-        agent_successes = Counter()
-        agent_totals = Counter()
+        with self._lock:
+            ranked = self._best_agents_locked(keywords)
+            if not ranked:
+                return ("unknown", 0.0)
 
-        for outcome in similar_tasks:
-            if outcome.get("status") == "success":
-                agent_id = outcome.get("agent_id")
-                agent_successes[agent_id] += 1
-                agent_totals[agent_id] += 1
+            total_weight = sum(
+                sum(self._keyword_agent_totals.get(k, Counter()).values())
+                for k in keywords
+            )
+            best_agent, successes, _ = ranked[0]
 
-        if not agent_successes:
+        if successes <= 0 or total_weight <= 0:
             return ("unknown", 0.0)
 
-        # Best agent
-        best_agent = agent_successes.most_common(1)[0][0]
-        confidence = agent_successes[best_agent] / len(similar_tasks)
-
-        return (best_agent, confidence)
+        return (best_agent, successes / total_weight)
 
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract meaningful keywords from text."""
-        # Remove common words
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at",
-            "to", "for", "of", "with", "by", "from", "as", "is", "was"
-        }
+    def _best_agents_locked(self, keywords: Iterable[str]) -> List[Tuple[str, float, float]]:
+        """Agents ranked by decayed successes on keywords: (agent, successes, total)."""
+        successes: Counter = Counter()
+        totals: Counter = Counter()
+        for keyword in keywords:
+            successes.update(self._keyword_agent_successes.get(keyword, {}))
+            totals.update(self._keyword_agent_totals.get(keyword, {}))
 
-        words = text.lower().split()
-        keywords = [
-            w for w in words
-            if len(w) > 3 and w not in stop_words
-        ]
+        return sorted(
+            ((agent, successes[agent], totals[agent]) for agent in totals),
+            key=lambda item: (item[1], -item[2]),
+            reverse=True,
+        )
 
-        return keywords[:10]  # Top 10 keywords
+    def _fold_all(self, outcomes: Iterable[Dict[str, Any]]) -> None:
+        for outcome in outcomes:
+            self.fold_outcome(outcome)
+
+    def _rescale(self) -> None:
+        """Divide decayed counters by the current scale to avoid overflow."""
+        factor = self._scale
+        for table in (self._keyword_agent_totals, self._keyword_agent_successes):
+            for counter in table.values():
+                for key in counter:
+                    counter[key] /= factor
+        for counter in (self._agent_weighted_totals, self._agent_weighted_successes):
+            for key in counter:
+                counter[key] /= factor
+        self._scale = 1.0
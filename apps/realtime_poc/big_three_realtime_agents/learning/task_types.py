@@ -0,0 +1,60 @@
+"""
+Task types - Coarse task categorization for outcome statistics.
+
+Maps free-text task descriptions onto a small set of task types so
+outcomes can be aggregated per (agent, task type).
+"""
+
+from typing import Dict, FrozenSet, List
+
+from ..text_normalization import tokenize, normalize_all
+
+# Task type -> indicative keywords (matched on word boundaries)
+TASK_TYPE_KEYWORDS: Dict[str, List[str]] = {
+    "backend": ["backend", "api", "endpoint", "server", "database", "fastapi", "django", "sql"],
+    "frontend": ["frontend", "ui", "react", "vue", "component", "page", "css", "layout"],
+    "devops": ["deploy", "docker", "kubernetes", "ci", "cd", "pipeline", "infrastructure"],
+    "security": ["security", "auth", "authentication", "vulnerability", "penetration", "audit"],
+    "data": ["data", "ml", "model", "training", "dataset", "analytics", "etl"],
+    "testing": ["test", "tests", "testing", "qa", "coverage", "e2e"],
+    "debugging": ["debug", "bug", "fix", "error", "crash", "issue"],
+    "documentation": ["docs", "documentation", "readme", "document", "guide"],
+}
+
+DEFAULT_TASK_TYPE = "general"
+
+# Keywords in the same normalized (stemmed) form as task tokens
+_NORMALIZED_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    task_type: normalize_all(keywords) for task_type, keywords in TASK_TYPE_KEYWORDS.items()
+}
+
+
+def task_type_hits(task: str) -> Dict[str, int]:
+    """Keyword hits per task type for a task description."""
+    words = tokenize(task)
+    return {
+        task_type: sum(1 for word in words if word in keywords)
+        for task_type, keywords in _NORMALIZED_KEYWORDS.items()
+    }
+
+
+def infer_task_type(task: str) -> str:
+    """
+    Infer task type from a task description.
+
+    Args:
+        task: Task description
+
+    Returns:
+        Task type with the most keyword hits ("general" if none)
+
+    Example:
+        >>> infer_task_type("Increase test coverage")
+        'testing'
+    """
+    best_type, best_hits = DEFAULT_TASK_TYPE, 0
+    for task_type, hits in task_type_hits(task).items():
+        if hits > best_hits:
+            best_type, best_hits = task_type, hits
+
+    return best_type
@@ -0,0 +1,90 @@
+"""
+Offline duration model training.
+
+Fits the DurationPredictor from the stored outcome history and workflow
+executions, and saves it as duration_model.json next to the outcomes, where
+OrchestratorIntegration loads it for the workflow planner.
+
+Usage:
+    python -m apps.realtime_poc.big_three_realtime_agents.learning.train_duration_model \\
+        --storage-dir apps/content-gen/storage
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Callable, Optional, Any
+
+from ..memory.workflow_memory import WorkflowMemory
+from .duration_predictor import DurationPredictor
+from .learning_manager import LearningManager
+
+logger = logging.getLogger(__name__)
+
+
+def train_duration_model(
+    storage_dir: Path,
+    tier_lookup: Optional[Callable[[str], Any]] = None,
+) -> DurationPredictor:
+    """
+    Train and save the duration model for an orchestrator storage directory.
+
+    Args:
+        storage_dir: Orchestrator storage directory (with learning/ and memory/)
+        tier_lookup: Optional agent_id -> tier function
+
+    Returns:
+        Fitted (or, with too little history, untrained) DurationPredictor
+    """
+    storage_dir = Path(storage_dir)
+    learning = LearningManager(storage_dir=storage_dir / "learning")
+    try:
+        return learning.train_duration_predictor(
+            workflow_memory=WorkflowMemory(storage_dir / "memory" / "workflows"),
+            tier_lookup=tier_lookup,
+        )
+    finally:
+        learning.tracker.close()
+
+
+def _pool_tier_lookup() -> Callable[[str], Any]:
+    """Expert tier lookup from the agent pool definitions."""
+    from ..agents.pool.agent_pool import AgentPoolManager
+
+    definitions = AgentPoolManager().expert_definitions
+    return lambda agent_id: getattr(definitions.get(agent_id), "tier", None)
+
+
+def main(argv=None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Train the task duration model from stored outcome history.",
+    )
+    parser.add_argument(
+        "--storage-dir",
+        type=Path,
+        default=Path("apps/content-gen/storage"),
+        help="Orchestrator storage directory (default: apps/content-gen/storage)",
+    )
+    parser.add_argument(
+        "--no-tiers",
+        action="store_true",
+        help="Don't load the agent pool for expert tier features",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    tier_lookup = None if args.no_tiers else _pool_tier_lookup()
+    predictor = train_duration_model(args.storage_dir, tier_lookup=tier_lookup)
+
+    if not predictor.is_trained:
+        print("Not enough duration history to train a model")
+        return 1
+
+    model_file = args.storage_dir / "learning" / "duration_model.json"
+    print(f"Trained on {predictor.sample_count} samples, saved to {model_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
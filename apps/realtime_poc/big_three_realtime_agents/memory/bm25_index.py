@@ -0,0 +1,195 @@
+"""
+BM25 index - Lexical code search alongside the vector index.
+
+Dense embeddings are weak at exact identifiers (function names, error
+codes, config keys). This index tokenizes identifiers into the full name
+plus its snake_case/camelCase parts, so "get_user_by_id", "getUserById"
+and "user id" all match the same chunk.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+")
+_CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# Reciprocal rank fusion constant (Cormack et al.)
+RRF_K = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search terms.
+
+    Each identifier yields itself plus its snake_case and camelCase parts:
+    "parseHTTPResponse" -> ["parsehttpresponse", "parse", "http", "response"].
+
+    Args:
+        text: Source code or query text
+
+    Returns:
+        Terms (with repetition, for term frequencies)
+    """
+    terms = []
+    for identifier in _IDENTIFIER_PATTERN.findall(text):
+        lowered = identifier.lower()
+        terms.append(lowered)
+
+        parts = [
+            part.lower()
+            for piece in identifier.split("_") if piece
+            for part in _CAMEL_PATTERN.findall(piece)
+        ]
+        if len(parts) > 1:
+            terms.extend(parts)
+    return terms
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, List[str]],
+    weights: Optional[Dict[str, float]] = None,
+    k: int = RRF_K,
+) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked ID lists with weighted reciprocal rank fusion.
+
+    Args:
+        rankings: Source name -> IDs, best first
+        weights: Source name -> weight (default 1.0)
+        k: RRF smoothing constant
+
+    Returns:
+        (id, fused score) pairs, best first
+    """
+    weights = weights or {}
+    fused: Dict[str, float] = {}
+
+    for source, ids in rankings.items():
+        weight = weights.get(source, 1.0)
+        for rank, item_id in enumerate(ids, start=1):
+            fused[item_id] = fused.get(item_id, 0.0) + weight / (k + rank)
+
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+class BM25Index:
+    """
+    In-memory Okapi BM25 inverted index.
+
+    Stores each entry's document and metadata so lexical-only hits can be
+    returned without a vector store lookup.
+
+    Example:
+        >>> index = BM25Index()
+        >>> index.add("auth.py:1-4", "def login(user): ...", {"path": "auth.py"})
+        >>> index.search("login", limit=5)
+        [('auth.py:1-4', 0.98)]
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize BM25 index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._entries: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def add(self, doc_id: str, document: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Add or replace an entry (path and symbol metadata are indexed too)."""
+        metadata = metadata or {}
+        text = f"{metadata.get('path', '')} {metadata.get('symbol', '')} {document}"
+        term_counts = Counter(tokenize(text))
+
+        with self._lock:
+            self._remove_locked(doc_id)
+            for term, count in term_counts.items():
+                self._postings.setdefault(term, {})[doc_id] = count
+            length = sum(term_counts.values())
+            self._doc_lengths[doc_id] = length
+            self._doc_terms[doc_id] = list(term_counts)
+            self._total_length += length
+            self._entries[doc_id] = (document, metadata)
+
+    def remove(self, doc_id: str) -> None:
+        """Remove an entry (unknown IDs are ignored)."""
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._postings.clear()
+            self._doc_lengths.clear()
+            self._doc_terms.clear()
+            self._entries.clear()
+            self._total_length = 0
+
+    def get(self, doc_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Get (document, metadata) for an entry."""
+        with self._lock:
+            return self._entries.get(doc_id)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Rank entries by BM25 score.
+
+        Args:
+            query: Query text
+            limit: Maximum results
+
+        Returns:
+            (doc_id, score) pairs with score > 0, best first
+        """
+        terms = set(tokenize(query))
+
+        with self._lock:
+            total_docs = len(self._doc_lengths)
+            if not terms or total_docs == 0:
+                return []
+
+            avg_length = self._total_length / total_docs
+            scores: Dict[str, float] = {}
+
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+
+                df = len(postings)
+                idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+                for doc_id, tf in postings.items():
+                    norm = 1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                        tf * (self.k1 + 1) / (tf + self.k1 * norm)
+                    )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def _remove_locked(self, doc_id: str) -> None:
+        length = self._doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+
+        self._total_length -= length
+        self._entries.pop(doc_id, None)
+        for term in self._doc_terms.pop(doc_id, []):
+            del self._postings[term][doc_id]
+            if not self._postings[term]:
+                del self._postings[term]
@@ -0,0 +1,192 @@
+"""
+Code chunker - Split source files into retrievable chunks.
+
+Python files are split by module/class/function using the stdlib ast
+module; other languages (and unparsable Python) fall back to
+overlapping line windows.
+"""
+
+import ast
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Chunks longer than this are split into windows
+MAX_CHUNK_LINES = 120
+
+# Fallback window size and overlap (lines)
+WINDOW_LINES = 60
+WINDOW_OVERLAP = 10
+
+MODULE_SYMBOL = "<module>"
+
+
+@dataclass
+class CodeChunk:
+    """
+    Retrievable piece of a source file.
+
+    Attributes:
+        chunk_id: Unique ID ("path:start-end")
+        path: Relative file path
+        content: Chunk source text
+        symbol: Qualified symbol name ("Class.method", "<module>", "" for windows)
+        kind: "module", "class", "function", "method" or "window"
+        start_line: First line (1-based, inclusive)
+        end_line: Last line (1-based, inclusive)
+    """
+    chunk_id: str
+    path: str
+    content: str
+    symbol: str
+    kind: str
+    start_line: int
+    end_line: int
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Scalar metadata for vector store."""
+        return {
+            "path": self.path,
+            "symbol": self.symbol,
+            "kind": self.kind,
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+        }
+
+
+def chunk_file(
+    path: str,
+    content: str,
+    max_lines: int = MAX_CHUNK_LINES,
+    window_lines: int = WINDOW_LINES,
+    overlap: int = WINDOW_OVERLAP,
+) -> List[CodeChunk]:
+    """
+    Split a source file into chunks.
+
+    Args:
+        path: Relative file path (used for IDs and language detection)
+        content: File content
+        max_lines: Maximum lines per symbol chunk before windowing
+        window_lines: Window size for fallback chunking
+        overlap: Overlap between consecutive windows
+
+    Returns:
+        Chunks ordered by start line
+    """
+    if not content.strip():
+        return []
+
+    if path.endswith(".py"):
+        try:
+            return _chunk_python(path, content, max_lines, overlap)
+        except SyntaxError as exc:
+            logger.debug(f"AST parse failed for {path}, using line windows: {exc}")
+
+    lines = content.splitlines()
+    return _windows(path, lines, 1, len(lines), "", "window", window_lines, overlap)
+
+
+def _chunk_python(
+    path: str, content: str, max_lines: int, overlap: int
+) -> List[CodeChunk]:
+    """Chunk Python source by top-level functions, classes and methods."""
+    tree = ast.parse(content)
+    lines = content.splitlines()
+
+    # (start, end, symbol, kind) spans of symbol chunks
+    spans: List[Tuple[int, int, str, str]] = []
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            spans.append((_node_start(node), node.end_lineno, node.name, "function"))
+        elif isinstance(node, ast.ClassDef):
+            spans.extend(_class_spans(node))
+
+    # Everything not covered by a symbol span belongs to the module chunk(s)
+    covered = set()
+    for start, end, _, _ in spans:
+        covered.update(range(start, end + 1))
+
+    run_start = None
+    for lineno in range(1, len(lines) + 2):
+        uncovered = lineno <= len(lines) and lineno not in covered
+        if uncovered and run_start is None:
+            run_start = lineno
+        elif not uncovered and run_start is not None:
+            run_end = lineno - 1
+            if any(lines[i - 1].strip() for i in range(run_start, run_end + 1)):
+                spans.append((run_start, run_end, MODULE_SYMBOL, "module"))
+            run_start = None
+
+    chunks: List[CodeChunk] = []
+    for start, end, symbol, kind in sorted(spans):
+        chunks.extend(_windows(path, lines, start, end, symbol, kind, max_lines, overlap))
+    return chunks
+
+
+def _class_spans(node: ast.ClassDef) -> List[Tuple[int, int, str, str]]:
+    """Class header span plus one span per method."""
+    methods = [
+        item for item in node.body
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    start = _node_start(node)
+
+    if not methods:
+        return [(start, node.end_lineno, node.name, "class")]
+
+    spans = []
+    header_end = _node_start(methods[0]) - 1
+    if header_end >= start:
+        spans.append((start, header_end, node.name, "class"))
+
+    for method in methods:
+        spans.append((
+            _node_start(method),
+            method.end_lineno,
+            f"{node.name}.{method.name}",
+            "method",
+        ))
+    return spans
+
+
+def _node_start(node: ast.AST) -> int:
+    """First line of node including decorators."""
+    decorators = getattr(node, "decorator_list", [])
+    return min([node.lineno] + [d.lineno for d in decorators])
+
+
+def _windows(
+    path: str,
+    lines: List[str],
+    start: int,
+    end: int,
+    symbol: str,
+    kind: str,
+    size: int,
+    overlap: int,
+) -> List[CodeChunk]:
+    """Split line range [start, end] into overlapping windows of at most size lines."""
+    step = max(1, size - overlap)
+    chunks = []
+
+    window_start = start
+    while window_start <= end:
+        window_end = min(end, window_start + size - 1)
+        chunks.append(CodeChunk(
+            chunk_id=f"{path}:{window_start}-{window_end}",
+            path=path,
+            content="\n".join(lines[window_start - 1:window_end]),
+            symbol=symbol,
+            kind=kind,
+            start_line=window_start,
+            end_line=window_end,
+        ))
+        if window_end == end:
+            break
+        window_start += step
+
+    return chunks
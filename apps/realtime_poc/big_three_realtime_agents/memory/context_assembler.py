@@ -0,0 +1,275 @@
+"""
+Context assembler - Fit retrieved context into a prompt token budget.
+
+Retrieved snippets are deduplicated, overlapping or adjacent chunks of the
+same file are merged, and the result is ordered by maximal marginal
+relevance (MMR) so the budget is spent on relevant and diverse context.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Section headings per source, in output order
+SOURCE_HEADINGS = {
+    "code": "Relevant Code",
+    "experience": "Similar Past Experiences",
+    "pattern": "Learned Patterns",
+}
+
+# Default MMR trade-off (1.0 = relevance only, 0.0 = diversity only)
+DEFAULT_MMR_LAMBDA = 0.7
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token)."""
+    return _chars_to_tokens(len(text))
+
+
+def _chars_to_tokens(chars: int) -> int:
+    return (chars + 3) // 4
+
+
+@dataclass
+class ContextItem:
+    """
+    One retrieved piece of context.
+
+    Attributes:
+        source: "code", "experience" or "pattern"
+        text: Text placed in the prompt
+        score: Relevance score (higher is better, comparable within a source)
+        path: File path (code only)
+        start_line: First line (code only)
+        end_line: Last line (code only)
+        symbol: Symbol name (code only)
+        data: Original search result
+    """
+    source: str
+    text: str
+    score: float
+    path: Optional[str] = None
+    start_line: Optional[int] = None
+    end_line: Optional[int] = None
+    symbol: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.render())
+
+    def render(self) -> str:
+        """Render item as a prompt line/block."""
+        if self.source != "code":
+            return f"- {self.text}"
+
+        location = self.path or ""
+        if self.start_line:
+            location += f":{self.start_line}-{self.end_line or self.start_line}"
+        if self.symbol:
+            location += f" ({self.symbol})"
+        return f"- {location}:\n{self.text}"
+
+
+@dataclass
+class AssembledContext:
+    """
+    Context selected within a token budget.
+
+    Attributes:
+        items: Selected items in MMR order
+        token_budget: Budget the items had to fit in
+        tokens_used: Estimated tokens of the rendered text
+        dropped: Number of (merged) candidates that did not fit
+    """
+    items: List[ContextItem]
+    token_budget: int
+    tokens_used: int
+    dropped: int = 0
+
+    def by_source(self, source: str) -> List[ContextItem]:
+        return [item for item in self.items if item.source == source]
+
+    def to_text(self) -> str:
+        """Render selected items grouped under per-source headings."""
+        sections = []
+        for source, heading in SOURCE_HEADINGS.items():
+            items = self.by_source(source)
+            if items:
+                sections.append(f"{heading}:\n" + "\n".join(item.render() for item in items))
+        return "\n\n".join(sections)
+
+
+class ContextAssembler:
+    """
+    Token-budgeted context assembly.
+
+    Example:
+        >>> assembler = ContextAssembler(token_budget=1500)
+        >>> assembled = assembler.assemble(items)
+        >>> prompt += assembled.to_text()
+        >>> assembled.tokens_used
+        1432
+    """
+
+    def __init__(self, token_budget: int = 2000, mmr_lambda: float = DEFAULT_MMR_LAMBDA):
+        """
+        Initialize assembler.
+
+        Args:
+            token_budget: Default token budget
+            mmr_lambda: Relevance/diversity trade-off for MMR ordering
+        """
+        self.token_budget = token_budget
+        self.mmr_lambda = mmr_lambda
+
+    def assemble(
+        self, items: List[ContextItem], token_budget: Optional[int] = None
+    ) -> AssembledContext:
+        """
+        Deduplicate, merge, order and budget context items.
+
+        Args:
+            items: Candidate items from all sources
+            token_budget: Override default budget
+
+        Returns:
+            AssembledContext with the selected items
+        """
+        budget = self.token_budget if token_budget is None else token_budget
+
+        candidates = self._merge_code_chunks(self._deduplicate(items))
+        ordered = self._mmr_order(candidates)
+
+        selected = []
+        used_chars = 0
+        sections: set = set()
+        for item in ordered:
+            # Characters the item adds to to_text(), heading and separators included
+            cost = len(item.render())
+            if item.source in sections:
+                cost += 1
+            else:
+                cost += len(SOURCE_HEADINGS.get(item.source, item.source)) + 2
+                if sections:
+                    cost += 2
+            if _chars_to_tokens(used_chars + cost) > budget:
+                continue
+            selected.append(item)
+            sections.add(item.source)
+            used_chars += cost
+
+        assembled = AssembledContext(
+            items=selected,
+            token_budget=budget,
+            tokens_used=0,
+            dropped=len(ordered) - len(selected),
+        )
+        assembled.tokens_used = estimate_tokens(assembled.to_text())
+
+        logger.debug(
+            f"Assembled {len(selected)}/{len(items)} context items, "
+            f"{assembled.tokens_used}/{budget} tokens"
+        )
+        return assembled
+
+    def _deduplicate(self, items: List[ContextItem]) -> List[ContextItem]:
+        """Drop items whose normalized text was already seen (keep best score)."""
+        best: Dict[tuple, ContextItem] = {}
+        for item in items:
+            key = (item.source, " ".join(item.text.split()))
+            if key not in best or item.score > best[key].score:
+                best[key] = item
+        return list(best.values())
+
+    def _merge_code_chunks(self, items: List[ContextItem]) -> List[ContextItem]:
+        """Merge overlapping or adjacent code chunks of the same file."""
+        others: List[ContextItem] = []
+        spans: Dict[str, List[ContextItem]] = {}
+        for item in items:
+            if item.source == "code" and item.path and item.start_line:
+                spans.setdefault(item.path, []).append(item)
+            else:
+                others.append(item)
+
+        merged = []
+        for path_items in spans.values():
+            path_items.sort(key=lambda i: i.start_line)
+            current = path_items[0]
+            for item in path_items[1:]:
+                if item.start_line <= (current.end_line or current.start_line) + 1:
+                    current = self._merge_pair(current, item)
+                else:
+                    merged.append(current)
+                    current = item
+            merged.append(current)
+
+        return merged + others
+
+    @staticmethod
+    def _merge_pair(first: ContextItem, second: ContextItem) -> ContextItem:
+        """Join two line ranges of one file (second starts within/after first)."""
+        first_end = first.end_line or first.start_line
+        second_end = second.end_line or second.start_line
+        first_lines = first.text.splitlines()
+        second_lines = second.text.splitlines()
+
+        # Lines of second not already covered by first
+        skip = first_end - second.start_line + 1
+        lines = first_lines + second_lines[max(0, skip):]
+
+        symbols = [s for s in (first.symbol, second.symbol) if s]
+        return ContextItem(
+            source="code",
+            text="\n".join(lines),
+            score=max(first.score, second.score),
+            path=first.path,
+            start_line=first.start_line,
+            end_line=max(first_end, second_end),
+            symbol=", ".join(dict.fromkeys(symbols)),
+            data=first.data,
+        )
+
+    def _mmr_order(self, items: List[ContextItem]) -> List[ContextItem]:
+        """Order items by maximal marginal relevance (Jaccard term similarity)."""
+        if not items:
+            return []
+
+        # Normalize scores per source so sources are comparable
+        top_scores: Dict[str, float] = {}
+        for item in items:
+            top_scores[item.source] = max(top_scores.get(item.source, 0.0), item.score)
+        relevance = [
+            item.score / top_scores[item.source] if top_scores[item.source] > 0 else 0.0
+            for item in items
+        ]
+        terms = [set(_TERM_PATTERN.findall(item.text.lower())) for item in items]
+
+        remaining = list(range(len(items)))
+        ordered: List[int] = []
+        while remaining:
+            def mmr(index: int) -> float:
+                redundancy = max(
+                    (self._jaccard(terms[index], terms[j]) for j in ordered), default=0.0
+                )
+                return (
+                    self.mmr_lambda * relevance[index]
+                    - (1 - self.mmr_lambda) * redundancy
+                )
+
+            best = max(remaining, key=mmr)
+            ordered.append(best)
+            remaining.remove(best)
+
+        return [items[i] for i in ordered]
+
+    @staticmethod
+    def _jaccard(a: set, b: set) -> float:
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
@@ -0,0 +1,121 @@
+"""
+Index manifest - Track which files are in the code index.
+
+Maps each indexed file path to its content hash and the chunk IDs stored
+in the vector collection, so re-indexing only touches changed files.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(content: str) -> str:
+    """Stable content hash used to detect file changes."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class IndexManifest:
+    """
+    Path -> content hash -> chunk IDs manifest.
+
+    Kept in memory and optionally persisted to a JSON file. The manifest
+    must only be persisted alongside a persistent vector store; otherwise
+    it would claim files are indexed after the store was lost.
+
+    Example:
+        >>> manifest = IndexManifest()
+        >>> manifest.needs_update("src/app.py", digest)
+        True
+        >>> manifest.set_entry("src/app.py", digest, ["src/app.py"])
+    """
+
+    def __init__(self, manifest_file: Optional[Path] = None):
+        """
+        Initialize index manifest.
+
+        Args:
+            manifest_file: Optional JSON file for persistence (None = in-memory)
+        """
+        self.manifest_file = Path(manifest_file) if manifest_file else None
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def get_entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get manifest entry for path."""
+        with self._lock:
+            entry = self._entries.get(path)
+            return dict(entry) if entry else None
+
+    def needs_update(self, path: str, digest: str) -> bool:
+        """Check whether path is new or its content changed."""
+        with self._lock:
+            entry = self._entries.get(path)
+            return entry is None or entry.get("hash") != digest
+
+    def set_entry(self, path: str, digest: str, chunk_ids: List[str]) -> None:
+        """Record indexed content hash and chunk IDs for path."""
+        with self._lock:
+            self._entries[path] = {"hash": digest, "chunk_ids": list(chunk_ids)}
+
+    def remove_entry(self, path: str) -> List[str]:
+        """
+        Remove path from manifest.
+
+        Returns:
+            Chunk IDs that belonged to the path
+        """
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            return list(entry.get("chunk_ids", [])) if entry else []
+
+    def paths(self) -> List[str]:
+        """List all indexed paths."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def stale_paths(self, present_paths: Iterable[str]) -> List[str]:
+        """List indexed paths that are no longer present."""
+        present = set(present_paths)
+        with self._lock:
+            return [p for p in self._entries if p not in present]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self) -> None:
+        """Persist manifest (no-op for in-memory manifests)."""
+        if not self.manifest_file:
+            return
+
+        with self._lock:
+            data = json.dumps(self._entries, indent=2)
+
+        try:
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.manifest_file.with_suffix(".tmp")
+            tmp_file.write_text(data)
+            tmp_file.replace(self.manifest_file)
+        except Exception as exc:
+            logger.error(f"Failed to save index manifest: {exc}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load manifest from storage."""
+        if not self.manifest_file or not self.manifest_file.exists():
+            return {}
+
+        try:
+            return json.loads(self.manifest_file.read_text())
+        except Exception as exc:
+            logger.error(f"Failed to load index manifest: {exc}")
+            return {}
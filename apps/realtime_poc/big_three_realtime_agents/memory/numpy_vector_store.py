@@ -0,0 +1,368 @@
+"""
+NumPy vector store - Memory-mapped local vector index.
+
+Stores L2-normalized float32 embeddings in a memory-mapped file with a
+JSONL metadata sidecar and answers queries with brute-force dot-product
+top-k. Optionally keeps an int8-quantized copy in memory for approximate
+scans, with exact float32 re-scoring of the candidates. NumPy has no int8
+matrix kernels and upcasts for the dot product, so the quantized scan
+saves reads of the mapped file rather than compute.
+
+Fast enough for repos up to ~100k chunks, starts instantly and has no
+dependency beyond NumPy.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .vector_store import VectorStore
+
+logger = logging.getLogger(__name__)
+
+# Initial row capacity of the embeddings file (doubles when full)
+INITIAL_CAPACITY = 1024
+
+# Candidate over-fetch factor when scanning the int8 index
+QUANTIZED_RESCORE_FACTOR = 4
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    Persistent brute-force vector index on a NumPy memmap.
+
+    Files (in storage_dir):
+        {name}.f32         - float32 rows, shape (capacity, dim)
+        {name}.meta.jsonl  - append-only sidecar of add/delete records
+
+    Example:
+        >>> store = NumpyVectorStore(Path("rag"), "code_embeddings", quantize=True)
+        >>> store.upsert(["a"], [embedding], ["def a(): ..."], [{"path": "a.py"}])
+        >>> store.query(query_embedding, n_results=5)
+    """
+
+    def __init__(self, storage_dir: Path, name: str, quantize: bool = False):
+        """
+        Initialize store, replaying any existing sidecar.
+
+        Args:
+            storage_dir: Directory for index files
+            name: Collection name (file prefix)
+            quantize: Keep an in-memory int8 copy for approximate scans
+        """
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.quantize = quantize
+
+        self._vectors_file = self.storage_dir / f"{name}.f32"
+        self._meta_file = self.storage_dir / f"{name}.meta.jsonl"
+        self._lock = threading.RLock()
+
+        self.dim: Optional[int] = None
+        self._size = 0
+        self._matrix: Optional[np.memmap] = None
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: List[Optional[str]] = []
+        self._documents: List[Optional[str]] = []
+        self._metadatas: List[Optional[Dict[str, Any]]] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._q8: Optional[np.ndarray] = None
+        self._q8_scale: Optional[np.ndarray] = None
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # VectorStore API
+    # ------------------------------------------------------------------
+
+    def upsert(self, ids, embeddings, documents, metadatas) -> None:
+        if not ids:
+            return
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+
+        # Duplicate IDs within the batch: the last occurrence wins
+        last = {item_id: i for i, item_id in enumerate(ids)}
+        if len(last) < len(ids):
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            documents = [documents[i] for i in keep]
+            metadatas = [metadatas[i] for i in keep]
+            vectors = vectors[keep]
+
+        vectors = self._normalize(vectors)
+
+        with self._lock:
+            if self.dim is None:
+                self._init_dim(vectors.shape[1])
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} != index dimension {self.dim}"
+                )
+
+            records = []
+            for item_id in ids:
+                if item_id in self._id_to_row:
+                    self._mark_deleted(item_id)
+                    records.append({"op": "delete", "id": item_id})
+
+            start = self._size
+            self._ensure_capacity(start + len(ids))
+            self._matrix[start:start + len(ids)] = vectors
+            self._matrix.flush()
+
+            for offset, item_id in enumerate(ids):
+                row = start + offset
+                self._set_row(row, item_id, documents[offset], metadatas[offset] or {})
+                records.append({
+                    "op": "add",
+                    "id": item_id,
+                    "row": row,
+                    "document": documents[offset],
+                    "metadata": metadatas[offset] or {},
+                })
+            self._size = start + len(ids)
+
+            if self.quantize:
+                self._quantize_rows(start, self._size)
+
+            self._append_records(records)
+            self._maybe_compact()
+
+    def delete(self, ids) -> None:
+        with self._lock:
+            records = []
+            for item_id in ids:
+                if item_id in self._id_to_row:
+                    self._mark_deleted(item_id)
+                    records.append({"op": "delete", "id": item_id})
+            self._append_records(records)
+            self._maybe_compact()
+
+    def query(self, embedding, n_results) -> List[Dict[str, Any]]:
+        with self._lock:
+            live = self.count()
+            if live == 0 or n_results <= 0:
+                return []
+
+            q = self._normalize(np.asarray([embedding], dtype=np.float32))[0]
+            k = min(n_results, live)
+
+            if self.quantize and self._q8 is not None:
+                scores = (self._q8[:self._size] @ q) * self._q8_scale[:self._size]
+                scores[~self._alive[:self._size]] = -np.inf
+                candidates = self._top_k(scores, min(live, k * QUANTIZED_RESCORE_FACTOR))
+                exact = np.asarray(self._matrix[candidates]) @ q
+                order = candidates[np.argsort(-exact)][:k]
+                final_scores = np.sort(exact)[::-1][:k]
+            else:
+                scores = np.asarray(self._matrix[:self._size]) @ q
+                scores[~self._alive[:self._size]] = -np.inf
+                order = self._top_k(scores, k)
+                final_scores = scores[order]
+
+            return [
+                {
+                    "id": self._ids[row],
+                    "document": self._documents[row],
+                    "metadata": dict(self._metadatas[row] or {}),
+                    "distance": float(1.0 - score),
+                }
+                for row, score in zip(order.tolist(), final_scores.tolist())
+            ]
+
+    def count(self) -> int:
+        return len(self._id_to_row)
+
+    def get_all(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        with self._lock:
+            return [
+                (item_id, self._documents[row], dict(self._metadatas[row] or {}))
+                for item_id, row in self._id_to_row.items()
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._matrix = None
+            for path in (self._vectors_file, self._meta_file):
+                if path.exists():
+                    path.unlink()
+            self.dim = None
+            self._size = 0
+            self._alive = np.zeros(0, dtype=bool)
+            self._ids, self._documents, self._metadatas = [], [], []
+            self._id_to_row = {}
+            self._q8 = None
+            self._q8_scale = None
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def compact(self) -> None:
+        """Rewrite index files without deleted rows."""
+        with self._lock:
+            if self.dim is None:
+                return
+
+            live_rows = sorted(self._id_to_row.values())
+            vectors = np.array(self._matrix[live_rows], dtype=np.float32)
+            entries = [
+                (self._ids[row], self._documents[row], self._metadatas[row])
+                for row in live_rows
+            ]
+            dim = self.dim
+
+            self.reset()
+            self._init_dim(dim)
+            if entries:
+                self.upsert(
+                    [e[0] for e in entries],
+                    vectors,
+                    [e[1] for e in entries],
+                    [e[2] for e in entries],
+                )
+
+            logger.info(f"Compacted vector store {self.name}: {len(entries)} rows")
+
+    def _maybe_compact(self) -> None:
+        """Compact when more than half the rows are tombstones."""
+        dead = self._size - self.count()
+        if self._size > INITIAL_CAPACITY and dead > self._size // 2:
+            self.compact()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype(np.float32)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores, best first."""
+        if k >= len(scores):
+            return np.argsort(-scores)
+        part = np.argpartition(-scores, k - 1)[:k]
+        return part[np.argsort(-scores[part])]
+
+    def _init_dim(self, dim: int) -> None:
+        """Create the embeddings file for a new dimension."""
+        self.dim = dim
+        self._append_records([{"op": "header", "dim": dim}])
+        self._open_matrix(INITIAL_CAPACITY)
+
+    def _open_matrix(self, capacity: int) -> None:
+        """(Re)map embeddings file with at least capacity rows."""
+        row_bytes = self.dim * 4
+        required = capacity * row_bytes
+
+        with open(self._vectors_file, "ab") as f:
+            if f.tell() < required:
+                f.truncate(required)
+
+        capacity = self._vectors_file.stat().st_size // row_bytes
+        self._matrix = np.memmap(
+            self._vectors_file, dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+        )
+
+        if len(self._alive) < capacity:
+            self._alive = np.concatenate(
+                [self._alive, np.zeros(capacity - len(self._alive), dtype=bool)]
+            )
+
+        if self.quantize:
+            q8 = np.zeros((capacity, self.dim), dtype=np.int8)
+            scale = np.zeros(capacity, dtype=np.float32)
+            if self._q8 is not None:
+                q8[:len(self._q8)] = self._q8
+                scale[:len(self._q8_scale)] = self._q8_scale
+            self._q8, self._q8_scale = q8, scale
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        self._matrix.flush()
+        self._open_matrix(capacity)
+
+    def _quantize_rows(self, start: int, end: int) -> None:
+        """Symmetric per-row int8 quantization of rows [start, end)."""
+        block = np.asarray(self._matrix[start:end])
+        scale = np.abs(block).max(axis=1) / 127.0
+        scale[scale == 0] = 1.0
+        self._q8[start:end] = np.round(block / scale[:, None]).astype(np.int8)
+        self._q8_scale[start:end] = scale
+
+    def _set_row(self, row: int, item_id: str, document: str, metadata: Dict[str, Any]) -> None:
+        while len(self._ids) <= row:
+            self._ids.append(None)
+            self._documents.append(None)
+            self._metadatas.append(None)
+        self._ids[row] = item_id
+        self._documents[row] = document
+        self._metadatas[row] = metadata
+        self._alive[row] = True
+        self._id_to_row[item_id] = row
+
+    def _mark_deleted(self, item_id: str) -> None:
+        row = self._id_to_row.pop(item_id)
+        self._alive[row] = False
+        self._documents[row] = None
+        self._metadatas[row] = None
+
+    def _append_records(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        with open(self._meta_file, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+
+    def _load(self) -> None:
+        """Replay sidecar log and map existing embeddings file."""
+        if not self._meta_file.exists():
+            return
+
+        max_row = -1
+        try:
+            with open(self._meta_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping corrupt record in {self._meta_file.name}")
+                        continue
+
+                    op = record.get("op")
+                    if op == "header":
+                        self.dim = record["dim"]
+                        self._open_matrix(INITIAL_CAPACITY)
+                    elif op == "add" and self.dim is not None:
+                        row = record["row"]
+                        self._ensure_capacity(row + 1)
+                        if record["id"] in self._id_to_row:
+                            self._mark_deleted(record["id"])
+                        self._set_row(row, record["id"], record["document"], record["metadata"])
+                        max_row = max(max_row, row)
+                    elif op == "delete" and record.get("id") in self._id_to_row:
+                        self._mark_deleted(record["id"])
+        except Exception as exc:
+            logger.error(f"Failed to load vector store {self.name}: {exc}")
+            return
+
+        self._size = max_row + 1
+        if self.quantize and self._size:
+            self._quantize_rows(0, self._size)
+
+        logger.info(f"Loaded vector store {self.name}: {self.count()} entries")
@@ -0,0 +1,147 @@
+"""
+RAG caches - Query embedding LRU and short-lived search result cache.
+
+Query encoding dominates augmentation latency on CPU, and a single
+augment_query call searches several collections with the same text.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+
+def normalize_query(text: str) -> str:
+    """Normalize query text for cache keys (trim and collapse whitespace)."""
+    return " ".join(text.split())
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of query embeddings keyed by normalized text.
+
+    Example:
+        >>> cache = QueryEmbeddingCache(max_size=256)
+        >>> embedding = cache.get_or_compute("find login", model_encode)
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize embedding cache.
+
+        Args:
+            max_size: Maximum cached embeddings (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(
+        self, text: str, compute: Callable[[str], List[float]]
+    ) -> List[float]:
+        """
+        Return cached embedding or compute and store it.
+
+        Args:
+            text: Query text
+            compute: Function producing the embedding for text
+
+        Returns:
+            Embedding as list of floats
+        """
+        key = normalize_query(text)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock so concurrent queries don't serialize
+        embedding = compute(key)
+
+        if self.max_size > 0:
+            with self._lock:
+                self._entries[key] = embedding
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return embedding
+
+    def clear(self) -> None:
+        """Drop all cached embeddings (e.g. after a model change)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SearchResultCache:
+    """
+    Short-TTL cache of search results per (collection, query, n_results).
+
+    Entries for a collection are invalidated whenever it is written to.
+
+    Example:
+        >>> cache = SearchResultCache(ttl_seconds=30)
+        >>> cache.put("code", "find login", 5, results)
+        >>> cache.invalidate("code")
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_size: int = 512):
+        """
+        Initialize result cache.
+
+        Args:
+            ttl_seconds: Entry lifetime (0 disables caching)
+            max_size: Maximum cached result sets
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str, int], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, collection: str, query: str, n_results: int) -> Optional[Any]:
+        """Get a copy of cached results, or None if missing/expired."""
+        key = (collection, normalize_query(query), n_results)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, results = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return copy.deepcopy(results)
+
+    def put(self, collection: str, query: str, n_results: int, results: Any) -> None:
+        """Cache a copy of results."""
+        if self.ttl_seconds <= 0:
+            return
+
+        key = (collection, normalize_query(query), n_results)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """Drop cached results for a collection (or all collections)."""
+        with self._lock:
+            if collection is None:
+                self._entries.clear()
+                return
+
+            for key in [k for k in self._entries if k[0] == collection]:
+                del self._entries[key]
@@ -2,17 +2,54 @@
 RAG (Retrieval-Augmented Generation) System.
 
 Provides semantic search capabilities for code and experience retrieval
-using vector embeddings (ChromaDB) based on refactoring.md design.
+using vector embeddings based on refactoring.md design. Collections live in
+a pluggable VectorStore: ChromaDB (default) or the built-in NumPy/mmap index.
+With a storage_dir, collections persist across restarts and are reused as
+long as the schema version, embedding model and dimension still match.
 """
 
+import asyncio
 import logging
 import json
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable
 from pathlib import Path
 from datetime import datetime, timezone
 
+from .bm25_index import BM25Index, reciprocal_rank_fusion
+from .index_manifest import IndexManifest, content_hash
+from .code_chunker import CodeChunk, chunk_file
+from .context_assembler import ContextAssembler, ContextItem, AssembledContext, estimate_tokens
+from .rag_cache import QueryEmbeddingCache, SearchResultCache
+from .vector_store import VectorStore, ChromaVectorStore
+
 logger = logging.getLogger(__name__)
 
+# Supported source file extensions for codebase indexing
+CODE_EXTENSIONS = [".py", ".js", ".ts", ".tsx", ".vue", ".jsx"]
+
+# Directories never indexed
+SKIP_DIRS = ["node_modules", "__pycache__", ".git", "venv"]
+
+# Default sentence-transformers model
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Bump when stored chunk IDs/metadata change shape (forces a rebuild)
+RAG_SCHEMA_VERSION = 2
+
+# Candidates fetched per channel for hybrid fusion (multiple of limit)
+HYBRID_CANDIDATE_FACTOR = 4
+
+# Results fetched per source when a token budget trims them afterwards
+BUDGETED_SOURCE_LIMIT = 8
+
+# Per-source retrieval timeout on the augmentation path (seconds)
+DEFAULT_SOURCE_TIMEOUT = 2.0
+
 
 class RAGSystem:
     """
@@ -24,7 +61,24 @@ class RAGSystem:
     - Context augmentation for queries
     """
 
-    def __init__(self, memory_manager, embedding_model=None, logger_instance=None):
+    def __init__(
+        self,
+        memory_manager,
+        embedding_model=None,
+        logger_instance=None,
+        embedding_cache_size: int = 256,
+        result_cache_ttl: float = 30.0,
+        vector_backend: str = "chroma",
+        storage_dir: Optional[Path] = None,
+        quantize_vectors: bool = False,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        warmup: bool = False,
+        source_timeout: float = DEFAULT_SOURCE_TIMEOUT,
+        max_retrieval_workers: int = 4,
+        persistent: bool = False,
+        vector_weight: float = 1.0,
+        lexical_weight: float = 1.0,
+    ):
         """
         Initialize RAG system.
 
@@ -32,68 +86,428 @@ class RAGSystem:
             memory_manager: MemoryManager instance
             embedding_model: Optional embedding model (defaults to sentence-transformers)
             logger_instance: Logger instance
+            embedding_cache_size: Max cached query embeddings (0 disables)
+            result_cache_ttl: Search result cache lifetime in seconds (0 disables)
+            vector_backend: "chroma" (ChromaDB) or "numpy" (local mmap index)
+            storage_dir: Directory for persistent collections (required for numpy)
+            quantize_vectors: Scan an in-memory int8 copy of the numpy index (approximate)
+            model_name: sentence-transformers model loaded lazily on first use
+            warmup: Start loading the model in a background thread right away
+            source_timeout: Per-source retrieval timeout for augment_query (seconds)
+            max_retrieval_workers: Threads for concurrent encode/search fan-out
+            persistent: Store ChromaDB collections on disk in storage_dir
+            vector_weight: Weight of the embedding ranking in hybrid code search
+            lexical_weight: Weight of the BM25 ranking in hybrid code search
         """
         self.memory = memory_manager
         self.logger = logger_instance or logger
 
-        # Initialize embedding model
-        try:
-            if embedding_model:
-                self.embedding_model = embedding_model
-            else:
-                from sentence_transformers import SentenceTransformer
+        # Thread pool for concurrent (CPU-bound) retrieval fan-out
+        self.source_timeout = source_timeout
+        self._retrieval_executor = ThreadPoolExecutor(
+            max_workers=max_retrieval_workers, thread_name_prefix="rag-retrieval"
+        )
 
-                self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-                self.logger.info("Loaded sentence-transformers model: all-MiniLM-L6-v2")
-        except ImportError:
-            self.logger.warning(
-                "sentence-transformers not installed. RAG features disabled."
+        # Query embedding LRU and per-collection result cache
+        self.embedding_cache = QueryEmbeddingCache(max_size=embedding_cache_size)
+        self.result_cache = SearchResultCache(ttl_seconds=result_cache_ttl)
+
+        # Embedding model is loaded lazily; queries degrade to keyword search
+        # until it is ready
+        self.model_name = model_name
+        self._embedding_model = None
+        self._model_lock = threading.Lock()
+        self._model_state_lock = threading.Lock()
+        self._model_settled = threading.Event()
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._index_meta_file: Optional[Path] = None
+        if embedding_model:
+            self.embedding_model = embedding_model
+
+        # Token-budgeted context assembly (used when a token_budget is given)
+        self.context_assembler = ContextAssembler()
+
+        # Lexical (BM25) index over code chunks, fused with vector ranking
+        self.code_lexical_index = BM25Index()
+        self.hybrid_weights = {"vector": vector_weight, "bm25": lexical_weight}
+
+        # Initialize vector collections
+        self.storage_dir = Path(storage_dir) if storage_dir else None
+        self.chroma_client = None
+        self.code_collection: Optional[VectorStore] = None
+        self.experience_collection: Optional[VectorStore] = None
+
+        if vector_backend == "numpy":
+            self._init_numpy_collections(quantize_vectors)
+        else:
+            self._init_chroma_collections(persistent)
+
+        self.persistent = bool(
+            self.code_collection
+            and self.storage_dir
+            and (vector_backend == "numpy" or persistent)
+        )
+
+        # Path -> content hash -> chunk IDs, persisted only with a persistent store
+        manifest_file = self.storage_dir / "code_manifest.json" if self.persistent else None
+        self.code_manifest = IndexManifest(manifest_file)
+
+        if self.persistent:
+            self._index_meta_file = self.storage_dir / "rag_meta.json"
+            self._validate_index_meta()
+
+        self.rebuild_lexical_index()
+
+        if warmup:
+            self.warmup()
+
+        # File watcher state for incremental mode
+        self._observer = None
+        self._watch_lock = threading.Lock()
+        self._pending_paths: set = set()
+        self._debounce_timer: Optional[threading.Timer] = None
+
+    @property
+    def embedding_model(self):
+        """Embedding model, loading it synchronously if needed (None if unavailable)."""
+        if self._embedding_model is None and not self._model_settled.is_set():
+            self._load_embedding_model()
+        return self._embedding_model
+
+    @embedding_model.setter
+    def embedding_model(self, model) -> None:
+        if model is not None:
+            # Migrate collections before queries can use the new model
+            self._validate_index_meta(model)
+        if model is not self._embedding_model:
+            self.embedding_cache.clear()
+        self._embedding_model = model
+        if model is not None:
+            self._model_settled.set()
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the embedding model is loaded."""
+        return self._embedding_model is not None
+
+    def warmup(self) -> None:
+        """Start loading the embedding model in a background thread (non-blocking)."""
+        with self._model_state_lock:
+            if self._model_settled.is_set() or self._warmup_thread is not None:
+                return
+            self._warmup_thread = threading.Thread(
+                target=self._load_embedding_model, name="rag-model-warmup", daemon=True
             )
-            self.embedding_model = None
+            self._warmup_thread.start()
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the embedding model to finish loading.
+
+        Starts a background warmup if none is running.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if the model is loaded, False if unavailable or timed out
+        """
+        self.warmup()
+        await asyncio.to_thread(self._model_settled.wait, timeout)
+        return self.is_ready
+
+    def _load_embedding_model(self) -> None:
+        """Load the sentence-transformers model (serialized across threads)."""
+        with self._model_lock:
+            if self._model_settled.is_set():
+                return
 
-        # Initialize ChromaDB collections
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                model = SentenceTransformer(self.model_name)
+                self.logger.info(f"Loaded sentence-transformers model: {self.model_name}")
+                # Migrate collections before queries can use the new model
+                self._validate_index_meta(model)
+                self.embedding_cache.clear()
+                self._embedding_model = model
+            except ImportError:
+                self.logger.warning(
+                    "sentence-transformers not installed. RAG features disabled."
+                )
+            except Exception as exc:
+                self.logger.error(f"Failed to load embedding model {self.model_name}: {exc}")
+            finally:
+                self._model_settled.set()
+
+    def _query_model(self):
+        """
+        Embedding model for query-time use, without blocking.
+
+        Returns None (and kicks off a background load) while the model is
+        not ready, so callers can fall back to keyword search.
+        """
+        if self._embedding_model is None:
+            self.warmup()
+        return self._embedding_model
+
+    def _keyword_search(
+        self, collection: VectorStore, query: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Keyword fallback used while the embedding model is loading.
+
+        Scores stored documents by the fraction of query words they contain.
+        Returned matches use the VectorStore result shape.
+        """
+        query_words = set(_WORD_PATTERN.findall(query.lower()))
+        if not query_words:
+            return []
+
+        scored = []
+        for item_id, document, metadata in collection.get_all():
+            text = f"{metadata.get('path', '')} {metadata.get('symbol', '')} {document}"
+            words = set(_WORD_PATTERN.findall(text.lower()))
+            score = len(query_words & words) / len(query_words)
+            if score > 0:
+                scored.append((score, item_id, document, metadata))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [
+            {"id": item_id, "document": document, "metadata": metadata, "distance": 1 - score}
+            for score, item_id, document, metadata in scored[:limit]
+        ]
+
+    def _init_chroma_collections(self, persistent: bool = False) -> None:
+        """Create ChromaDB collections (on disk in storage_dir if persistent)."""
         try:
             import chromadb
 
-            self.chroma_client = chromadb.Client()
-            self.code_collection = self.chroma_client.get_or_create_collection(
-                name="code_embeddings"
+            if persistent and self.storage_dir:
+                self.chroma_client = chromadb.PersistentClient(
+                    path=str(self.storage_dir / "chroma")
+                )
+            else:
+                if persistent:
+                    self.logger.warning(
+                        "Persistent RAG storage requires storage_dir. Using in-memory ChromaDB."
+                    )
+                self.chroma_client = chromadb.Client()
+            self.code_collection = ChromaVectorStore(
+                self.chroma_client.get_or_create_collection(name="code_embeddings"),
+                client=self.chroma_client,
             )
-            self.experience_collection = self.chroma_client.get_or_create_collection(
-                name="experience_embeddings"
+            self.experience_collection = ChromaVectorStore(
+                self.chroma_client.get_or_create_collection(name="experience_embeddings"),
+                client=self.chroma_client,
             )
             self.logger.info("ChromaDB collections initialized")
         except ImportError:
             self.logger.warning("ChromaDB not installed. Vector search disabled.")
-            self.chroma_client = None
-            self.code_collection = None
-            self.experience_collection = None
+
+    def _init_numpy_collections(self, quantize: bool) -> None:
+        """Open (or create) local NumPy/mmap collections in storage_dir."""
+        if not self.storage_dir:
+            self.logger.warning("numpy vector backend requires storage_dir. Vector search disabled.")
+            return
+
+        try:
+            from .numpy_vector_store import NumpyVectorStore
+
+            self.code_collection = NumpyVectorStore(
+                self.storage_dir, "code_embeddings", quantize=quantize
+            )
+            self.experience_collection = NumpyVectorStore(
+                self.storage_dir, "experience_embeddings", quantize=quantize
+            )
+            self.logger.info(f"NumPy vector collections initialized in {self.storage_dir}")
+        except ImportError:
+            self.logger.warning("NumPy not installed. Vector search disabled.")
+
+    def _validate_index_meta(self, model=None) -> None:
+        """
+        Check persisted collections against the current schema and model.
+
+        Existing collections are reused when schema version, embedding model
+        and embedding dimension match. Otherwise the code collection is reset
+        (with the code manifest) so it is rebuilt from the codebase, and stored
+        experiences, which cannot be rebuilt, are re-embedded with the new
+        model. The dimension is only known once the model is loaded, so this
+        runs again then; experiences found stale before that are re-embedded
+        at that point.
+
+        Args:
+            model: Embedding model about to be used (default: the loaded one)
+        """
+        if not self._index_meta_file:
+            return
+
+        model = model if model is not None else self._embedding_model
+        expected = {
+            "schema_version": RAG_SCHEMA_VERSION,
+            "embedding_model": self.model_name,
+            "embedding_dim": self._embedding_dim(model),
+        }
+
+        stored = {}
+        if self._index_meta_file.exists():
+            try:
+                stored = json.loads(self._index_meta_file.read_text())
+            except Exception as exc:
+                self.logger.error(f"Failed to read RAG index metadata: {exc}")
+
+        mismatched = [
+            key for key, value in expected.items()
+            if key in stored and value is not None
+            and stored[key] is not None and stored[key] != value
+        ]
+        stale_experiences = bool(stored.get("experiences_stale"))
+
+        if mismatched:
+            self.logger.warning(
+                f"RAG index metadata changed ({', '.join(mismatched)}). Rebuilding collections."
+            )
+            self._reset_code_collection()
+            self.embedding_cache.clear()
+            stale_experiences = True
+            meta = dict(expected)
+        else:
+            if stored and expected["embedding_dim"] is None:
+                self.logger.info(
+                    f"Reusing persisted RAG collections "
+                    f"({self.code_collection.count()} code chunks, "
+                    f"{self.experience_collection.count()} experiences)"
+                )
+            meta = {**expected, **{k: v for k, v in stored.items() if expected.get(k) is None}}
+
+        if stale_experiences and not (model is not None and self._reembed_experiences(model)):
+            meta["experiences_stale"] = True
+        else:
+            meta.pop("experiences_stale", None)
+
+        if meta != stored:
+            self._save_index_meta(meta)
+
+    def _embedding_dim(self, model=None) -> Optional[int]:
+        """Dimension of the embedding model (None if not loaded)."""
+        model = model if model is not None else self._embedding_model
+        if model is None:
+            return None
+
+        try:
+            get_dim = getattr(model, "get_sentence_embedding_dimension", None)
+            dim = get_dim() if get_dim else None
+            if dim is None:
+                dim = len(model.encode("dimension probe"))
+            return int(dim)
+        except Exception as exc:
+            self.logger.warning(f"Could not determine embedding dimension: {exc}")
+            return None
+
+    def _reset_code_collection(self) -> None:
+        """Delete all indexed code vectors and forget indexed files."""
+        if self.code_collection:
+            self.code_collection.reset()
+        self.code_manifest.clear()
+        self.code_manifest.save()
+        self.code_lexical_index.clear()
+        self.result_cache.invalidate()
+
+    def _reembed_experiences(self, model) -> bool:
+        """
+        Re-embed stored experience documents with model (in place).
+
+        Returns:
+            True if the collection now holds vectors of model
+        """
+        if not self.experience_collection:
+            return True
+
+        try:
+            entries = self.experience_collection.get_all()
+            documents = [document for _, document, _ in entries]
+            embeddings = model.encode(documents).tolist() if documents else []
+
+            # Embed first so the collection is only briefly empty
+            self.experience_collection.reset()
+            if entries:
+                self.experience_collection.upsert(
+                    ids=[item_id for item_id, _, _ in entries],
+                    embeddings=embeddings,
+                    documents=documents,
+                    metadatas=[metadata for _, _, metadata in entries],
+                )
+            self.result_cache.invalidate("experience")
+            self.logger.info(f"Re-embedded {len(entries)} experiences with {self.model_name}")
+            return True
+        except Exception as exc:
+            self.logger.error(f"Failed to re-embed experiences: {exc}")
+            return False
+
+    def rebuild_lexical_index(self) -> None:
+        """Rebuild the BM25 index from the code collection (e.g. after restart)."""
+        self.code_lexical_index.clear()
+        if not self.code_collection:
+            return
+
+        try:
+            for item_id, document, metadata in self.code_collection.get_all():
+                self.code_lexical_index.add(item_id, document, metadata)
+        except Exception as exc:
+            self.logger.error(f"Failed to rebuild lexical index: {exc}")
+            return
+
+        if len(self.code_lexical_index):
+            self.logger.info(f"Lexical index rebuilt: {len(self.code_lexical_index)} chunks")
+
+    def _save_index_meta(self, meta: Dict[str, Any]) -> None:
+        """Persist collection schema/model metadata."""
+        try:
+            self._index_meta_file.parent.mkdir(parents=True, exist_ok=True)
+            self._index_meta_file.write_text(json.dumps(meta, indent=2))
+        except Exception as exc:
+            self.logger.error(f"Failed to save RAG index metadata: {exc}")
 
     async def augment_query(
-        self, user_query: str, context_type: str = "auto"
+        self,
+        user_query: str,
+        context_type: str = "auto",
+        source_timeout: Optional[float] = None,
+        token_budget: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Augment user query with relevant context.
 
+        Code, experience and learned-pattern retrieval run concurrently on a
+        thread pool. A source that exceeds the timeout is skipped and listed
+        in context["timed_out_sources"]; the other sources are still used.
+
         Args:
             user_query: User query/request
             context_type: "auto", "code", "experience", or "project"
+            source_timeout: Per-source timeout in seconds (defaults to instance setting)
+            token_budget: Max tokens of the augmented query; retrieved context is
+                deduplicated, merged and MMR-ordered to fit (None = no limit)
 
         Returns:
             {
                 "original_query": str,
                 "augmented_query": str,
+                "tokens_used": int,
                 "context": {
                     "relevant_code": [...],
                     "similar_experiences": [...],
                     "project_info": {...},
-                    "conversation_context": [...]
+                    "conversation_context": [...],
+                    "timed_out_sources": [...]
                 }
             }
         """
         self.logger.info(f"Augmenting query: {user_query[:100]}...")
 
         context = {}
+        timeout = self.source_timeout if source_timeout is None else source_timeout
+        timed_out: List[str] = []
 
         # 1. Conversation context (Working Memory)
         try:
@@ -101,37 +515,83 @@ class RAGSystem:
         except AttributeError:
             context["conversation_context"] = []
 
-        # 2. Project context inference
-        project_info = await self._infer_project_context(user_query)
-        if project_info:
-            context["project_info"] = project_info
-
-        # 3. Codebase search (Vector DB)
+        # 2. Independent retrievals fan out concurrently
+        limit = 3 if token_budget is None else BUDGETED_SOURCE_LIMIT
+        sources = {}
         if context_type in ["auto", "code"] and self.code_collection:
-            relevant_code = self.search_code(user_query, limit=3)
-            context["relevant_code"] = relevant_code
-
-        # 4. Similar experience search
+            sources["relevant_code"] = (self.search_code, user_query, limit)
         if context_type in ["auto", "experience"] and self.experience_collection:
-            similar_experiences = self.search_similar_experiences(user_query, limit=3)
-            context["similar_experiences"] = similar_experiences
-
-        # 5. Learning patterns search
-        try:
-            patterns = self.memory.query_similar_patterns(user_query, limit=3)
-            context["learned_patterns"] = patterns
-        except AttributeError:
-            context["learned_patterns"] = []
+            sources["similar_experiences"] = (self.search_similar_experiences, user_query, limit)
+        sources["learned_patterns"] = (self._search_learned_patterns, user_query, limit)
+
+        project_info, *results = await asyncio.gather(
+            self._infer_project_context(user_query),
+            *(
+                self._run_source(name, fn, args, timeout, timed_out)
+                for name, (fn, *args) in sources.items()
+            ),
+        )
 
-        # 6. Build augmented query
-        augmented_query = self._build_augmented_query(user_query, context)
+        if project_info:
+            context["project_info"] = project_info
+        context.update(zip(sources.keys(), results))
+        context["timed_out_sources"] = timed_out
+
+        # 3. Build augmented query (within token budget if given)
+        assembled = None
+        if token_budget is not None:
+            header = self._build_augmented_query(user_query, context, include_retrieved=False)
+            assembled = self.context_assembler.assemble(
+                self._context_items(context),
+                token_budget=max(0, token_budget - estimate_tokens(header) - 1),
+            )
+        augmented_query = self._build_augmented_query(user_query, context, assembled=assembled)
 
         return {
             "original_query": user_query,
             "augmented_query": augmented_query,
+            "tokens_used": estimate_tokens(augmented_query),
             "context": context,
         }
 
+    async def _run_source(
+        self,
+        name: str,
+        fn,
+        args: List[Any],
+        timeout: Optional[float],
+        timed_out: List[str],
+    ) -> List[Dict]:
+        """
+        Run one retrieval source on the thread pool with a timeout.
+
+        Returns an empty result (and records the source name in timed_out)
+        if the source is too slow; errors also yield an empty result.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._retrieval_executor, fn, *args)
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Retrieval source '{name}' timed out after {timeout}s")
+            timed_out.append(name)
+        except Exception as exc:
+            self.logger.error(f"Retrieval source '{name}' failed: {exc}")
+        return []
+
+    def _search_learned_patterns(self, query: str, limit: int) -> List[Dict]:
+        """Query learned patterns from memory (empty if unsupported)."""
+        try:
+            return self.memory.query_similar_patterns(query, limit=limit)
+        except AttributeError:
+            return []
+
+    def close(self) -> None:
+        """Stop the file watcher and retrieval thread pool."""
+        self.stop_watching()
+        self._retrieval_executor.shutdown(wait=False, cancel_futures=True)
+
     async def _infer_project_context(self, query: str) -> Optional[Dict]:
         """Infer project context from query."""
         keywords = ["blog", "project", "app", "api", "webapp", "platform"]
@@ -148,8 +608,19 @@ class RAGSystem:
 
         return None
 
-    def _build_augmented_query(self, original: str, context: Dict[str, Any]) -> str:
-        """Build augmented query with context."""
+    def _build_augmented_query(
+        self,
+        original: str,
+        context: Dict[str, Any],
+        assembled: Optional[AssembledContext] = None,
+        include_retrieved: bool = True,
+    ) -> str:
+        """
+        Build augmented query with context.
+
+        Retrieved sections (code, experiences, patterns) come from the
+        assembled context when given, else from the raw results.
+        """
         parts = [f"User Request: {original}\n"]
 
         # Project context
@@ -165,11 +636,19 @@ class RAGSystem:
             for conv in context["conversation_context"][-3:]:
                 parts.append(f"- {conv['role']}: {conv['content'][:100]}")
 
+        if not include_retrieved:
+            return "\n".join(parts)
+
+        if assembled is not None:
+            if assembled.items:
+                parts.append("\n" + assembled.to_text())
+            return "\n".join(parts)
+
         # Relevant code
         if context.get("relevant_code"):
             parts.append("\nRelevant Code:")
             for code in context["relevant_code"][:2]:
-                parts.append(f"- {code['path']}: {code['content'][:200]}...")
+                parts.append(f"- {self._format_code_location(code)}: {code['content'][:200]}...")
 
         # Similar experiences
         if context.get("similar_experiences"):
@@ -190,7 +669,63 @@ class RAGSystem:
 
         return "\n".join(parts)
 
-    def index_code(self, code_path: str, content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+    def _context_items(self, context: Dict[str, Any]) -> List[ContextItem]:
+        """Convert retrieved results into ContextItems for assembly."""
+        items = []
+
+        for code in context.get("relevant_code", []):
+            scores = code.get("scores") or {}
+            if scores.get("rrf") is not None:
+                score = scores["rrf"]
+            elif code.get("distance") is not None:
+                score = 1 - code["distance"]
+            else:
+                score = 0.0
+            items.append(ContextItem(
+                source="code",
+                text=code["content"],
+                score=score,
+                path=code.get("path"),
+                start_line=code.get("start_line"),
+                end_line=code.get("end_line"),
+                symbol=code.get("symbol", ""),
+                data=code,
+            ))
+
+        experiences = context.get("similar_experiences", []) + context.get("similar_tasks", [])
+        for exp in experiences:
+            items.append(ContextItem(
+                source="experience",
+                text=f"{exp['description']} (similarity: {exp['similarity']:.2f})",
+                score=exp.get("similarity", 0.0),
+                data=exp,
+            ))
+
+        for pattern in context.get("learned_patterns", []):
+            items.append(ContextItem(
+                source="pattern",
+                text=(
+                    f"{pattern['context']}: {pattern['action_taken']} "
+                    f"(success: {pattern.get('success', False)})"
+                ),
+                score=pattern.get("confidence", 1.0),
+                data=pattern,
+            ))
+
+        return items
+
+    def _format_code_location(self, code: Dict[str, Any]) -> str:
+        """Format "path:start-end (symbol)" for a code search result."""
+        location = code["path"]
+        if code.get("start_line"):
+            location += f":{code['start_line']}-{code.get('end_line', code['start_line'])}"
+        if code.get("symbol"):
+            location += f" ({code['symbol']})"
+        return location
+
+    def index_code(
+        self, code_path: str, content: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         Index code with embeddings.
 
@@ -198,110 +733,406 @@ class RAGSystem:
             code_path: Relative code path
             content: Code content
             metadata: Optional metadata
+
+        Returns:
+            True if the code was indexed
         """
         if not self.embedding_model or not self.code_collection:
-            return
+            return False
 
         try:
             embedding = self.embedding_model.encode(content).tolist()
 
-            self.code_collection.add(
+            # Upsert so re-indexing a path replaces instead of colliding
+            self.code_collection.upsert(
                 ids=[code_path],
                 embeddings=[embedding],
                 documents=[content],
                 metadatas=[metadata or {}],
             )
+            self.code_lexical_index.add(code_path, content, {"path": code_path, **(metadata or {})})
 
+            self.result_cache.invalidate("code")
             self.logger.debug(f"Indexed code: {code_path}")
+            return True
         except Exception as exc:
             self.logger.error(f"Failed to index code {code_path}: {exc}")
+            return False
 
-    def index_codebase(self, codebase_path: Path) -> None:
+    def index_codebase(self, codebase_path: Path) -> Dict[str, int]:
         """
-        Index entire codebase.
+        Incrementally index entire codebase.
+
+        Files are split into symbol-level chunks (see code_chunker). Only new
+        or changed files (by content hash) are embedded; chunks of files that
+        disappeared since the last run are deleted.
 
         Args:
             codebase_path: Path to codebase directory
+
+        Returns:
+            Counts of added, updated, unchanged, removed and failed files
         """
+        codebase_path = Path(codebase_path)
         self.logger.info(f"Indexing codebase: {codebase_path}")
 
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+
         if not self.embedding_model:
             self.logger.warning("Embedding model not available, skipping indexing")
-            return
+            return stats
+
+        present_paths = []
+        for file_path in self._iter_code_files(codebase_path):
+            relative_path = str(file_path.relative_to(codebase_path))
+            present_paths.append(relative_path)
+            status = self._index_file(codebase_path, file_path)
+            stats[status] += 1
+
+        for relative_path in self.code_manifest.stale_paths(present_paths):
+            self._remove_indexed_file(relative_path)
+            stats["removed"] += 1
+
+        self.code_manifest.save()
+
+        self.logger.info(
+            f"Codebase indexing complete: {stats['added']} added, "
+            f"{stats['updated']} updated, {stats['unchanged']} unchanged, "
+            f"{stats['removed']} removed"
+        )
+        return stats
+
+    def reindex_paths(self, codebase_path: Path, paths: Iterable[Path]) -> Dict[str, int]:
+        """
+        Re-index specific files (used by the file watcher).
+
+        Existing files are re-embedded if changed, missing files are removed.
+
+        Args:
+            codebase_path: Codebase root directory
+            paths: Absolute or root-relative file paths
+
+        Returns:
+            Counts of added, updated, unchanged, removed and failed files
+        """
+        codebase_path = Path(codebase_path)
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+
+        for path in paths:
+            file_path = Path(path)
+            if not file_path.is_absolute():
+                file_path = codebase_path / file_path
+
+            if not self._is_indexable(file_path):
+                continue
+
+            try:
+                relative_path = str(file_path.relative_to(codebase_path))
+            except ValueError:
+                continue
+
+            if file_path.is_file():
+                stats[self._index_file(codebase_path, file_path)] += 1
+            elif self.code_manifest.get_entry(relative_path):
+                self._remove_indexed_file(relative_path)
+                stats["removed"] += 1
+
+        self.code_manifest.save()
+        return stats
+
+    def watch_codebase(self, codebase_path: Path, debounce_seconds: float = 1.0) -> bool:
+        """
+        Keep the code index fresh by watching the codebase for changes.
+
+        Changed paths are batched and re-indexed after debounce_seconds of quiet.
+
+        Args:
+            codebase_path: Codebase root directory
+            debounce_seconds: Quiet period before re-indexing a batch
 
-        # Supported file extensions
-        extensions = [".py", ".js", ".ts", ".tsx", ".vue", ".jsx"]
+        Returns:
+            True if the watcher started
+        """
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            self.logger.warning("watchdog not installed. Incremental watch mode disabled.")
+            return False
+
+        codebase_path = Path(codebase_path).resolve()
+        rag = self
+
+        class _CodeChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for attr in ("src_path", "dest_path"):
+                    path = getattr(event, attr, None)
+                    if path:
+                        rag._schedule_reindex(codebase_path, Path(path), debounce_seconds)
+
+        self.stop_watching()
+
+        observer = Observer()
+        observer.schedule(_CodeChangeHandler(), str(codebase_path), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+
+        self.logger.info(f"Watching codebase for changes: {codebase_path}")
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop the file watcher and flush pending changes."""
+        observer, self._observer = self._observer, None
+        if observer:
+            observer.stop()
+            observer.join(timeout=5)
+
+        with self._watch_lock:
+            timer, self._debounce_timer = self._debounce_timer, None
+        if timer:
+            timer.cancel()
+            timer.function(*timer.args)
+
+    def _schedule_reindex(
+        self, codebase_path: Path, file_path: Path, debounce_seconds: float
+    ) -> None:
+        """Queue changed path and (re)start the debounce timer."""
+        if not self._is_indexable(file_path):
+            return
 
-        for ext in extensions:
+        with self._watch_lock:
+            self._pending_paths.add(file_path)
+            if self._debounce_timer:
+                self._debounce_timer.cancel()
+            self._debounce_timer = threading.Timer(
+                debounce_seconds, self._flush_pending, args=(codebase_path,)
+            )
+            self._debounce_timer.daemon = True
+            self._debounce_timer.start()
+
+    def _flush_pending(self, codebase_path: Path) -> None:
+        """Re-index all paths queued by the watcher."""
+        with self._watch_lock:
+            paths, self._pending_paths = self._pending_paths, set()
+            self._debounce_timer = None
+
+        if paths:
+            stats = self.reindex_paths(codebase_path, paths)
+            self.logger.info(f"Incremental re-index: {stats}")
+
+    def _iter_code_files(self, codebase_path: Path) -> Iterable[Path]:
+        """Yield indexable source files under codebase_path."""
+        for ext in CODE_EXTENSIONS:
             for file_path in codebase_path.rglob(f"*{ext}"):
-                # Skip certain directories
-                if any(
-                    skip in str(file_path)
-                    for skip in ["node_modules", "__pycache__", ".git", "venv"]
-                ):
-                    continue
+                if self._is_indexable(file_path):
+                    yield file_path
 
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    relative_path = str(file_path.relative_to(codebase_path))
-
-                    self.index_code(
-                        code_path=relative_path,
-                        content=content,
-                        metadata={
-                            "file_type": ext,
-                            "size": len(content),
-                            "indexed_at": datetime.now(timezone.utc).isoformat(),
-                        },
-                    )
-                except Exception as exc:
-                    self.logger.warning(f"Failed to index {file_path}: {exc}")
+    def _is_indexable(self, file_path: Path) -> bool:
+        """Check extension and skip-directory rules."""
+        if file_path.suffix not in CODE_EXTENSIONS:
+            return False
+        return not any(skip in file_path.parts for skip in SKIP_DIRS)
 
-        self.logger.info("Codebase indexing complete")
+    def _index_file(self, codebase_path: Path, file_path: Path) -> str:
+        """
+        Index one file if new or changed.
+
+        Returns:
+            "added", "updated", "unchanged" or "failed"
+        """
+        relative_path = str(file_path.relative_to(codebase_path))
+
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except Exception as exc:
+            self.logger.warning(f"Failed to index {file_path}: {exc}")
+            return "failed"
+
+        digest = content_hash(content)
+        previous = self.code_manifest.get_entry(relative_path)
+        if previous and previous.get("hash") == digest:
+            return "unchanged"
+
+        if previous:
+            self._delete_code_chunks(previous.get("chunk_ids", []))
+
+        chunks = chunk_file(relative_path, content)
+        indexed = self._index_chunks(
+            chunks,
+            base_metadata={
+                "file_type": file_path.suffix,
+                "size": len(content),
+                "content_hash": digest,
+                "indexed_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+        if not indexed:
+            self.code_manifest.remove_entry(relative_path)
+            return "failed"
+
+        self.code_manifest.set_entry(
+            relative_path, digest, [chunk.chunk_id for chunk in chunks]
+        )
+        return "updated" if previous else "added"
+
+    def _index_chunks(self, chunks: List[CodeChunk], base_metadata: Dict[str, Any]) -> bool:
+        """
+        Embed and upsert file chunks in one batch.
+
+        Args:
+            chunks: Chunks of a single file
+            base_metadata: File-level metadata merged into every chunk
+
+        Returns:
+            True if all chunks were indexed
+        """
+        if not self.embedding_model or not self.code_collection:
+            return False
+
+        if not chunks:
+            return True
+
+        try:
+            embeddings = self.embedding_model.encode([c.content for c in chunks]).tolist()
+
+            metadatas = [{**base_metadata, **c.to_metadata()} for c in chunks]
+            self.code_collection.upsert(
+                ids=[c.chunk_id for c in chunks],
+                embeddings=embeddings,
+                documents=[c.content for c in chunks],
+                metadatas=metadatas,
+            )
+            for chunk, metadata in zip(chunks, metadatas):
+                self.code_lexical_index.add(chunk.chunk_id, chunk.content, metadata)
+
+            self.result_cache.invalidate("code")
+            self.logger.debug(f"Indexed {len(chunks)} chunks of {chunks[0].path}")
+            return True
+        except Exception as exc:
+            self.logger.error(f"Failed to index chunks of {chunks[0].path}: {exc}")
+            return False
+
+    def _remove_indexed_file(self, relative_path: str) -> None:
+        """Delete all chunks of a file that no longer exists."""
+        chunk_ids = self.code_manifest.remove_entry(relative_path)
+        self._delete_code_chunks(chunk_ids)
+        self.logger.debug(f"Removed from index: {relative_path}")
+
+    def _delete_code_chunks(self, chunk_ids: List[str]) -> None:
+        """Delete chunks from the code collection."""
+        if not chunk_ids or not self.code_collection:
+            return
+
+        try:
+            self.code_collection.delete(list(chunk_ids))
+            for chunk_id in chunk_ids:
+                self.code_lexical_index.remove(chunk_id)
+            self.result_cache.invalidate("code")
+        except Exception as exc:
+            self.logger.error(f"Failed to delete code chunks: {exc}")
 
     def search_code(self, query: str, limit: int = 5) -> List[Dict]:
         """
-        Semantic code search.
+        Hybrid code search.
+
+        Fuses the embedding ranking with a BM25 ranking (which catches exact
+        identifiers) using weighted reciprocal rank fusion. While the
+        embedding model is loading, BM25 alone is used.
 
         Args:
             query: Search query
             limit: Maximum results
 
         Returns:
-            List of matching code snippets
+            List of matching code snippets; "scores" holds the per-source
+            scores ("vector" similarity, "bm25", fused "rrf")
         """
-        if not self.embedding_model or not self.code_collection:
+        if not self.code_collection:
             return []
 
+        model = self._query_model()
+        if model is not None:
+            cached = self.result_cache.get("code", query, limit)
+            if cached is not None:
+                return cached
+
         try:
-            query_embedding = self.embedding_model.encode(query).tolist()
+            candidates = limit * HYBRID_CANDIDATE_FACTOR
+            vector_matches = {}
+            if model is not None:
+                for match in self.code_collection.query(
+                    self._encode_query(query, model), n_results=candidates
+                ):
+                    vector_matches[match["id"]] = match
+            lexical_scores = dict(self.code_lexical_index.search(query, limit=candidates))
 
-            results = self.code_collection.query(
-                query_embeddings=[query_embedding], n_results=limit
+            fused = reciprocal_rank_fusion(
+                {"vector": list(vector_matches), "bm25": list(lexical_scores)},
+                weights=self.hybrid_weights,
             )
 
             search_results = []
-            if results and results.get("ids"):
-                for i in range(len(results["ids"][0])):
-                    search_results.append(
-                        {
-                            "path": results["ids"][0][i],
-                            "content": results["documents"][0][i],
-                            "distance": (
-                                results["distances"][0][i]
-                                if "distances" in results
-                                else 0
-                            ),
-                            "metadata": results["metadatas"][0][i],
-                        }
-                    )
+            for item_id, rrf_score in fused[:limit]:
+                result = self._code_result(
+                    item_id, vector_matches.get(item_id), lexical_scores.get(item_id)
+                )
+                if result:
+                    result["scores"]["rrf"] = rrf_score
+                    search_results.append(result)
 
+            if model is not None:
+                self.result_cache.put("code", query, limit, search_results)
             return search_results
 
         except Exception as exc:
             self.logger.error(f"Code search failed: {exc}")
             return []
 
+    def _code_result(
+        self,
+        item_id: str,
+        vector_match: Optional[Dict[str, Any]],
+        bm25_score: Optional[float],
+    ) -> Optional[Dict[str, Any]]:
+        """Build a search_code result from vector and/or lexical hits."""
+        if vector_match:
+            document, metadata = vector_match["document"], vector_match["metadata"]
+        else:
+            entry = self.code_lexical_index.get(item_id)
+            if entry is None:
+                return None
+            document, metadata = entry
+
+        if vector_match and bm25_score is not None:
+            match_type = "hybrid"
+        else:
+            match_type = "vector" if vector_match else "keyword"
+
+        return {
+            "path": metadata.get("path", item_id),
+            "content": document,
+            "distance": vector_match["distance"] if vector_match else None,
+            "symbol": metadata.get("symbol", ""),
+            "start_line": metadata.get("start_line"),
+            "end_line": metadata.get("end_line"),
+            "metadata": metadata,
+            "match": match_type,
+            "scores": {
+                "vector": 1 - vector_match["distance"] if vector_match else None,
+                "bm25": bm25_score,
+            },
+        }
+
+    def _encode_query(self, query: str, model) -> List[float]:
+        """Encode query text through the embedding LRU cache."""
+        return self.embedding_cache.get_or_compute(
+            query, lambda text: model.encode(text).tolist()
+        )
+
     def index_experience(self, experience: Dict[str, Any]) -> None:
         """
         Index workflow experience.
@@ -317,7 +1148,7 @@ class RAGSystem:
             text = f"{experience['goal']} - {experience['description']}"
             embedding = self.embedding_model.encode(text).tolist()
 
-            self.experience_collection.add(
+            self.experience_collection.upsert(
                 ids=[experience["experience_id"]],
                 embeddings=[embedding],
                 documents=[text],
@@ -331,6 +1162,7 @@ class RAGSystem:
                 ],
             )
 
+            self.result_cache.invalidate("experience")
             self.logger.debug(f"Indexed experience: {experience['experience_id']}")
 
         except Exception as exc:
@@ -347,28 +1179,36 @@ class RAGSystem:
         Returns:
             List of similar experiences
         """
-        if not self.embedding_model or not self.experience_collection:
+        if not self.experience_collection:
             return []
 
-        try:
-            query_embedding = self.embedding_model.encode(query).tolist()
+        model = self._query_model()
+        if model is not None:
+            cached = self.result_cache.get("experience", query, limit)
+            if cached is not None:
+                return cached
 
-            results = self.experience_collection.query(
-                query_embeddings=[query_embedding], n_results=limit
-            )
+        try:
+            if model is not None:
+                matches = self.experience_collection.query(
+                    self._encode_query(query, model), n_results=limit
+                )
+            else:
+                matches = self._keyword_search(self.experience_collection, query, limit)
 
             experiences = []
-            if results and results.get("ids"):
-                for i in range(len(results["ids"][0])):
-                    experiences.append(
-                        {
-                            "experience_id": results["ids"][0][i],
-                            "description": results["documents"][0][i],
-                            "metadata": results["metadatas"][0][i],
-                            "similarity": 1 - results["distances"][0][i],  # Distance to similarity
-                        }
-                    )
+            for match in matches:
+                experiences.append(
+                    {
+                        "experience_id": match["id"],
+                        "description": match["document"],
+                        "metadata": match["metadata"],
+                        "similarity": 1 - match["distance"],  # Distance to similarity
+                    }
+                )
 
+            if model is not None:
+                self.result_cache.put("experience", query, limit, experiences)
             return experiences
 
         except Exception as exc:
@@ -376,7 +1216,7 @@ class RAGSystem:
             return []
 
     async def retrieve_for_task(
-        self, task_description: str, expert_type: str
+        self, task_description: str, expert_type: str, token_budget: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Retrieve context for specific task and expert type.
@@ -384,27 +1224,57 @@ class RAGSystem:
         Args:
             task_description: Task description
             expert_type: Expert type (e.g., "BackendExpert")
+            token_budget: Max tokens of retrieved context. When given, results
+                are deduplicated, merged and MMR-ordered to fit, and the
+                context includes "context_text" and "tokens_used".
 
         Returns:
             Dict with relevant context
         """
         context = {}
+        timed_out: List[str] = []
 
         # Expert-specific code search
         if expert_type == "BackendExpert":
-            context["relevant_code"] = self.search_code(
-                f"backend API {task_description}", limit=5
-            )
+            code_query, code_limit = f"backend API {task_description}", 5
         elif expert_type == "FrontendExpert":
-            context["relevant_code"] = self.search_code(
-                f"frontend component {task_description}", limit=5
-            )
+            code_query, code_limit = f"frontend component {task_description}", 5
         else:
-            context["relevant_code"] = self.search_code(task_description, limit=3)
-
-        # Similar task experiences
-        context["similar_tasks"] = self.search_similar_experiences(
-            f"{expert_type} {task_description}", limit=3
+            code_query, code_limit = task_description, 3
+        if token_budget is not None:
+            code_limit = BUDGETED_SOURCE_LIMIT
+
+        # Code search and similar task experiences run concurrently
+        context["relevant_code"], context["similar_tasks"] = await asyncio.gather(
+            self._run_source(
+                "relevant_code", self.search_code, [code_query, code_limit],
+                self.source_timeout, timed_out,
+            ),
+            self._run_source(
+                "similar_tasks", self.search_similar_experiences,
+                [f"{expert_type} {task_description}", 3],
+                self.source_timeout, timed_out,
+            ),
         )
+        context["timed_out_sources"] = timed_out
+
+        if token_budget is not None:
+            assembled = self.context_assembler.assemble(
+                self._context_items(context), token_budget=token_budget
+            )
+            context["relevant_code"] = [
+                {
+                    **item.data,
+                    "content": item.text,
+                    "start_line": item.start_line,
+                    "end_line": item.end_line,
+                    "symbol": item.symbol,
+                }
+                for item in assembled.by_source("code")
+            ]
+            context["similar_tasks"] = [item.data for item in assembled.by_source("experience")]
+            context["context_text"] = assembled.to_text()
+            context["tokens_used"] = assembled.tokens_used
+            context["token_budget"] = token_budget
 
         return context
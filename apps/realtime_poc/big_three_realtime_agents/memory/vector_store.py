@@ -0,0 +1,118 @@
+"""
+Vector store interface - Pluggable storage backends for RAG.
+
+RAGSystem talks to collections through VectorStore so the heavy
+ChromaDB client can be swapped for the built-in NumPy/mmap index
+(see numpy_vector_store).
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class VectorStore(ABC):
+    """
+    Abstract vector collection.
+
+    Query results are dicts with id, document, metadata and distance
+    (lower is closer).
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Insert or replace entries."""
+
+    @abstractmethod
+    def delete(self, ids: List[str]) -> None:
+        """Delete entries by ID (unknown IDs are ignored)."""
+
+    @abstractmethod
+    def query(self, embedding: List[float], n_results: int) -> List[Dict[str, Any]]:
+        """Return up to n_results nearest entries, closest first."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of live entries."""
+
+    @abstractmethod
+    def get_all(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """All live entries as (id, document, metadata)."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Delete all entries."""
+
+
+class ChromaVectorStore(VectorStore):
+    """
+    VectorStore adapter over a ChromaDB collection.
+
+    Example:
+        >>> store = ChromaVectorStore(client.get_or_create_collection("code"))
+    """
+
+    def __init__(self, collection, client=None):
+        """
+        Initialize adapter.
+
+        Args:
+            collection: ChromaDB collection
+            client: Owning ChromaDB client (needed for reset)
+        """
+        self.collection = collection
+        self.client = client
+        self.name = getattr(collection, "name", "")
+
+    def upsert(self, ids, embeddings, documents, metadatas) -> None:
+        self.collection.upsert(
+            ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas
+        )
+
+    def delete(self, ids) -> None:
+        if ids:
+            self.collection.delete(ids=list(ids))
+
+    def query(self, embedding, n_results) -> List[Dict[str, Any]]:
+        results = self.collection.query(query_embeddings=[embedding], n_results=n_results)
+
+        entries = []
+        if results and results.get("ids"):
+            distances = results.get("distances") or [[0] * len(results["ids"][0])]
+            for i in range(len(results["ids"][0])):
+                entries.append({
+                    "id": results["ids"][0][i],
+                    "document": results["documents"][0][i],
+                    "metadata": results["metadatas"][0][i] or {},
+                    "distance": distances[0][i],
+                })
+        return entries
+
+    def count(self) -> int:
+        return self.collection.count()
+
+    def get_all(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        data = self.collection.get(include=["documents", "metadatas"])
+        return [
+            (item_id, data["documents"][i], data["metadatas"][i] or {})
+            for i, item_id in enumerate(data.get("ids", []))
+        ]
+
+    def reset(self) -> None:
+        if self.client is not None and self.name:
+            self.client.delete_collection(self.name)
+            self.collection = self.client.get_or_create_collection(name=self.name)
+            return
+
+        ids = [item_id for item_id, _, _ in self.get_all()]
+        self.delete(ids)
@@ -12,6 +12,8 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from ..exceptions import ValidationError, MemoryStoreError
+from ..text_normalization import contains_phrase
+from ..learning.minhash_lsh import MinHashLSH, DEFAULT_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
@@ -28,18 +30,25 @@ class WorkflowMemory:
         >>> recent = workflow_mem.get_recent(limit=5)
     """
 
-    def __init__(self, storage_dir: Path):
+    def __init__(self, storage_dir: Path, similarity_threshold: float = DEFAULT_THRESHOLD):
         """
         Initialize workflow memory.
 
         Args:
             storage_dir: Directory for workflow storage
+            similarity_threshold: Min Jaccard similarity for find_similar
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self._index_file = self.storage_dir / "index.json"
         self._index: List[Dict[str, Any]] = self._load_index()
 
+        # MinHash LSH over task descriptions: execution_id -> index entry
+        self._similarity_index = MinHashLSH(threshold=similarity_threshold)
+        self._entries_by_id: Dict[str, Dict[str, Any]] = {}
+        for entry in self._index:
+            self._add_to_similarity_index(entry)
+
     def _sanitize_execution_id(self, execution_id: str) -> str:
         """
         Sanitize execution_id to prevent path traversal attacks.
@@ -113,13 +122,16 @@ class WorkflowMemory:
             logger.error(f"Failed to store execution {safe_id}: {exc}")
             raise MemoryStoreError(f"Cannot store execution: {exc}") from exc
 
-        # Update index
-        self._index.append({
+        # Update index (workflow executions describe their task as "goal")
+        task = execution_data.get("task") or execution_data.get("goal") or ""
+        entry = {
             "execution_id": safe_id,
             "timestamp": execution_data["stored_at"],
-            "task": execution_data.get("task", "")[:100],
+            "task": str(task)[:100],
             "status": execution_data.get("status", "unknown"),
-        })
+        }
+        self._index.append(entry)
+        self._add_to_similarity_index(entry)
         self._save_index()
 
         logger.info(f"Stored workflow execution: {safe_id}")
@@ -166,13 +178,37 @@ class WorkflowMemory:
         return len(self._index)
 
     def search_by_task(self, keyword: str) -> List[Dict[str, Any]]:
-        """Search workflows by task keyword."""
-        keyword_lower = keyword.lower()
+        """Search workflows by task keyword (whole normalized words, e.g. "tests" ~ "testing")."""
         return [
             entry for entry in self._index
-            if keyword_lower in entry.get("task", "").lower()
+            if contains_phrase(entry.get("task", ""), keyword)
         ]
 
+    def find_similar(
+        self, task: str, limit: int = 5, threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find executions of tasks similar to task (MinHash LSH, no scan).
+
+        Args:
+            task: Task description
+            limit: Max results
+            threshold: Override minimum Jaccard similarity
+
+        Returns:
+            Index entries with an added "similarity", most similar first
+        """
+        matches = self._similarity_index.query(task, limit=limit, threshold=threshold)
+        return [
+            {**self._entries_by_id[execution_id], "similarity": similarity}
+            for execution_id, similarity in matches
+        ]
+
+    def _add_to_similarity_index(self, entry: Dict[str, Any]) -> None:
+        execution_id = entry.get("execution_id")
+        if execution_id and self._similarity_index.add(execution_id, entry.get("task", "")):
+            self._entries_by_id[execution_id] = entry
+
     def _load_index(self) -> List[Dict[str, Any]]:
         """Load workflow index."""
         if not self._index_file.exists():
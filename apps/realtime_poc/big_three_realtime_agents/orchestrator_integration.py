@@ -13,11 +13,15 @@ from .agents.pool.pool_integration import PoolIntegrationManager
 from .memory.memory_manager import MemoryManager
 from .workflow.workflow_planner import WorkflowPlanner
 from .workflow.execution_engine import ExecutionEngine
+from .workflow.execution_journal import ExecutionJournal
+from .workflow.result_cache import ResultCache
 from .workflow.workflow_validator import WorkflowValidator
 from .workflow.workflow_reflector import WorkflowReflector
 from .agents.openai.tools_pool import PoolTools
 from .agents.openai.tools_workflow import WorkflowTools
 from .learning.learning_manager import LearningManager
+from .learning.expert_bandit import BanditConfig
+from .learning.duration_predictor import DurationPredictor
 from .security.security_manager import SecurityManager
 
 logger = logging.getLogger(__name__)
@@ -60,23 +64,30 @@ class OrchestratorIntegration:
         self.pool_integration = PoolIntegrationManager(pool_dir, claude_coder)
         self.memory = MemoryManager(storage_dir=self.storage_dir / "memory")
 
+        # Initialize learning system
+        self.learning = LearningManager(
+            storage_dir=self.storage_dir / "learning",
+            bandit_config=BanditConfig(),
+        )
+
         # Initialize workflow system
         self.workflow_planner = WorkflowPlanner(
             self.pool_integration.pool_manager,
-            self.memory
+            self.memory,
+            duration_predictor=DurationPredictor.load(
+                self.storage_dir / "learning" / "duration_model.json"
+            ),
         )
         self.execution_engine = ExecutionEngine(
             self.pool_integration,
-            self.memory
+            self.memory,
+            learning_manager=self.learning,
+            journal=ExecutionJournal(self.storage_dir / "memory" / "journal"),
+            result_cache=ResultCache(self.storage_dir / "memory" / "result_cache"),
         )
         self.workflow_validator = WorkflowValidator()
         self.workflow_reflector = WorkflowReflector()
 
-        # Initialize learning system
-        self.learning = LearningManager(
-            storage_dir=self.storage_dir / "learning"
-        )
-
         # Initialize security system
         self.security = SecurityManager(
             storage_dir=self.storage_dir / "security"
@@ -157,6 +168,7 @@ class OrchestratorIntegration:
             "plan_simple_workflow": self.workflow_tools.plan_simple_workflow,
             "plan_multi_task_workflow": self.workflow_tools.plan_multi_task_workflow,
             "execute_workflow": self.workflow_tools.execute_workflow,
+            "resume_workflow": self.workflow_tools.resume_workflow,
             "get_workflow_status": self.workflow_tools.get_workflow_status,
         }
 
@@ -176,6 +188,29 @@ class OrchestratorIntegration:
 
         self.logger.info("Orchestrator integration shutdown complete")
 
+    def train_duration_model(self) -> Dict[str, Any]:
+        """
+        Retrain the duration model offline and hand it to the planner.
+
+        Returns:
+            Dict with training status and sample count
+        """
+        definitions = self.pool_integration.pool_manager.expert_definitions
+        predictor = self.learning.train_duration_predictor(
+            workflow_memory=self.memory.workflow,
+            tier_lookup=lambda agent_id: getattr(definitions.get(agent_id), "tier", None),
+        )
+
+        if predictor.is_trained:
+            self.workflow_planner.duration_predictor = predictor
+            self.logger.info(f"Duration model retrained on {predictor.sample_count} samples")
+
+        return {
+            "ok": True,
+            "trained": predictor.is_trained,
+            "sample_count": predictor.sample_count,
+        }
+
     def create_pool_agent_with_learning(
         self,
         task: str,
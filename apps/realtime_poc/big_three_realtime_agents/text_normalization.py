@@ -0,0 +1,144 @@
+"""
+Shared text normalization for selection, learning and memory lookups.
+
+Expert selectors, the pattern analyzer, task typing and workflow memory
+all reduce task descriptions to the same terms: lowercase alphanumeric
+tokens from one compiled regex, stop words removed, light suffix stemming
+("testing"/"tests" -> "test"), and word n-grams for multi-word phrases.
+Results are LRU-cached per input string, since the same task text is
+normalized repeatedly on every selection.
+"""
+
+import re
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS: FrozenSet[str] = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from",
+    "in", "into", "is", "it", "its", "of", "on", "or", "that", "the", "this",
+    "to", "was", "were", "with",
+})
+
+# (suffix, replacement), tried in order; stems keep at least _MIN_STEM chars
+_SUFFIXES = (
+    ("ies", "y"),
+    ("ing", ""),
+    ("ed", ""),
+    ("es", ""),
+    ("s", ""),
+)
+_MIN_STEM = 3
+
+# Phrases up to this many words are matched through cached n-gram sets
+MAX_NGRAM = 3
+
+CACHE_SIZE = 4096
+
+
+def stem(word: str) -> str:
+    """
+    Light suffix-stripping stemmer.
+
+    Example:
+        >>> stem("testing"), stem("tests"), stem("dependencies")
+        ('test', 'test', 'dependency')
+    """
+    if word.endswith("ss"):
+        return word
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= _MIN_STEM:
+            if suffix == "es" and not word.endswith(("ches", "shes", "sses", "xes", "zes")):
+                continue
+            return word[: len(word) - len(suffix)] + replacement
+    return word
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def tokenize(text: str, remove_stop_words: bool = True, stemmed: bool = True) -> Tuple[str, ...]:
+    """
+    Normalize text to a tuple of tokens (cached per input).
+
+    Args:
+        text: Input text
+        remove_stop_words: Drop STOP_WORDS
+        stemmed: Apply stem() to each token
+
+    Returns:
+        Tokens in text order
+    """
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if remove_stop_words:
+        tokens = [token for token in tokens if token not in STOP_WORDS]
+    if stemmed:
+        tokens = [stem(token) for token in tokens]
+    return tuple(tokens)
+
+
+def ngrams(tokens: Tuple[str, ...], n: int) -> List[str]:
+    """Space-joined word n-grams of tokens."""
+    return [" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def terms(text: str, max_n: int = MAX_NGRAM) -> FrozenSet[str]:
+    """
+    Tokens and n-grams (up to max_n words) of text, for phrase lookups.
+
+    Example:
+        >>> "machine learn" in terms("Train a machine learning model")
+        True
+    """
+    tokens = tokenize(text)
+    result = set(tokens)
+    for n in range(2, max_n + 1):
+        result.update(ngrams(tokens, n))
+    return frozenset(result)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def phrase_key(phrase: str) -> str:
+    """Normalized form of a keyword or phrase (comparable with terms())."""
+    return " ".join(tokenize(phrase))
+
+
+def contains_phrase(text: str, phrase: str) -> bool:
+    """
+    Whether text contains phrase as whole (normalized) words.
+
+    Unlike substring checks, "api" does not match "rapid", while "tests"
+    matches "testing".
+    """
+    key = phrase_key(phrase)
+    if not key:
+        return False
+    if key.count(" ") < MAX_NGRAM:
+        return key in terms(text)
+    return key in " ".join(tokenize(text))
+
+
+def extract_keywords(text: str, limit: int = 10, min_length: int = 3) -> List[str]:
+    """
+    Distinct normalized keywords of text, in order of appearance.
+
+    Args:
+        text: Input text
+        limit: Max keywords
+        min_length: Min keyword length
+
+    Returns:
+        Keyword list
+    """
+    keywords: List[str] = []
+    for token in tokenize(text):
+        if len(token) >= min_length and token not in keywords:
+            keywords.append(token)
+            if len(keywords) >= limit:
+                break
+    return keywords
+
+
+def normalize_all(phrases: Iterable[str]) -> FrozenSet[str]:
+    """Normalized forms of several keywords/phrases."""
+    return frozenset(key for key in (phrase_key(p) for p in phrases) if key)
@@ -33,6 +33,12 @@ GROQ_API_TIMEOUT = 20  # Groq API (fast inference)
 AGENT_CREATION_TIMEOUT = 60  # Agent initialization
 AGENT_EXECUTION_TIMEOUT = 300  # 5 minutes for task execution
 AGENT_CLEANUP_TIMEOUT = 10  # Cleanup operations
+AGENT_POOL_ACQUIRE_TIMEOUT = 120  # Wait for a free pool instance
+
+# Workflow timeouts (per-task timeouts are derived from plan estimates)
+WORKFLOW_TASK_TIMEOUT_MIN = 60  # Floor for a derived task timeout
+WORKFLOW_TASK_TIMEOUT_MAX = 3600  # 1 hour cap for a single workflow task
+WORKFLOW_EXECUTION_TIMEOUT = 6 * 3600  # 6 hours default workflow deadline
 
 # Browser automation timeouts
 BROWSER_STARTUP_TIMEOUT = 30  # Browser launch
@@ -143,6 +149,10 @@ def get_timeout(operation: str, default: float = 30.0) -> float:
         'agent_creation': AGENT_CREATION_TIMEOUT,
         'agent_execution': AGENT_EXECUTION_TIMEOUT,
         'agent_cleanup': AGENT_CLEANUP_TIMEOUT,
+        'agent_pool_acquire': AGENT_POOL_ACQUIRE_TIMEOUT,
+        'workflow_task_min': WORKFLOW_TASK_TIMEOUT_MIN,
+        'workflow_task_max': WORKFLOW_TASK_TIMEOUT_MAX,
+        'workflow_execution': WORKFLOW_EXECUTION_TIMEOUT,
 
         # Browser
         'browser_startup': BROWSER_STARTUP_TIMEOUT,
@@ -7,6 +7,11 @@ for complex multi-agent tasks.
 Modules:
     workflow_planner: Task decomposition and planning
     execution_engine: Workflow execution with strategies
+    dag_scheduler: Dependency-driven task scheduling
+    critical_path: Critical path and slack analysis
+    execution_journal: Checkpoint journal for resumable executions
+    result_cache: Content-addressed memoization of task results
+    pipeline_runner: Streaming execution of PIPELINE stages
     workflow_models: Data structures for workflows
 
 Example:
@@ -20,6 +25,7 @@ Example:
 
 from .workflow_models import (
     ExecutionStrategy,
+    FailurePolicy,
     TaskStatus,
     WorkflowTask,
     WorkflowStage,
@@ -27,13 +33,23 @@ from .workflow_models import (
 )
 from .workflow_planner import WorkflowPlanner
 from .execution_engine import ExecutionEngine
+from .dag_scheduler import DAGScheduler
+from .critical_path import CriticalPath, analyze_critical_path
+from .execution_journal import ExecutionJournal
+from .result_cache import ResultCache
 
 __all__ = [
     "ExecutionStrategy",
+    "FailurePolicy",
     "TaskStatus",
     "WorkflowTask",
     "WorkflowStage",
     "WorkflowPlan",
     "WorkflowPlanner",
     "ExecutionEngine",
+    "DAGScheduler",
+    "CriticalPath",
+    "analyze_critical_path",
+    "ExecutionJournal",
+    "ResultCache",
 ]
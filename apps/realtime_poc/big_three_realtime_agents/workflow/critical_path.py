@@ -0,0 +1,135 @@
+"""
+Critical path analysis - Slack of workflow tasks from their dependencies.
+
+A forward pass over the dependency graph (topological order) gives each
+task's earliest start from the estimated durations, a backward pass gives
+the longest remaining chain from each task to the end. A task's slack is
+how long it can be delayed without extending the workflow; zero-slack
+tasks form the critical path. The DAG scheduler starts ready tasks in
+ascending slack order, so when pool capacity is constrained the longest
+chain is not left waiting behind short side branches.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .dag_scheduler import validate_dependencies
+from .workflow_models import WorkflowPlan, WorkflowTask
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CriticalPath:
+    """
+    Result of critical path analysis.
+
+    Attributes:
+        length: Estimated makespan with unlimited capacity (seconds)
+        tasks: Task IDs on the critical path, in execution order
+        earliest_start: task_id -> earliest start offset (seconds)
+        slack: task_id -> seconds the task can slip without delaying the end
+        remaining: task_id -> longest chain from the task's start to the end
+    """
+    length: int
+    tasks: List[str]
+    earliest_start: Dict[str, int]
+    slack: Dict[str, int]
+    remaining: Dict[str, int]
+
+
+def analyze_critical_path(tasks: List[WorkflowTask]) -> CriticalPath:
+    """
+    Compute earliest starts, slack and the critical path.
+
+    Args:
+        tasks: Workflow tasks (durations from estimated_duration)
+
+    Returns:
+        CriticalPath
+
+    Raises:
+        WorkflowValidationError: On unknown dependencies or cycles
+
+    Example:
+        >>> analysis = analyze_critical_path(plan.get_all_tasks())
+        >>> analysis.tasks, analysis.slack["task_3"]
+        (['task_1', 'task_2'], 180)
+    """
+    order = validate_dependencies(tasks)
+    by_id = {task.task_id: task for task in tasks}
+    duration = {task.task_id: max(0, task.estimated_duration or 0) for task in tasks}
+
+    dependents: Dict[str, List[str]] = {task_id: [] for task_id in by_id}
+    for task in tasks:
+        for dependency in task.dependencies:
+            dependents[dependency].append(task.task_id)
+
+    earliest_start: Dict[str, int] = {}
+    for task_id in order:
+        earliest_start[task_id] = max(
+            (earliest_start[d] + duration[d] for d in by_id[task_id].dependencies), default=0
+        )
+
+    remaining: Dict[str, int] = {}
+    for task_id in reversed(order):
+        remaining[task_id] = duration[task_id] + max(
+            (remaining[d] for d in dependents[task_id]), default=0
+        )
+
+    length = max(remaining.values(), default=0)
+    slack = {
+        task_id: length - remaining[task_id] - earliest_start[task_id] for task_id in order
+    }
+
+    # Walk zero-slack tasks from a zero-slack root, preferring plan order
+    path: List[str] = []
+    position = {task.task_id: i for i, task in enumerate(tasks)}
+    current: Optional[str] = next(
+        (t.task_id for t in tasks if not t.dependencies and slack[t.task_id] == 0), None
+    )
+    while current is not None:
+        path.append(current)
+        finish = earliest_start[current] + duration[current]
+        current = min(
+            (
+                d for d in dependents[current]
+                if slack[d] == 0 and earliest_start[d] == finish
+            ),
+            key=position.get,
+            default=None,
+        )
+
+    return CriticalPath(
+        length=length,
+        tasks=path,
+        earliest_start=earliest_start,
+        slack=slack,
+        remaining=remaining,
+    )
+
+
+def annotate_plan(plan: WorkflowPlan) -> CriticalPath:
+    """
+    Store slack on the plan's tasks and the critical path on the plan.
+
+    Args:
+        plan: Workflow plan
+
+    Returns:
+        CriticalPath of the plan's tasks
+
+    Raises:
+        WorkflowValidationError: On unknown dependencies or cycles
+    """
+    tasks = plan.get_all_tasks()
+    analysis = analyze_critical_path(tasks)
+    for task in tasks:
+        task.slack = analysis.slack[task.task_id]
+    plan.critical_path = analysis.tasks
+
+    logger.debug(
+        f"Critical path of {plan.plan_id}: {' -> '.join(analysis.tasks)} ({analysis.length}s)"
+    )
+    return analysis
@@ -0,0 +1,260 @@
+"""
+DAG scheduler - Dependency-driven task execution.
+
+Starts each workflow task as soon as all of its dependencies have
+completed, instead of waiting on stage barriers. Concurrency is bounded
+globally and per expert (pool capacity); cycles and unknown dependencies
+are rejected before anything runs, and a failed task marks every task
+that transitively depends on it as skipped. Ready tasks wait in a heap
+ordered by slack (see critical_path), so critical tasks get free slots
+first. In fail-fast mode the first failure cancels running tasks and
+everything not yet started.
+"""
+
+import asyncio
+import heapq
+import logging
+from collections import deque
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+
+from ..exceptions import WorkflowValidationError
+from .workflow_models import WorkflowTask
+
+logger = logging.getLogger(__name__)
+
+# Max tasks running at once across the workflow
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def validate_dependencies(tasks: List[WorkflowTask]) -> List[str]:
+    """
+    Check that dependencies exist and form a DAG.
+
+    Args:
+        tasks: Workflow tasks
+
+    Returns:
+        Task IDs in a valid topological order
+
+    Raises:
+        WorkflowValidationError: On duplicate IDs, unknown dependencies or cycles
+    """
+    by_id = {}
+    for task in tasks:
+        if task.task_id in by_id:
+            raise WorkflowValidationError(f"Duplicate task ID: {task.task_id}")
+        by_id[task.task_id] = task
+
+    indegree = {task_id: 0 for task_id in by_id}
+    dependents: Dict[str, List[str]] = {task_id: [] for task_id in by_id}
+    for task in tasks:
+        for dependency in task.dependencies:
+            if dependency not in by_id:
+                raise WorkflowValidationError(
+                    f"Task {task.task_id} depends on unknown task {dependency}"
+                )
+            indegree[task.task_id] += 1
+            dependents[dependency].append(task.task_id)
+
+    # Kahn's algorithm: whatever is never freed sits on a cycle
+    queue = deque(task_id for task_id, degree in indegree.items() if degree == 0)
+    order = []
+    while queue:
+        task_id = queue.popleft()
+        order.append(task_id)
+        for dependent in dependents[task_id]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                queue.append(dependent)
+
+    if len(order) < len(tasks):
+        cyclic = sorted(task_id for task_id, degree in indegree.items() if degree > 0)
+        raise WorkflowValidationError(f"Dependency cycle among tasks: {', '.join(cyclic)}")
+
+    return order
+
+
+class DAGScheduler:
+    """
+    Run tasks in dependency order with bounded concurrency.
+
+    Among ready tasks, lower slack starts first (tasks without slack, i.e.
+    not analyzed, go last); ties keep plan order.
+
+    Example:
+        >>> scheduler = DAGScheduler(engine._execute_task, max_concurrency=4)
+        >>> results = await scheduler.run(plan.get_all_tasks())
+    """
+
+    def __init__(
+        self,
+        execute_task: Callable[[WorkflowTask], Awaitable[Dict[str, Any]]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        expert_capacity: Optional[Callable[[str], Optional[int]]] = None,
+        fail_fast: bool = False,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            execute_task: Coroutine function running one task, returning a
+                result dict with "status" ("completed" or "failed")
+            max_concurrency: Max tasks running at once
+            expert_capacity: Optional agent_id -> max concurrent tasks
+                (None = unlimited), e.g. the pool's max_instances
+            fail_fast: Cancel all remaining work on the first failure
+                (otherwise only dependents of a failed task are skipped)
+        """
+        self.execute_task = execute_task
+        self.max_concurrency = max(1, max_concurrency)
+        self.expert_capacity = expert_capacity
+        self.fail_fast = fail_fast
+        self.logger = logger
+
+    async def run(self, tasks: List[WorkflowTask]) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute tasks, each as soon as its dependencies completed.
+
+        Args:
+            tasks: Workflow tasks (dependencies refer to task IDs in this list)
+
+        Returns:
+            Dict of task_id -> result, in task list order
+
+        Raises:
+            WorkflowValidationError: If dependencies are invalid (nothing runs)
+        """
+        validate_dependencies(tasks)
+
+        by_id = {task.task_id: task for task in tasks}
+        remaining = {task.task_id: len(task.dependencies) for task in tasks}
+        dependents: Dict[str, List[str]] = {task.task_id: [] for task in tasks}
+        for task in tasks:
+            for dependency in task.dependencies:
+                dependents[dependency].append(task.task_id)
+
+        position = {task.task_id: i for i, task in enumerate(tasks)}
+
+        def priority(task_id: str):
+            slack = by_id[task_id].slack
+            return (slack if slack is not None else float("inf"), position[task_id], task_id)
+
+        ready = [priority(task.task_id) for task in tasks if not task.dependencies]
+        heapq.heapify(ready)
+        running: Dict[asyncio.Task, str] = {}
+        busy: Dict[str, int] = {}
+        results: Dict[str, Dict[str, Any]] = {}
+
+        while ready or running:
+            # Launch ready tasks (lowest slack first) while global and expert slots allow
+            blocked = []
+            while ready and len(running) < self.max_concurrency:
+                entry = heapq.heappop(ready)
+                task_id = entry[-1]
+                agent_id = by_id[task_id].agent_id
+                if not self._has_capacity(agent_id, busy):
+                    blocked.append(entry)
+                    continue
+                busy[agent_id] = busy.get(agent_id, 0) + 1
+                running[asyncio.ensure_future(self._run_task(by_id[task_id]))] = task_id
+            for entry in blocked:
+                heapq.heappush(ready, entry)
+
+            if not running:
+                # Only possible if an expert has zero capacity
+                for *_, task_id in sorted(ready):
+                    results[task_id] = self._skip(
+                        by_id[task_id], f"No capacity for expert {by_id[task_id].agent_id}"
+                    )
+                ready.clear()
+                break
+
+            try:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                await self._cancel_running(running)
+                raise
+
+            failed_id = None
+            for future in done:
+                task_id = running.pop(future)
+                busy[by_id[task_id].agent_id] -= 1
+                result = future.result()
+                results[task_id] = result
+
+                if result.get("status") == "completed":
+                    for dependent in dependents[task_id]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0 and dependent not in results:
+                            heapq.heappush(ready, priority(dependent))
+                else:
+                    failed_id = failed_id or task_id
+                    self._skip_dependents(task_id, by_id, dependents, results)
+
+            if failed_id and self.fail_fast:
+                reason = f"Cancelled: task {failed_id} failed (fail-fast)"
+                for task_id, outcome in (await self._cancel_running(running)).items():
+                    if isinstance(outcome, dict):
+                        results[task_id] = outcome  # finished before the cancel landed
+                    else:
+                        results[task_id] = self._cancel(by_id[task_id], reason)
+                for task in tasks:
+                    if task.task_id not in results:
+                        results[task.task_id] = self._cancel(task, reason)
+                break
+
+        return {task.task_id: results[task.task_id] for task in tasks if task.task_id in results}
+
+    async def _run_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        """Run one task, converting exceptions into failed results."""
+        try:
+            return await self.execute_task(task)
+        except Exception as exc:
+            self.logger.error(f"Task {task.task_id} failed with exception: {exc}")
+            task.fail(str(exc))
+            return {"task_id": task.task_id, "status": "failed", "error": str(exc)}
+
+    async def _cancel_running(self, running: Dict[asyncio.Task, str]) -> Dict[str, Any]:
+        """
+        Cancel running tasks and wait until they have cleaned up.
+
+        Returns:
+            Dict of task_id -> result, or the exception a task ended with
+        """
+        for future in running:
+            future.cancel()
+        outcomes = await asyncio.gather(*running, return_exceptions=True)
+        cancelled = dict(zip(running.values(), outcomes))
+        running.clear()
+        return cancelled
+
+    def _has_capacity(self, agent_id: str, busy: Dict[str, int]) -> bool:
+        if self.expert_capacity is None:
+            return True
+        capacity = self.expert_capacity(agent_id)
+        return capacity is None or busy.get(agent_id, 0) < capacity
+
+    def _skip_dependents(
+        self,
+        failed_id: str,
+        by_id: Dict[str, WorkflowTask],
+        dependents: Dict[str, List[str]],
+        results: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Mark all transitive dependents of a failed task as skipped."""
+        stack = list(dependents[failed_id])
+        while stack:
+            task_id = stack.pop()
+            if task_id in results:
+                continue
+            results[task_id] = self._skip(by_id[task_id], f"Dependency {failed_id} failed")
+            stack.extend(dependents[task_id])
+
+    def _cancel(self, task: WorkflowTask, reason: str) -> Dict[str, Any]:
+        task.cancel(reason)
+        return {"task_id": task.task_id, "status": "cancelled", "error": reason}
+
+    def _skip(self, task: WorkflowTask, reason: str) -> Dict[str, Any]:
+        task.skip(reason)
+        self.logger.warning(f"Skipped task {task.task_id}: {reason}")
+        return {"task_id": task.task_id, "status": "skipped", "error": reason}
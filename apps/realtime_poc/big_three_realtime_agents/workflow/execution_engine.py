@@ -1,63 +1,232 @@
 """
 Workflow execution engine.
 
-Executes workflow plans with support for sequential and parallel
-execution strategies.
+Executes workflow plans with support for sequential, parallel and
+pipeline execution strategies. Plans whose tasks declare dependencies run
+through the DAG scheduler instead of stage by stage. Tasks run on agent
+pool instances: the assigned expert is acquired (waiting while the pool
+is saturated), the task is dispatched through the InstanceExecutor, and
+the instance is released on every exit path. With an ExecutionJournal,
+every task start and result is checkpointed so an interrupted execution
+can be resumed, reusing completed results. With a ResultCache, tasks
+flagged cacheable reuse results of identical earlier runs.
+
+Every task runs under a timeout derived from its duration estimate, and
+the whole workflow under a deadline that bounds task timeouts and pool
+waits. The plan's failure policy decides whether a failure cancels
+running siblings (fail fast) or lets them finish (continue on error).
 """
 
 import asyncio
+import contextvars
 import logging
 import uuid
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from ..exceptions import (
+    ExpertNotFoundError,
+    PoolExhaustedError,
+    WorkflowExecutionError,
+    WorkflowTimeoutError,
+)
+from ..timeouts import (
+    AGENT_POOL_ACQUIRE_TIMEOUT,
+    WORKFLOW_EXECUTION_TIMEOUT,
+    WORKFLOW_TASK_TIMEOUT_MAX,
+    WORKFLOW_TASK_TIMEOUT_MIN,
+)
+
 from .workflow_models import (
     WorkflowPlan,
     WorkflowStage,
     WorkflowTask,
     ExecutionStrategy,
+    FailurePolicy,
     TaskStatus,
 )
+from .dag_scheduler import DAGScheduler, DEFAULT_MAX_CONCURRENCY
+from .critical_path import annotate_plan
+from .execution_journal import ExecutionJournal, JournalState, idempotency_key
+from .result_cache import ResultCache
+from .pipeline_runner import PipelineRunner
 
 logger = logging.getLogger(__name__)
 
+# Backoff between pool acquisition attempts while the pool is saturated
+ACQUIRE_BACKOFF_INITIAL = 0.05
+ACQUIRE_BACKOFF_MAX = 2.0
+
+# Derived task timeout = slowest estimate (P50 or P90) x factor, clamped to
+# [WORKFLOW_TASK_TIMEOUT_MIN, WORKFLOW_TASK_TIMEOUT_MAX]
+TASK_TIMEOUT_FACTOR = 3.0
+
+# Run-specific result fields not stored in the result cache
+_UNCACHED_FIELDS = (
+    "task_id", "instance_id", "started_at", "duration_seconds", "idempotency_key", "attempt",
+)
+
+
+@dataclass
+class _Checkpoint:
+    """Journal state of the workflow being executed."""
+    execution_id: str
+    completed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    attempts: Dict[str, int] = field(default_factory=dict)
+
+
+# Per-workflow state of the workflow being executed (set per execute_plan):
+# concurrency budget, deadline (event loop time) and journal checkpoint
+_workflow_budget: contextvars.ContextVar[Optional[asyncio.Semaphore]] = (
+    contextvars.ContextVar("workflow_budget", default=None)
+)
+_workflow_deadline: contextvars.ContextVar[Optional[float]] = (
+    contextvars.ContextVar("workflow_deadline", default=None)
+)
+_workflow_checkpoint: contextvars.ContextVar[Optional[_Checkpoint]] = (
+    contextvars.ContextVar("workflow_checkpoint", default=None)
+)
+
 
 class ExecutionEngine:
     """
     Execute workflow plans with different strategies.
 
-    Supports sequential and parallel execution with basic error handling.
+    Supports sequential, parallel and pipeline execution with basic error
+    handling. When any task declares dependencies (or plan.metadata["scheduler"]
+    is "dag"), declared dependencies alone order execution: each task starts
+    as soon as its dependencies complete, across stages, and stages only
+    group the results. Plans with PIPELINE stages always run stage by stage.
 
     Example:
-        >>> engine = ExecutionEngine(pool_integration, memory)
+        >>> engine = ExecutionEngine(pool_integration, memory, journal=journal)
         >>> result = await engine.execute_plan(plan)
+        >>> # after a restart:
+        >>> result = await engine.resume(journal.unfinished()[0])
     """
 
-    def __init__(self, pool_integration, memory_manager):
+    def __init__(
+        self,
+        pool_integration,
+        memory_manager,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        learning_manager=None,
+        acquire_timeout: float = AGENT_POOL_ACQUIRE_TIMEOUT,
+        journal: Optional[ExecutionJournal] = None,
+        result_cache: Optional[ResultCache] = None,
+        workflow_timeout: float = WORKFLOW_EXECUTION_TIMEOUT,
+    ):
         """
         Initialize execution engine.
 
         Args:
-            pool_integration: Pool integration manager
+            pool_integration: Pool integration manager (pool_manager + executor)
             memory_manager: Memory manager for context
+            max_concurrency: Per-workflow budget of tasks running at once
+            learning_manager: Optional LearningManager to record task outcomes
+            acquire_timeout: Max seconds to wait for a free expert instance
+            journal: Optional ExecutionJournal for checkpoint/resume
+            result_cache: Optional ResultCache for tasks flagged cacheable
+            workflow_timeout: Default workflow deadline in seconds
         """
         self.pool = pool_integration
         self.memory = memory_manager
+        self.max_concurrency = max_concurrency
+        self.learning = learning_manager
+        self.acquire_timeout = acquire_timeout
+        self.journal = journal
+        self.result_cache = result_cache
+        self.workflow_timeout = workflow_timeout
         self.logger = logger
 
-    async def execute_plan(self, plan: WorkflowPlan) -> Dict[str, Any]:
+        # Notified whenever this engine releases an instance
+        self._released = asyncio.Condition()
+
+    async def execute_plan(
+        self, plan: WorkflowPlan, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Execute complete workflow plan.
 
         Args:
             plan: Workflow plan to execute
+            deadline_seconds: Workflow deadline (default: plan.metadata
+                "deadline_seconds", else the engine's workflow_timeout)
 
         Returns:
             Execution result with status and outcomes
         """
+        return await self._execute(
+            plan, f"exec_{uuid.uuid4().hex[:8]}", deadline_seconds=deadline_seconds
+        )
+
+    async def resume(
+        self, execution_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Resume an interrupted execution from its journal.
+
+        Completed tasks keep their journaled results; tasks that were in
+        flight, failed or never started run again (in-flight tasks as a new
+        attempt under the same idempotency key).
+
+        Args:
+            execution_id: Execution to resume
+            deadline_seconds: Deadline for the resumed run (a fresh budget)
+
+        Returns:
+            Execution result with status and outcomes
+
+        Raises:
+            WorkflowExecutionError: If no journal is configured or found
+        """
+        if self.journal is None:
+            raise WorkflowExecutionError("Cannot resume without an execution journal")
+
+        state = self.journal.load(execution_id)
+        if state is None:
+            raise WorkflowExecutionError(f"No journal for execution {execution_id}")
+
+        plan = WorkflowPlan.from_dict(state.plan)
+        self.logger.info(
+            f"Resuming {execution_id} ({plan.plan_id}): {len(state.completed)} tasks done, "
+            f"{len(state.in_flight)} interrupted"
+        )
+        await self._journal("resumed", execution_id)
+        return await self._execute(plan, execution_id, state, deadline_seconds)
+
+    async def _execute(
+        self,
+        plan: WorkflowPlan,
+        execution_id: str,
+        state: Optional[JournalState] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Execute plan under execution_id (resuming from state if given)."""
         self.logger.info(f"Executing workflow: {plan.plan_id}")
-        execution_id = f"exec_{uuid.uuid4().hex[:8]}"
         start_time = datetime.now()
+        budget_token = _workflow_budget.set(asyncio.Semaphore(max(1, self.max_concurrency)))
+
+        if deadline_seconds is None:
+            deadline_seconds = plan.metadata.get("deadline_seconds")
+        if deadline_seconds is None:
+            deadline_seconds = self.workflow_timeout
+        deadline_token = _workflow_deadline.set(
+            asyncio.get_running_loop().time() + deadline_seconds
+        )
+        fail_fast = plan.failure_policy == FailurePolicy.FAIL_FAST
+
+        checkpoint = None
+        if self.journal is not None:
+            if state is None:
+                await self._journal("start", execution_id, plan.to_dict())
+                checkpoint = _Checkpoint(execution_id)
+            else:
+                checkpoint = _Checkpoint(
+                    execution_id, dict(state.completed), dict(state.attempts)
+                )
+        checkpoint_token = _workflow_checkpoint.set(checkpoint)
 
         results = {
             "execution_id": execution_id,
@@ -66,24 +235,48 @@ class ExecutionEngine:
             "started_at": start_time.isoformat(),
             "stage_results": [],
             "status": "running",
+            "failure_policy": plan.failure_policy.value,
+            "deadline_seconds": deadline_seconds,
         }
+        if state is not None:
+            results["resumed"] = True
+            results["restored_tasks"] = len(state.completed)
 
-        # Execute each stage
-        for stage in plan.stages:
-            stage_result = await self._execute_stage(stage, plan)
-            results["stage_results"].append(stage_result)
-
-            # Check for failures
-            if stage_result["status"] == "failed" and not stage.continue_on_failure:
-                results["status"] = "failed"
-                break
+        try:
+            if self._uses_dag(plan):
+                results["scheduler"] = "dag"
+                results["stage_results"] = await self._execute_dag(plan, fail_fast)
+                results["critical_path"] = plan.critical_path
+                if any(
+                    stage_result["status"] == "failed"
+                    and (fail_fast or not stage.continue_on_failure)
+                    for stage, stage_result in zip(plan.stages, results["stage_results"])
+                ):
+                    results["status"] = "failed"
+            else:
+                # Execute each stage
+                for stage in plan.stages:
+                    stage_result = await self._execute_stage(stage, plan, fail_fast)
+                    results["stage_results"].append(stage_result)
+
+                    # Check for failures
+                    if stage_result["status"] == "failed" and (
+                        fail_fast or not stage.continue_on_failure
+                    ):
+                        results["status"] = "failed"
+                        break
+            deadline_exceeded = self._deadline_exceeded()
+        finally:
+            _workflow_budget.reset(budget_token)
+            _workflow_checkpoint.reset(checkpoint_token)
+            _workflow_deadline.reset(deadline_token)
 
         # Determine overall status
-        if results["status"] != "failed":
-            if plan.is_complete():
-                results["status"] = "completed"
-            elif plan.has_failures():
-                results["status"] = "partial"
+        if deadline_exceeded and not plan.is_complete():
+            results["status"] = "failed"
+            results["error"] = f"Workflow deadline of {deadline_seconds}s exceeded"
+        elif results["status"] != "failed":
+            results["status"] = "completed" if plan.is_complete() else "partial"
 
         results["completed_at"] = datetime.now().isoformat()
         results["duration_seconds"] = (
@@ -92,6 +285,8 @@ class ExecutionEngine:
 
         # Store in workflow memory
         self.memory.workflow.store_execution(execution_id, results)
+        if checkpoint is not None:
+            await self._journal("finish", execution_id, results["status"])
 
         self.logger.info(
             f"Workflow {plan.plan_id} {results['status']}: "
@@ -100,24 +295,89 @@ class ExecutionEngine:
 
         return results
 
+    def _uses_dag(self, plan: WorkflowPlan) -> bool:
+        """Whether plan runs through the DAG scheduler."""
+        if any(stage.strategy == ExecutionStrategy.PIPELINE for stage in plan.stages):
+            return False
+        if plan.metadata.get("scheduler") == "dag":
+            return True
+        return any(task.dependencies for task in plan.get_all_tasks())
+
+    async def _execute_dag(
+        self, plan: WorkflowPlan, fail_fast: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute all plan tasks in dependency order, ignoring stage barriers.
+
+        Slack is recomputed first so critical tasks get pool capacity first.
+
+        Raises:
+            WorkflowValidationError: On unknown dependencies or cycles
+        """
+        annotate_plan(plan)
+        scheduler = DAGScheduler(
+            self._execute_task,
+            max_concurrency=self.max_concurrency,
+            expert_capacity=self._expert_capacity,
+            fail_fast=fail_fast,
+        )
+        task_results = await scheduler.run(plan.get_all_tasks())
+
+        stage_results = []
+        for stage in plan.stages:
+            stage_task_results = [task_results[task.task_id] for task in stage.tasks]
+            stage_results.append(self._summarize_stage(stage, stage_task_results))
+        return stage_results
+
+    def _working_directory(self, agent_id: str) -> Optional[str]:
+        """Working directory of an expert from the pool definitions."""
+        pool_manager = getattr(self.pool, "pool_manager", None)
+        definitions = getattr(pool_manager, "expert_definitions", None) or {}
+        return getattr(definitions.get(agent_id), "working_directory", None)
+
+    def _expert_capacity(self, agent_id: str):
+        """Max concurrent instances of an expert in the pool (None if unknown)."""
+        pool_manager = getattr(self.pool, "pool_manager", None)
+        definitions = getattr(pool_manager, "expert_definitions", None) or {}
+        return getattr(definitions.get(agent_id), "max_instances", None)
+
     async def _execute_stage(
         self,
         stage: WorkflowStage,
-        plan: WorkflowPlan
+        plan: WorkflowPlan,
+        fail_fast: bool = False
     ) -> Dict[str, Any]:
         """Execute a workflow stage."""
         self.logger.info(f"Executing stage: {stage.name} ({stage.strategy.value})")
 
+        if stage.strategy == ExecutionStrategy.PIPELINE:
+            runner = PipelineRunner(self._execute_task, fail_fast=fail_fast)
+            task_results, item_results = await runner.run(stage)
+            stage_result = self._summarize_stage(stage, task_results)
+            stage_result["item_results"] = item_results
+            if any(r["status"] != "completed" for r in item_results):
+                stage_result["status"] = "failed"
+            return stage_result
+
         if stage.strategy == ExecutionStrategy.PARALLEL:
-            task_results = await self._execute_parallel(stage.tasks)
+            task_results = await self._execute_parallel(stage.tasks, fail_fast)
         else:
-            task_results = await self._execute_sequential(stage.tasks)
+            task_results = await self._execute_sequential(stage.tasks, fail_fast)
 
-        # Check status
+        return self._summarize_stage(stage, task_results)
+
+    def _summarize_stage(
+        self,
+        stage: WorkflowStage,
+        task_results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build a stage result from its task results."""
         failed = sum(1 for r in task_results if r.get("status") == "failed")
         completed = sum(1 for r in task_results if r.get("status") == "completed")
+        skipped = sum(1 for r in task_results if r.get("status") == "skipped")
+        cancelled = sum(1 for r in task_results if r.get("status") == "cancelled")
 
-        stage_status = "completed" if failed == 0 else "failed"
+        stage_status = "completed" if failed == skipped == cancelled == 0 else "failed"
 
         return {
             "stage_id": stage.stage_id,
@@ -125,73 +385,379 @@ class ExecutionEngine:
             "status": stage_status,
             "completed": completed,
             "failed": failed,
+            "skipped": skipped,
+            "cancelled": cancelled,
             "task_results": task_results,
         }
 
     async def _execute_sequential(
         self,
-        tasks: List[WorkflowTask]
+        tasks: List[WorkflowTask],
+        fail_fast: bool = False
     ) -> List[Dict[str, Any]]:
-        """Execute tasks sequentially."""
+        """Execute tasks sequentially (fail-fast cancels the rest on failure)."""
         results = []
-        for task in tasks:
+        for i, task in enumerate(tasks):
             result = await self._execute_task(task)
             results.append(result)
+
+            if fail_fast and result.get("status") != "completed":
+                reason = f"Cancelled: task {task.task_id} failed (fail-fast)"
+                results.extend(self._cancelled(rest, reason) for rest in tasks[i + 1:])
+                break
         return results
 
     async def _execute_parallel(
         self,
-        tasks: List[WorkflowTask]
+        tasks: List[WorkflowTask],
+        fail_fast: bool = False
     ) -> List[Dict[str, Any]]:
-        """Execute tasks in parallel using asyncio.gather."""
+        """
+        Execute tasks concurrently.
+
+        With fail_fast, the first failure cancels the still running tasks
+        (their instances are released before this returns).
+        """
         self.logger.info(f"Executing {len(tasks)} tasks in parallel")
 
-        # Create tasks for parallel execution
-        task_coroutines = [self._execute_task(task) for task in tasks]
+        futures = {asyncio.ensure_future(self._execute_task(task)): task for task in tasks}
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = set(futures)
 
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*task_coroutines, return_exceptions=True)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = None
+                for future in done:
+                    task = futures[future]
+                    results[task.task_id] = self._parallel_result(task, future)
+                    if results[task.task_id].get("status") != "completed":
+                        failed = failed or task
+
+                if failed and fail_fast and pending:
+                    reason = f"Cancelled: task {failed.task_id} failed (fail-fast)"
+                    self.logger.warning(f"{reason}; cancelling {len(pending)} running task(s)")
+                    await self._cancel_futures(pending)
+                    for future in pending:
+                        task = futures[future]
+                        if future.cancelled():
+                            results[task.task_id] = self._cancelled(task, reason)
+                        else:
+                            results[task.task_id] = self._parallel_result(task, future)
+                    pending = set()
+        except asyncio.CancelledError:
+            await self._cancel_futures(pending)
+            raise
+
+        return [results[task.task_id] for task in tasks]
+
+    def _parallel_result(self, task: WorkflowTask, future: asyncio.Future) -> Dict[str, Any]:
+        """Result of a finished parallel task (exceptions become failed results)."""
+        exc = future.exception()
+        if exc is None:
+            return future.result()
+
+        self.logger.error(f"Task {task.task_id} failed with exception: {exc}")
+        return {
+            "task_id": task.task_id,
+            "status": "failed",
+            "error": str(exc)
+        }
 
-        # Process results and handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.error(f"Task {tasks[i].task_id} failed with exception: {result}")
-                # Create error result
-                error_result = {
-                    "task_id": tasks[i].task_id,
-                    "status": "failed",
-                    "error": str(result)
-                }
-                processed_results.append(error_result)
-            else:
-                processed_results.append(result)
+    async def _cancel_futures(self, futures) -> None:
+        """Cancel futures and wait for their cleanup (instance release)."""
+        for future in futures:
+            future.cancel()
+        await asyncio.gather(*futures, return_exceptions=True)
 
-        return processed_results
+    def _cancelled(self, task: WorkflowTask, reason: str) -> Dict[str, Any]:
+        """Mark a task cancelled and build its result."""
+        task.cancel(reason)
+        return {
+            "task_id": task.task_id,
+            "status": "cancelled",
+            "agent_id": task.agent_id,
+            "description": task.description,
+            "error": reason,
+        }
 
     async def _execute_task(self, task: WorkflowTask) -> Dict[str, Any]:
-        """Execute a single task."""
+        """
+        Execute a single task on a pool instance of its assigned expert.
+
+        Waits for the workflow's concurrency budget, then for a free
+        instance (backpressure while the pool is saturated). The instance
+        is released on success, failure and cancellation alike.
+        """
+        checkpoint = _workflow_checkpoint.get()
+        attempt = 1
+        if checkpoint is not None:
+            restored = checkpoint.completed.get(task.task_id)
+            if restored is not None:
+                task.start()
+                task.complete(restored)
+                return {**restored, "restored": True}
+
+            attempt = checkpoint.attempts.get(task.task_id, 0) + 1
+            checkpoint.attempts[task.task_id] = attempt
+
+        cache_key = None
+        if self.result_cache is not None and task.cacheable:
+            cache_key = await asyncio.to_thread(
+                self.result_cache.key,
+                task,
+                self._task_context(task),
+                self._working_directory(task.agent_id),
+            )
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Reusing cached result for {task.task_id}")
+                task.start()
+                result = {**cached, "task_id": task.task_id, "cached": True}
+                task.complete(result)
+                if checkpoint is not None:
+                    await self._journal("task_finished", checkpoint.execution_id, task.task_id, result)
+                return result
+
+        budget = _workflow_budget.get()
+        if budget is None:
+            result = await self._run_on_pool(task, checkpoint, attempt)
+        else:
+            async with budget:
+                result = await self._run_on_pool(task, checkpoint, attempt)
+
+        # Results with file changes can't be replayed from the cache
+        if cache_key and result["status"] == "completed" and not result.get("files_modified"):
+            self.result_cache.put(
+                cache_key, {k: v for k, v in result.items() if k not in _UNCACHED_FIELDS}
+            )
+
+        if checkpoint is not None:
+            await self._journal("task_finished", checkpoint.execution_id, task.task_id, result)
+        return result
+
+    async def _run_on_pool(
+        self, task: WorkflowTask, checkpoint: Optional[_Checkpoint] = None, attempt: int = 1
+    ) -> Dict[str, Any]:
+        instance = None
+        # Set once execute_task returns: it has released the instance itself
+        handed_back = False
         task.start()
+        if checkpoint is not None:
+            await self._journal("task_started", checkpoint.execution_id, task.task_id, attempt)
 
         try:
-            # This would integrate with actual agent execution
-            # For now, return success placeholder
+            if self._deadline_exceeded():
+                raise WorkflowTimeoutError("Workflow deadline exceeded before task started")
+            instance = await self._acquire_instance(task)
+            context = self._task_context(task, checkpoint, attempt)
+
+            timeout = self._task_timeout(task)
+            deadline_left = self._deadline_remaining()
+            limit = timeout if deadline_left is None else min(timeout, deadline_left)
+            try:
+                execution = await asyncio.wait_for(
+                    self.pool.executor.execute_task(
+                        instance.instance_id, task.description, context=context
+                    ),
+                    max(0.0, limit),
+                )
+                handed_back = True
+            except asyncio.TimeoutError:
+                if self._deadline_exceeded():
+                    raise WorkflowTimeoutError("Workflow deadline exceeded") from None
+                raise WorkflowTimeoutError(f"Task timed out after {timeout:.0f}s") from None
+
+            # The executor reports a coder exception as "success" with an "error"
+            if not execution.get("success") or execution.get("error"):
+                raise RuntimeError(execution.get("error") or "Task execution failed")
+
             result = {
                 "task_id": task.task_id,
                 "status": "completed",
                 "agent_id": task.agent_id,
+                "instance_id": instance.instance_id,
                 "description": task.description,
+                "output": execution.get("output", ""),
+                "files_modified": execution.get("files_modified", []),
                 "started_at": task.started_at.isoformat(),
             }
+            if checkpoint is not None:
+                result["idempotency_key"] = idempotency_key(checkpoint.execution_id, task.task_id)
+                result["attempt"] = attempt
 
             task.complete(result)
+            result["duration_seconds"] = (
+                task.completed_at - task.started_at
+            ).total_seconds()
+            self._record_outcome(task, result, success=True)
             return result
 
+        except asyncio.CancelledError:
+            task.cancel("Cancelled")
+            raise
+
+        except WorkflowTimeoutError as exc:
+            if not self._deadline_exceeded():
+                self.logger.error(f"Task {task.task_id} failed: {exc}")
+                task.fail(str(exc))
+                result = {
+                    "task_id": task.task_id,
+                    "status": "failed",
+                    "agent_id": task.agent_id,
+                    "description": task.description,
+                    "error": str(exc),
+                }
+                self._record_outcome(task, result, success=False)
+                return result
+
+            # The expert didn't fail; the workflow ran out of time
+            self.logger.warning(f"Task {task.task_id} cancelled: {exc}")
+            return self._cancelled(task, str(exc))
+
         except Exception as exc:
             self.logger.error(f"Task {task.task_id} failed: {exc}")
             task.fail(str(exc))
-            return {
+            result = {
                 "task_id": task.task_id,
                 "status": "failed",
+                "agent_id": task.agent_id,
+                "description": task.description,
                 "error": str(exc),
             }
+            self._record_outcome(task, result, success=False)
+            return result
+
+        finally:
+            if instance is not None:
+                await self._release_instance(instance, task, aborted=not handed_back)
+
+    async def _acquire_instance(self, task: WorkflowTask):
+        """
+        Acquire an instance of the task's expert, waiting while saturated.
+
+        Raises:
+            ExpertNotFoundError: If the expert is not defined in the pool
+            PoolExhaustedError: If no instance frees up within acquire_timeout
+            WorkflowTimeoutError: If the workflow deadline passes while waiting
+        """
+        pool_manager = getattr(self.pool, "pool_manager", None)
+        if pool_manager is None or getattr(self.pool, "executor", None) is None:
+            raise PoolExhaustedError("No agent pool configured for execution")
+        if task.agent_id not in pool_manager.expert_definitions:
+            raise ExpertNotFoundError(f"Expert {task.agent_id} not found in pool")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.acquire_timeout
+        backoff = ACQUIRE_BACKOFF_INITIAL
+
+        while True:
+            instance = await pool_manager.acquire_expert(task.agent_id, task.description)
+            if instance is not None:
+                return instance
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise PoolExhaustedError(
+                    f"No {task.agent_id} instance available after {self.acquire_timeout}s"
+                )
+            deadline_left = self._deadline_remaining()
+            if deadline_left is not None:
+                if deadline_left <= 0:
+                    raise WorkflowTimeoutError(
+                        f"Workflow deadline exceeded waiting for {task.agent_id}"
+                    )
+                remaining = min(remaining, deadline_left)
+
+            # Wake on our own releases; back off for releases by other users
+            self.logger.debug(f"Pool saturated for {task.agent_id}, waiting ({task.task_id})")
+            async with self._released:
+                try:
+                    await asyncio.wait_for(self._released.wait(), min(backoff, remaining))
+                except asyncio.TimeoutError:
+                    pass
+            backoff = min(backoff * 2, ACQUIRE_BACKOFF_MAX)
+
+    def _task_timeout(self, task: WorkflowTask) -> float:
+        """Execution timeout of a task (explicit, else derived from its estimates)."""
+        if task.timeout:
+            return task.timeout
+        estimate = max(task.estimated_duration or 0, task.estimated_duration_p90 or 0)
+        return min(
+            max(estimate * TASK_TIMEOUT_FACTOR, WORKFLOW_TASK_TIMEOUT_MIN),
+            WORKFLOW_TASK_TIMEOUT_MAX,
+        )
+
+    def _deadline_remaining(self) -> Optional[float]:
+        """Seconds left until the workflow deadline (None outside a workflow)."""
+        deadline = _workflow_deadline.get()
+        if deadline is None:
+            return None
+        return deadline - asyncio.get_running_loop().time()
+
+    def _deadline_exceeded(self) -> bool:
+        remaining = self._deadline_remaining()
+        return remaining is not None and remaining <= 0
+
+    async def _release_instance(self, instance, task: WorkflowTask, aborted: bool) -> None:
+        """
+        Release an instance the executor never gave back, then wake waiters.
+
+        Only aborted runs (cancelled, timed out, or failed before execution)
+        still hold the instance; after execute_task returns it may already
+        belong to another pool user.
+        """
+        status = getattr(getattr(instance, "status", None), "value", None)
+        if aborted and status in ("reserved", "working") and (
+            instance.current_task == task.description
+        ):
+            self.pool.pool_manager.release_instance(
+                instance.instance_id, f"ABORTED: {task.task_id}"
+            )
+
+        async with self._released:
+            self._released.notify_all()
+
+    def _task_context(
+        self, task: WorkflowTask, checkpoint: Optional[_Checkpoint] = None, attempt: int = 1
+    ) -> Optional[str]:
+        """Context passed with the task (retry note, pipeline item, upstream output)."""
+        parts = []
+        if checkpoint is not None and attempt > 1:
+            parts.append(
+                f"Resumed task (attempt {attempt}, key "
+                f"{idempotency_key(checkpoint.execution_id, task.task_id)}): a previous "
+                f"attempt was interrupted and may have partially applied its changes. "
+                f"Check the current state before repeating work."
+            )
+
+        input_data = task.input_data or {}
+        item = input_data.get("item")
+        if item is not None:
+            parts.append(f"Item: {item}")
+        upstream = input_data.get("upstream") or {}
+        if upstream.get("output"):
+            parts.append(f"Previous step output:\n{upstream['output']}")
+        return "\n\n".join(parts) or None
+
+    async def _journal(self, event: str, *args) -> None:
+        """
+        Write a journal event; a failing journal never fails the workflow.
+
+        The fsynced append runs in a worker thread so it doesn't stall the
+        event loop; awaiting it keeps the event written before execution
+        moves on.
+        """
+        try:
+            await asyncio.to_thread(getattr(self.journal, event), *args)
+        except Exception as exc:
+            self.logger.error(f"Failed to journal {event} for {args[0]}: {exc}")
+
+    def _record_outcome(self, task: WorkflowTask, result: Dict[str, Any], success: bool) -> None:
+        """Record the task outcome with the learning manager (if configured)."""
+        if self.learning is None:
+            return
+        try:
+            self.learning.record_task_outcome(task.description, task.agent_id, result, success)
+        except Exception as exc:
+            self.logger.warning(f"Failed to record outcome for {task.task_id}: {exc}")
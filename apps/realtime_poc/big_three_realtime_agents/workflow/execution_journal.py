@@ -0,0 +1,213 @@
+"""
+Execution journal - Append-only checkpoints for resumable workflows.
+
+Each execution gets a JSONL file with one event per line: the plan when
+the execution starts, every task start (with its idempotency key and
+attempt number), every task result, and the final status. Lines are
+flushed and fsynced as they are written, so after a crash or restart the
+journal shows which tasks completed (their results are reused), which
+were in flight (re-run with a new attempt) and which never started.
+A torn line from a crash mid-write is skipped on load, and the next
+append starts on a fresh line.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from ..exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_VERSION = 1
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def idempotency_key(execution_id: str, task_id: str) -> str:
+    """Stable key of a task within an execution (same across attempts)."""
+    return f"{execution_id}:{task_id}"
+
+
+@dataclass
+class JournalState:
+    """
+    Execution state replayed from a journal.
+
+    Attributes:
+        execution_id: Execution identifier
+        plan: Plan as serialized by WorkflowPlan.to_dict()
+        started_at: When the execution first started
+        completed: task_id -> result of completed tasks
+        attempts: task_id -> number of started attempts
+        in_flight: Task IDs started but without a recorded result
+        status: Final status, or None if the execution never finished
+    """
+    execution_id: str
+    plan: Dict[str, Any]
+    started_at: Optional[str] = None
+    completed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    attempts: Dict[str, int] = field(default_factory=dict)
+    in_flight: List[str] = field(default_factory=list)
+    status: Optional[str] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status is not None
+
+
+class ExecutionJournal:
+    """
+    Append-only JSONL journal of workflow executions.
+
+    Example:
+        >>> journal = ExecutionJournal(Path("memory/workflows/journal"))
+        >>> journal.start(execution_id, plan.to_dict())
+        >>> journal.task_started(execution_id, "task_1", attempt=1)
+        >>> journal.task_finished(execution_id, "task_1", result)
+        >>> state = journal.load(execution_id)
+    """
+
+    def __init__(self, storage_dir: Path, fsync: bool = True):
+        """
+        Initialize journal.
+
+        Args:
+            storage_dir: Directory for journal files
+            fsync: Force each event to disk (disable only for tests)
+        """
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.logger = logger
+        self._lock = threading.Lock()
+
+    def start(self, execution_id: str, plan: Dict[str, Any]) -> None:
+        """Record the start of an execution with its plan."""
+        self._append(execution_id, {"event": "start", "version": JOURNAL_VERSION, "plan": plan})
+
+    def resumed(self, execution_id: str) -> None:
+        """Record that an execution was resumed."""
+        self._append(execution_id, {"event": "resume"})
+
+    def task_started(self, execution_id: str, task_id: str, attempt: int) -> None:
+        """Record a task attempt starting."""
+        self._append(execution_id, {
+            "event": "task_started",
+            "task_id": task_id,
+            "key": idempotency_key(execution_id, task_id),
+            "attempt": attempt,
+        })
+
+    def task_finished(self, execution_id: str, task_id: str, result: Dict[str, Any]) -> None:
+        """Record a task result (completed or failed)."""
+        self._append(execution_id, {
+            "event": "task_finished",
+            "task_id": task_id,
+            "key": idempotency_key(execution_id, task_id),
+            "status": result.get("status"),
+            "result": result,
+        })
+
+    def finish(self, execution_id: str, status: str) -> None:
+        """Record the final status of an execution."""
+        self._append(execution_id, {"event": "finish", "status": status})
+
+    def load(self, execution_id: str) -> Optional[JournalState]:
+        """
+        Replay an execution's journal.
+
+        Args:
+            execution_id: Execution identifier
+
+        Returns:
+            JournalState, or None if there is no journal
+
+        Raises:
+            ValidationError: If execution_id contains forbidden characters
+        """
+        path = self._path(execution_id)
+        if not path.exists():
+            return None
+
+        state: Optional[JournalState] = None
+        running: Dict[str, int] = {}
+
+        with open(path, "r") as f:
+            lines = f.read().splitlines()
+
+        for number, line in enumerate(lines, 1):
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                self.logger.warning(f"Skipping torn line {number} of journal {execution_id}")
+                continue
+
+            kind = event.get("event")
+            if kind == "start":
+                state = JournalState(
+                    execution_id=execution_id,
+                    plan=event["plan"],
+                    started_at=event.get("timestamp"),
+                )
+            elif state is None:
+                continue
+            elif kind == "task_started":
+                state.attempts[event["task_id"]] = event.get("attempt", 1)
+                running[event["task_id"]] = event.get("attempt", 1)
+            elif kind == "task_finished":
+                running.pop(event["task_id"], None)
+                if event.get("status") == "completed":
+                    state.completed[event["task_id"]] = event["result"]
+                else:
+                    state.completed.pop(event["task_id"], None)
+            elif kind == "resume":
+                # Attempts interrupted before the resume never finished
+                running.clear()
+                state.status = None
+            elif kind == "finish":
+                state.status = event.get("status")
+
+        if state is not None:
+            state.in_flight = [task_id for task_id in running if task_id not in state.completed]
+        return state
+
+    def unfinished(self) -> List[str]:
+        """Execution IDs whose journal has no final status (candidates for resume)."""
+        execution_ids = []
+        for path in sorted(self.storage_dir.glob("*.jsonl")):
+            state = self.load(path.stem)
+            if state is not None and not state.is_finished:
+                execution_ids.append(path.stem)
+        return execution_ids
+
+    def _append(self, execution_id: str, event: Dict[str, Any]) -> None:
+        event["timestamp"] = datetime.now().isoformat()
+        line = json.dumps(event, default=str) + "\n"
+        path = self._path(execution_id)
+
+        with self._lock:
+            with open(path, "ab+") as f:
+                # A crash may have left a partial line without its newline
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = "\n" + line
+                f.write(line.encode("utf-8"))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+
+    def _path(self, execution_id: str) -> Path:
+        if not _SAFE_ID.match(execution_id or ""):
+            raise ValidationError(
+                f"Invalid execution_id: '{execution_id}' "
+                f"(allowed: alphanumeric, underscore, hyphen)"
+            )
+        return self.storage_dir / f"{execution_id}.jsonl"
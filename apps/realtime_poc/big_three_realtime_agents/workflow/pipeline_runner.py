@@ -0,0 +1,210 @@
+"""
+Pipeline runner - Streaming execution for PIPELINE stages.
+
+A pipeline stage's tasks are steps (e.g. analyze -> fix -> test) applied
+to each of the stage's items (e.g. files). Steps are connected by bounded
+asyncio queues: each step's workers take an item from the upstream queue,
+run the step for it, and pass it downstream as soon as it finishes, so
+steps overlap across items instead of running as batch phases. Full
+queues block upstream workers (backpressure). In fail-fast mode the
+first failed item cancels every worker; unfinished items are cancelled.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+
+from .workflow_models import WorkflowStage, WorkflowTask
+
+logger = logging.getLogger(__name__)
+
+# Sentinel closing a step's input queue (one per downstream worker)
+_DONE = object()
+
+
+class PipelineRunner:
+    """
+    Run a PIPELINE stage item by item through its steps.
+
+    Each step runs once per item as a derived task ("<step_id>#<n>") whose
+    input_data holds the item and the previous step's result. Items that
+    fail a step are not passed to later steps.
+
+    Example:
+        >>> runner = PipelineRunner(engine._execute_task)
+        >>> step_results, item_results = await runner.run(stage)
+    """
+
+    def __init__(
+        self,
+        execute_task: Callable[[WorkflowTask], Awaitable[Dict[str, Any]]],
+        fail_fast: bool = False,
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            execute_task: Coroutine function running one task, returning a
+                result dict with "status" ("completed" or "failed")
+            fail_fast: Cancel all remaining work on the first failed item
+        """
+        self.execute_task = execute_task
+        self.fail_fast = fail_fast
+        self.logger = logger
+
+    async def run(self, stage: WorkflowStage):
+        """
+        Execute the stage.
+
+        Args:
+            stage: Pipeline stage (tasks are steps; items default to [None],
+                a single pass that chains step results)
+
+        Returns:
+            Tuple of (one result per step, one result per item)
+        """
+        steps = stage.tasks
+        items = stage.items or [None]
+        workers = max(1, stage.step_concurrency)
+        queues = [asyncio.Queue(maxsize=max(1, stage.queue_size)) for _ in steps]
+
+        step_item_results: List[List[Dict[str, Any]]] = [[] for _ in steps]
+        item_results = [
+            {"item": item, "status": "pending", "completed_steps": 0} for item in items
+        ]
+
+        for step in steps:
+            step.start()
+
+        jobs: List[asyncio.Future] = []
+        stopped: List[str] = []
+
+        def stop(reason: str) -> None:
+            # Cancels every job, including the caller's (at its next await)
+            if not stopped:
+                stopped.append(reason)
+                for job in jobs:
+                    job.cancel()
+
+        async def feed():
+            for index, item in enumerate(items):
+                await queues[0].put((index, item, None))
+            for _ in range(workers):
+                await queues[0].put(_DONE)
+
+        async def run_step(position: int):
+            step = steps[position]
+
+            async def worker():
+                while True:
+                    entry = await queues[position].get()
+                    if entry is _DONE:
+                        return
+                    index, item, upstream = entry
+                    result = await self._run_item(step, index, item, upstream)
+                    step_item_results[position].append(result)
+
+                    if result.get("status") != "completed":
+                        item_results[index]["status"] = "failed"
+                        item_results[index]["failed_step"] = step.task_id
+                        item_results[index]["error"] = result.get("error")
+                        if self.fail_fast:
+                            stop(f"Cancelled: item {index} failed at {step.task_id} (fail-fast)")
+                        continue
+
+                    item_results[index]["completed_steps"] += 1
+                    if position + 1 < len(steps):
+                        item_results[index]["status"] = "running"
+                        await queues[position + 1].put((index, item, result))
+                    else:
+                        item_results[index]["status"] = "completed"
+
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            if position + 1 < len(steps):
+                for _ in range(workers):
+                    await queues[position + 1].put(_DONE)
+
+        jobs.append(asyncio.ensure_future(feed()))
+        jobs.extend(asyncio.ensure_future(run_step(position)) for position in range(len(steps)))
+        outcomes = await asyncio.gather(*jobs, return_exceptions=True)
+        if not stopped:
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+
+        if stopped:
+            for result in item_results:
+                if result["status"] in ("pending", "running"):
+                    result["status"] = "cancelled"
+                    result["error"] = stopped[0]
+
+        step_results = [
+            self._finish_step(step, results, len(items), stopped[0] if stopped else None)
+            for step, results in zip(steps, step_item_results)
+        ]
+
+        completed = sum(1 for r in item_results if r["status"] == "completed")
+        self.logger.info(
+            f"Pipeline {stage.stage_id}: {completed}/{len(items)} items through "
+            f"{len(steps)} steps"
+        )
+        return step_results, item_results
+
+    async def _run_item(
+        self, step: WorkflowTask, index: int, item: Any, upstream: Any
+    ) -> Dict[str, Any]:
+        """Run one step for one item as a derived task."""
+        description = step.description if item is None else f"{step.description}: {item}"
+        task = WorkflowTask(
+            task_id=f"{step.task_id}#{index}",
+            description=description,
+            agent_id=step.agent_id,
+            estimated_duration=step.estimated_duration,
+            estimated_duration_p90=step.estimated_duration_p90,
+            timeout=step.timeout,
+            input_data={"item": item, "upstream": upstream},
+            cacheable=step.cacheable,
+        )
+        try:
+            result = await self.execute_task(task)
+        except Exception as exc:
+            self.logger.error(f"Pipeline task {task.task_id} failed with exception: {exc}")
+            task.fail(str(exc))
+            result = {"task_id": task.task_id, "status": "failed", "error": str(exc)}
+        return {**result, "item_index": index}
+
+    def _finish_step(
+        self,
+        step: WorkflowTask,
+        results: List[Dict[str, Any]],
+        item_count: int,
+        stopped: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Summarize a step over all items and set the step task's status."""
+        completed = sum(1 for r in results if r.get("status") == "completed")
+        failed = len(results) - completed
+        status = "completed" if failed == 0 else "failed"
+        if status == "completed" and stopped and len(results) < item_count:
+            status = "cancelled"
+        elif not results:
+            status = "skipped"
+
+        summary = {
+            "task_id": step.task_id,
+            "agent_id": step.agent_id,
+            "description": step.description,
+            "status": status,
+            "items_completed": completed,
+            "items_failed": failed,
+            "item_results": sorted(results, key=lambda r: r["item_index"]),
+        }
+
+        if status == "cancelled":
+            step.cancel(stopped)
+        elif status == "skipped":
+            step.skip("No items reached this step")
+        elif failed:
+            step.fail(f"{failed} item(s) failed")
+        else:
+            step.complete(summary)
+        return summary
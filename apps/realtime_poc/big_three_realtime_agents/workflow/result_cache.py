@@ -0,0 +1,245 @@
+"""
+Result cache - Content-addressed memoization of workflow task results.
+
+Tasks flagged cacheable (e.g. analysis or review steps without file
+changes) are keyed by a SHA-256 of their inputs: expert, normalized
+description, the context passed with the task and a fingerprint of the
+expert's working tree (HEAD, uncommitted diff and untracked files). An
+identical task against an identical tree reuses the stored result
+instead of running again, across workflows and process restarts.
+Entries expire after a TTL, and the on-disk store is bounded in size by
+evicting the least recently used entries.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..timeouts import SUBPROCESS_QUICK_TIMEOUT
+from .workflow_models import WorkflowTask
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+def repo_fingerprint(path: Optional[str]) -> str:
+    """
+    Fingerprint of a git working tree ("" outside a git repository).
+
+    Covers HEAD, uncommitted changes to tracked files and the names and
+    contents of untracked files, so any edit to the tree changes the
+    fingerprint.
+
+    Args:
+        path: Directory inside the working tree
+
+    Returns:
+        Hex digest, or "" if path is not in a git repository
+    """
+    if not path or not Path(path).is_dir():
+        return ""
+
+    digest = hashlib.sha256()
+    try:
+        for command in (["rev-parse", "HEAD"], ["diff", "HEAD", "--binary"]):
+            output = _git(command, path)
+            if output is None:
+                return ""
+            digest.update(output)
+
+        untracked = _git(["ls-files", "--others", "--exclude-standard", "-z"], path)
+        if untracked is None:
+            return ""
+        digest.update(untracked)
+        names = [name for name in untracked.split(b"\0") if name and b"\n" not in name]
+        if names:
+            # One blob hash per file, in listing order
+            blobs = _git(["hash-object", "--stdin-paths"], path, stdin=b"\n".join(names) + b"\n")
+            if blobs is None:
+                return ""
+            digest.update(blobs)
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logger.warning(f"Cannot fingerprint {path}: {exc}")
+        return ""
+    return digest.hexdigest()
+
+
+def _git(args: List[str], path: str, stdin: Optional[bytes] = None) -> Optional[bytes]:
+    """Output of a git command run in path (None on a non-zero exit)."""
+    # Security: shell=False prevents command injection
+    result = subprocess.run(
+        ["git", *args], cwd=path, shell=False, capture_output=True, input=stdin,
+        timeout=SUBPROCESS_QUICK_TIMEOUT,
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+class ResultCache:
+    """
+    On-disk, size-bounded cache of task results keyed by input hash.
+
+    Example:
+        >>> cache = ResultCache(Path("memory/result_cache"), ttl_seconds=3600)
+        >>> key = cache.key(task, context, working_dir)
+        >>> result = cache.get(key)
+        >>> if result is None:
+        ...     cache.put(key, await run(task))
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            storage_dir: Directory for cache entries (one JSON file per key)
+            ttl_seconds: Entry lifetime
+            max_bytes: Max total size of entries on disk
+        """
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        # key -> (size in bytes, last access time), for LRU eviction
+        self._entries: Dict[str, Tuple[int, float]] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        for entry in os.scandir(self.storage_dir):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                self._entries[entry.name[:-5]] = (stat.st_size, stat.st_mtime)
+                self._total_bytes += stat.st_size
+
+    def key(
+        self,
+        task: WorkflowTask,
+        context: Optional[str] = None,
+        working_dir: Optional[str] = None,
+    ) -> str:
+        """
+        Content hash of a task's inputs.
+
+        Args:
+            task: Workflow task
+            context: Context passed with the task (pipeline item, upstream output)
+            working_dir: Expert working directory (its git state is hashed)
+
+        Returns:
+            Hex digest
+        """
+        inputs = {
+            "version": CACHE_VERSION,
+            "agent_id": task.agent_id,
+            "description": " ".join(task.description.lower().split()),
+            "context": hashlib.sha256((context or "").encode("utf-8")).hexdigest(),
+            "repo": repo_fingerprint(working_dir),
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached result for key.
+
+        Returns:
+            Result dict, or None if missing, expired or unreadable
+        """
+        path = self.storage_dir / f"{key}.json"
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            try:
+                entry = json.loads(path.read_text())
+            except (OSError, ValueError) as exc:
+                self.logger.warning(f"Dropping unreadable cache entry {key[:12]}: {exc}")
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            now = time.time()
+            self._entries[key] = (self._entries[key][0], now)
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            self.hits += 1
+            return entry["result"]
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result, evicting least recently used entries beyond max_bytes."""
+        data = json.dumps(
+            {"version": CACHE_VERSION, "created_at": time.time(), "result": result},
+            default=str,
+        )
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            self.logger.debug(f"Result too large to cache ({size} bytes)")
+            return
+
+        path = self.storage_dir / f"{key}.json"
+        with self._lock:
+            try:
+                tmp_file = path.with_suffix(".tmp")
+                tmp_file.write_text(data)
+                tmp_file.replace(path)
+            except OSError as exc:
+                self.logger.error(f"Failed to cache result {key[:12]}: {exc}")
+                return
+
+            if key in self._entries:
+                self._total_bytes -= self._entries[key][0]
+            self._entries[key] = (size, time.time())
+            self._total_bytes += size
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, size and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_bytes (lock held)."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        size, _ = self._entries.pop(key, (0, 0))
+        self._total_bytes -= size
+        try:
+            (self.storage_dir / f"{key}.json").unlink()
+        except FileNotFoundError:
+            pass
@@ -4,7 +4,7 @@ Workflow data models and structures.
 Defines the core data structures for workflow planning and execution.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -17,6 +17,12 @@ class ExecutionStrategy(Enum):
     PIPELINE = "pipeline"         # Pass results between tasks
 
 
+class FailurePolicy(Enum):
+    """How a workflow reacts to a failed task."""
+    FAIL_FAST = "fail_fast"                  # Cancel running siblings, stop the workflow
+    CONTINUE_ON_ERROR = "continue_on_error"  # Let other tasks finish, collect partial results
+
+
 class TaskStatus(Enum):
     """Task execution status."""
     PENDING = "pending"
@@ -24,6 +30,7 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     SKIPPED = "skipped"
+    CANCELLED = "cancelled"
 
 
 @dataclass
@@ -35,11 +42,17 @@ class WorkflowTask:
         task_id: Unique task identifier
         description: Task description
         agent_id: Expert agent ID to use
-        estimated_duration: Expected duration in seconds
+        estimated_duration: Expected (median) duration in seconds
+        estimated_duration_p90: 90th percentile duration (learned estimate)
         dependencies: Task IDs this depends on
         status: Current status
         result: Task execution result
         error: Error message if failed
+        input_data: Input passed to the task (e.g. pipeline item and upstream result)
+        slack: Seconds the task can slip without delaying the workflow
+            (set by critical path analysis; 0 = on the critical path)
+        cacheable: Result may be reused for identical inputs (see result_cache)
+        timeout: Max execution seconds (None = derived from the estimates)
     """
     task_id: str
     description: str
@@ -51,6 +64,11 @@ class WorkflowTask:
     error: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    estimated_duration_p90: Optional[int] = None
+    input_data: Optional[Dict[str, Any]] = None
+    slack: Optional[int] = None
+    cacheable: bool = False
+    timeout: Optional[float] = None
 
     def start(self) -> None:
         """Mark task as started."""
@@ -69,6 +87,37 @@ class WorkflowTask:
         self.error = error
         self.completed_at = datetime.now()
 
+    def skip(self, reason: str) -> None:
+        """Mark task as skipped (e.g. a dependency failed)."""
+        self.status = TaskStatus.SKIPPED
+        self.error = reason
+        self.completed_at = datetime.now()
+
+    def cancel(self, reason: str) -> None:
+        """Mark task as cancelled (fail-fast or workflow deadline)."""
+        self.status = TaskStatus.CANCELLED
+        self.error = reason
+        self.completed_at = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable task state."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["status"] = self.status.value
+        for name in ("started_at", "completed_at"):
+            data[name] = data[name].isoformat() if data[name] else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowTask":
+        """Rebuild a task from to_dict() output."""
+        data = dict(data)
+        data["status"] = TaskStatus(data.get("status", TaskStatus.PENDING.value))
+        for name in ("started_at", "completed_at"):
+            if data.get(name):
+                data[name] = datetime.fromisoformat(data[name])
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
 
 @dataclass
 class WorkflowStage:
@@ -81,12 +130,34 @@ class WorkflowStage:
         tasks: List of tasks in this stage
         strategy: Execution strategy
         continue_on_failure: Continue if task fails
+        items: Work items streamed through the tasks (PIPELINE only)
+        queue_size: Max items buffered between pipeline steps
+        step_concurrency: Concurrent workers per pipeline step
     """
     stage_id: str
     name: str
     tasks: List[WorkflowTask]
     strategy: ExecutionStrategy = ExecutionStrategy.SEQUENTIAL
     continue_on_failure: bool = False
+    items: List[Any] = field(default_factory=list)
+    queue_size: int = 4
+    step_concurrency: int = 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable stage (tasks included)."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["tasks"] = [task.to_dict() for task in self.tasks]
+        data["strategy"] = self.strategy.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowStage":
+        """Rebuild a stage from to_dict() output."""
+        data = dict(data)
+        data["tasks"] = [WorkflowTask.from_dict(task) for task in data.get("tasks", [])]
+        data["strategy"] = ExecutionStrategy(data.get("strategy", "sequential"))
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
 
 
 @dataclass
@@ -102,6 +173,9 @@ class WorkflowPlan:
         success_criteria: Criteria for success
         created_at: Plan creation timestamp
         metadata: Additional metadata
+        estimated_total_duration_p90: 90th percentile total time in seconds
+        critical_path: Task IDs on the longest dependency chain, in order
+        failure_policy: Reaction to failed tasks (fail fast or continue)
     """
     plan_id: str
     goal: str
@@ -110,6 +184,30 @@ class WorkflowPlan:
     success_criteria: str = "All tasks completed successfully"
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    estimated_total_duration_p90: Optional[int] = None
+    critical_path: List[str] = field(default_factory=list)
+    failure_policy: FailurePolicy = FailurePolicy.CONTINUE_ON_ERROR
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable plan (stages and task state included)."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["stages"] = [stage.to_dict() for stage in self.stages]
+        data["created_at"] = self.created_at.isoformat()
+        data["failure_policy"] = self.failure_policy.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowPlan":
+        """Rebuild a plan from to_dict() output."""
+        data = dict(data)
+        data["stages"] = [WorkflowStage.from_dict(stage) for stage in data.get("stages", [])]
+        if data.get("created_at"):
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["failure_policy"] = FailurePolicy(
+            data.get("failure_policy", FailurePolicy.CONTINUE_ON_ERROR.value)
+        )
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
 
     def get_all_tasks(self) -> List[WorkflowTask]:
         """Get all tasks across all stages."""
@@ -2,22 +2,31 @@
 Workflow planner - AI-powered task decomposition.
 
 Analyzes user requests and creates executable workflow plans
-with intelligent agent assignment and execution strategies.
+with intelligent agent assignment and execution strategies. Task
+durations come from a learned DurationPredictor (P50/P90) when one is
+trained, falling back to static estimates. Plans with task dependencies
+are annotated with their critical path and per-task slack.
 """
 
+import math
 import uuid
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from .workflow_models import (
     WorkflowPlan,
     WorkflowStage,
     WorkflowTask,
     ExecutionStrategy,
+    FailurePolicy,
 )
+from .critical_path import annotate_plan
 
 logger = logging.getLogger(__name__)
 
+# Static estimate used without an explicit duration or trained predictor
+DEFAULT_TASK_DURATION = 120
+
 
 class WorkflowPlanner:
     """
@@ -31,16 +40,18 @@ class WorkflowPlanner:
         >>> plan = planner.create_simple_plan("Build blog API", "backend-architect")
     """
 
-    def __init__(self, pool_manager, memory_manager):
+    def __init__(self, pool_manager, memory_manager, duration_predictor=None):
         """
         Initialize workflow planner.
 
         Args:
             pool_manager: Agent pool manager
             memory_manager: Memory manager
+            duration_predictor: Optional learned DurationPredictor
         """
         self.pool_manager = pool_manager
         self.memory = memory_manager
+        self.duration_predictor = duration_predictor
         self.logger = logger
 
     def create_simple_plan(
@@ -61,12 +72,14 @@ class WorkflowPlanner:
             WorkflowPlan with single stage and task
         """
         plan_id = f"plan_{uuid.uuid4().hex[:8]}"
+        p50, p90 = self.estimate_duration(task_description, agent_id)
 
         task = WorkflowTask(
             task_id=f"task_{uuid.uuid4().hex[:6]}",
             description=task_description,
             agent_id=agent_id,
-            estimated_duration=120,
+            estimated_duration=p50,
+            estimated_duration_p90=p90,
         )
 
         stage = WorkflowStage(
@@ -80,8 +93,9 @@ class WorkflowPlanner:
             plan_id=plan_id,
             goal=task_description,
             stages=[stage],
-            estimated_total_duration=120,
+            estimated_total_duration=p50,
             success_criteria="Task completed without errors",
+            estimated_total_duration_p90=p90,
         )
 
         self.logger.info(f"Created simple plan: {plan_id}")
@@ -91,7 +105,8 @@ class WorkflowPlanner:
         self,
         goal: str,
         tasks: List[Dict[str, Any]],
-        strategy: ExecutionStrategy = ExecutionStrategy.SEQUENTIAL
+        strategy: ExecutionStrategy = ExecutionStrategy.SEQUENTIAL,
+        failure_policy: FailurePolicy = FailurePolicy.CONTINUE_ON_ERROR,
     ) -> WorkflowPlan:
         """
         Create workflow with multiple tasks.
@@ -99,29 +114,43 @@ class WorkflowPlanner:
         Args:
             goal: Overall goal
             tasks: List of task dicts with description and agent_id
+                (an explicit "duration" overrides the predicted estimate,
+                "dependencies" lists task IDs "task_<n>" by position,
+                "cacheable" allows reusing results of identical runs,
+                "timeout" caps execution seconds)
             strategy: Execution strategy
+            failure_policy: Reaction to failed tasks (fail fast or continue)
 
         Returns:
             WorkflowPlan with tasks organized in stages
+
+        Raises:
+            WorkflowValidationError: If dependencies are unknown or cyclic
         """
         plan_id = f"plan_{uuid.uuid4().hex[:8]}"
 
         workflow_tasks = []
         for i, task_data in enumerate(tasks, 1):
+            if "duration" in task_data:
+                p50, p90 = task_data["duration"], None
+            else:
+                p50, p90 = self.estimate_duration(
+                    task_data["description"], task_data["agent_id"]
+                )
+
             task = WorkflowTask(
                 task_id=f"task_{i}",
                 description=task_data["description"],
                 agent_id=task_data["agent_id"],
-                estimated_duration=task_data.get("duration", 120),
+                estimated_duration=p50,
+                estimated_duration_p90=p90,
                 dependencies=task_data.get("dependencies", []),
+                cacheable=task_data.get("cacheable", False),
+                timeout=task_data.get("timeout"),
             )
             workflow_tasks.append(task)
 
-        # Calculate total duration
-        if strategy == ExecutionStrategy.PARALLEL:
-            total_duration = max(t.estimated_duration for t in workflow_tasks)
-        else:
-            total_duration = sum(t.estimated_duration for t in workflow_tasks)
+        total_duration, total_p90 = self._total_duration(workflow_tasks, strategy)
 
         stage = WorkflowStage(
             stage_id="stage_1",
@@ -136,13 +165,145 @@ class WorkflowPlanner:
             stages=[stage],
             estimated_total_duration=total_duration,
             success_criteria="All tasks completed successfully",
+            estimated_total_duration_p90=total_p90,
+            failure_policy=failure_policy,
         )
 
+        if any(task.dependencies for task in workflow_tasks):
+            # Dependencies run as a DAG: the critical path bounds the total
+            analysis = annotate_plan(plan)
+            critical = [plan.get_task_by_id(task_id) for task_id in analysis.tasks]
+            plan.estimated_total_duration = analysis.length
+            plan.estimated_total_duration_p90 = self._total_duration(
+                critical, ExecutionStrategy.SEQUENTIAL
+            )[1]
+
         self.logger.info(
             f"Created multi-task plan: {plan_id} ({len(tasks)} tasks, {strategy.value})"
         )
         return plan
 
+    def create_pipeline_plan(
+        self,
+        goal: str,
+        steps: List[Dict[str, Any]],
+        items: List[Any],
+        queue_size: int = 4,
+        step_concurrency: int = 2,
+        failure_policy: FailurePolicy = FailurePolicy.CONTINUE_ON_ERROR,
+    ) -> WorkflowPlan:
+        """
+        Create workflow streaming items through a chain of steps.
+
+        Args:
+            goal: Overall goal
+            steps: Step dicts with description and agent_id (e.g. analyze, fix, test),
+                optionally "duration", "cacheable" and a per-item "timeout"
+            items: Work items each step is applied to (e.g. file paths)
+            queue_size: Max items buffered between steps
+            step_concurrency: Concurrent workers per step
+            failure_policy: Reaction to failed tasks (fail fast or continue)
+
+        Returns:
+            WorkflowPlan with one PIPELINE stage
+        """
+        plan_id = f"plan_{uuid.uuid4().hex[:8]}"
+
+        step_tasks = []
+        for i, step_data in enumerate(steps, 1):
+            if "duration" in step_data:
+                p50, p90 = step_data["duration"], None
+            else:
+                p50, p90 = self.estimate_duration(step_data["description"], step_data["agent_id"])
+            step_tasks.append(WorkflowTask(
+                task_id=f"step_{i}",
+                description=step_data["description"],
+                agent_id=step_data["agent_id"],
+                estimated_duration=p50,
+                estimated_duration_p90=p90,
+                cacheable=step_data.get("cacheable", False),
+                timeout=step_data.get("timeout"),
+            ))
+
+        # First item traverses every step; the rest follow at the bottleneck rate
+        bottleneck = max(t.estimated_duration for t in step_tasks)
+        total_duration = sum(t.estimated_duration for t in step_tasks) + math.ceil(
+            max(0, len(items) - 1) * bottleneck / max(1, step_concurrency)
+        )
+
+        stage = WorkflowStage(
+            stage_id="stage_1",
+            name="Pipeline Execution",
+            tasks=step_tasks,
+            strategy=ExecutionStrategy.PIPELINE,
+            items=list(items),
+            queue_size=queue_size,
+            step_concurrency=step_concurrency,
+        )
+
+        plan = WorkflowPlan(
+            plan_id=plan_id,
+            goal=goal,
+            stages=[stage],
+            estimated_total_duration=total_duration,
+            success_criteria="All items completed every step",
+            failure_policy=failure_policy,
+        )
+
+        self.logger.info(
+            f"Created pipeline plan: {plan_id} ({len(steps)} steps, {len(items)} items)"
+        )
+        return plan
+
+    def estimate_duration(self, task_description: str, agent_id: str) -> Tuple[int, Optional[int]]:
+        """
+        Estimate task duration.
+
+        Args:
+            task_description: What to do
+            agent_id: Which expert agent will run it
+
+        Returns:
+            Tuple of (P50 seconds, P90 seconds or None without a trained model)
+        """
+        if self.duration_predictor is not None:
+            estimate = self.duration_predictor.predict(
+                task_description, agent_id, tier=self._expert_tier(agent_id)
+            )
+            if estimate is not None:
+                return estimate.p50, estimate.p90
+
+        return DEFAULT_TASK_DURATION, None
+
+    def _total_duration(
+        self, tasks: List[WorkflowTask], strategy: ExecutionStrategy
+    ) -> Tuple[int, Optional[int]]:
+        """
+        Combine task estimates into plan P50/P90.
+
+        Parallel tasks take the slowest task. Sequential spreads (P90 - P50)
+        are treated as independent and add in quadrature, since summing
+        per-task P90s overstates the total.
+        """
+        if strategy == ExecutionStrategy.PARALLEL:
+            total = max(t.estimated_duration for t in tasks)
+            p90s = [t.estimated_duration_p90 for t in tasks if t.estimated_duration_p90]
+            return total, max([total] + p90s) if p90s else None
+
+        total = sum(t.estimated_duration for t in tasks)
+        spreads = [
+            t.estimated_duration_p90 - t.estimated_duration
+            for t in tasks if t.estimated_duration_p90
+        ]
+        if not spreads:
+            return total, None
+        return total, total + round(math.sqrt(sum(s * s for s in spreads)))
+
+    def _expert_tier(self, agent_id: str):
+        """Tier of an expert from the pool definitions (None if unknown)."""
+        definitions = getattr(self.pool_manager, "expert_definitions", None) or {}
+        return getattr(definitions.get(agent_id), "tier", None)
+
     def visualize_plan(self, plan: WorkflowPlan) -> str:
         """
         Create ASCII visualization of workflow plan.
@@ -158,7 +319,15 @@ class WorkflowPlanner:
         lines.append(f"WORKFLOW PLAN: {plan.goal}")
         lines.append("=" * 60)
         lines.append(f"Plan ID: {plan.plan_id}")
-        lines.append(f"Estimated Duration: {plan.estimated_total_duration}s")
+        if plan.estimated_total_duration_p90:
+            lines.append(
+                f"Estimated Duration: {plan.estimated_total_duration}s "
+                f"(P90: {plan.estimated_total_duration_p90}s)"
+            )
+        else:
+            lines.append(f"Estimated Duration: {plan.estimated_total_duration}s")
+        if plan.critical_path:
+            lines.append(f"Critical Path: {' -> '.join(plan.critical_path)}")
         lines.append(f"Total Stages: {len(plan.stages)}")
         lines.append(f"Total Tasks: {len(plan.get_all_tasks())}")
         lines.append("")
@@ -167,12 +336,19 @@ class WorkflowPlanner:
             lines.append(f"[Stage {i}] {stage.name}")
             lines.append(f"  Strategy: {stage.strategy.value}")
             lines.append(f"  Tasks: {len(stage.tasks)}")
+            if stage.strategy == ExecutionStrategy.PIPELINE:
+                lines.append(
+                    f"  Items: {len(stage.items)} "
+                    f"(queue: {stage.queue_size}, workers/step: {stage.step_concurrency})"
+                )
             lines.append("")
 
             for j, task in enumerate(stage.tasks, 1):
                 deps = f" (depends: {', '.join(task.dependencies)})" if task.dependencies else ""
                 lines.append(f"    {j}. [{task.agent_id}] {task.description}{deps}")
-                lines.append(f"       Duration: ~{task.estimated_duration}s")
+                p90 = f" (P90: {task.estimated_duration_p90}s)" if task.estimated_duration_p90 else ""
+                slack = f", slack: {task.slack}s" if task.slack is not None else ""
+                lines.append(f"       Duration: ~{task.estimated_duration}s{p90}{slack}")
 
             lines.append("")
 
@@ -60,6 +60,55 @@ def temp_working_dir(tmp_path):
     return working_dir
 
 
+@pytest.fixture
+def pool_engine(tmp_path):
+    """
+    Factory for an ExecutionEngine backed by a real agent pool of one expert.
+
+    Call as pool_engine(coder, expert_id=..., max_instances=..., working_directory=...,
+    **engine_kwargs); returns (engine, pool_manager). The coder stands in for
+    the Claude coder (async execute_task(task, working_dir)).
+    """
+    import json
+    import types
+    from apps.realtime_poc.big_three_realtime_agents.agents.pool.agent_pool import (
+        AgentPoolManager,
+    )
+    from apps.realtime_poc.big_three_realtime_agents.agents.pool.instance_executor import (
+        InstanceExecutor,
+    )
+    from apps.realtime_poc.big_three_realtime_agents.workflow.execution_engine import (
+        ExecutionEngine,
+    )
+
+    def make(coder, expert_id="BackendExpert", max_instances=1,
+             working_directory=None, **engine_kwargs):
+        definitions = tmp_path / "experts.json"
+        definitions.write_text(json.dumps({"expert_pool": {
+            expert_id: {
+                "name": expert_id,
+                "specialization": "general",
+                "description": f"{expert_id} for tests",
+                "skills": [],
+                "system_prompt_template": str(tmp_path / "missing.md"),
+                "allowed_tools": [],
+                "working_directory": str(working_directory or tmp_path),
+                "max_instances": max_instances,
+                "session_config": {},
+            }
+        }}))
+        pool_manager = AgentPoolManager(pool_definition_path=str(definitions))
+        pool = types.SimpleNamespace(
+            pool_manager=pool_manager, executor=InstanceExecutor(pool_manager, coder)
+        )
+        memory = types.SimpleNamespace(
+            workflow=types.SimpleNamespace(store_execution=lambda *args: None)
+        )
+        return ExecutionEngine(pool, memory, **engine_kwargs), pool_manager
+
+    return make
+
+
 @pytest.fixture
 def mock_websocket():
     """Mock WebSocket connection for OpenAI Realtime API."""
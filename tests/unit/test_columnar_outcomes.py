@@ -0,0 +1,67 @@
+"""
+Unit tests for the columnar outcome store.
+"""
+
+import numpy as np
+
+from apps.realtime_poc.big_three_realtime_agents.learning.columnar_outcomes import (
+    ColumnarOutcomes,
+)
+from apps.realtime_poc.big_three_realtime_agents.learning.outcome_tracker import (
+    OutcomeTracker,
+)
+
+
+def test_vectorized_groupby_matches_outcomes(tmp_path):
+    """Success rates and percentiles per agent; columns reload memory-mapped."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=500)
+    for i in range(2000):
+        tracker.record_outcome("Build REST API", "backend", i % 4 != 0, duration=i % 100 + 1)
+        tracker.record_outcome("Fix login crash", "debugger", True)
+    tracker.close()
+
+    columns = tracker.columns
+    rates = columns.success_rates(by="agent")
+    assert rates["backend"] == {"total": 2000, "successes": 1500, "success_rate": 0.75}
+    assert rates["debugger"]["success_rate"] == 1.0
+
+    latency = columns.duration_percentiles(by="agent")
+    assert "debugger" not in latency
+    assert latency["backend"]["count"] == 2000
+    assert latency["backend"]["p50"] == 50.5
+
+    by_type = columns.success_rates(by="task_type", mask=columns.mask(agent_id="debugger"))
+    assert list(by_type) == ["debugging"]
+
+    reloaded = ColumnarOutcomes(tmp_path / "columnar")
+    assert len(reloaded) == 4000
+    assert isinstance(reloaded.column("duration").base, np.memmap)
+    assert reloaded.success_rates(by="agent") == rates
+
+    outcomes = list(tracker.iter_outcomes())
+    reloaded.catch_up(outcomes + [outcomes[0]])
+    assert reloaded.success_rates(by="agent")["backend"]["total"] == 2001
+
+
+def test_tracker_windowed_analytics_and_learning_stats(tmp_path):
+    """Tracker queries filter by agent/time; learning stats read the columns."""
+    from datetime import datetime, timedelta
+
+    from apps.realtime_poc.big_three_realtime_agents.learning.learning_manager import (
+        LearningManager,
+    )
+
+    learning = LearningManager(tmp_path)
+    tracker = learning.tracker
+    tracker.record_outcome("Build REST API", "backend", True, duration=10)
+    tracker.record_outcome("Build REST API", "backend", False, duration=30)
+    tracker.record_outcome("Fix login crash", "debugger", True, duration=0)
+
+    assert tracker.success_rates(agent_id="backend")["backend"]["success_rate"] == 0.5
+    assert tracker.success_rates(since=datetime.now() + timedelta(hours=1)) == {}
+    assert tracker.duration_percentiles(by="agent")["debugger"]["p50"] == 0.0
+
+    stats = learning.get_learning_stats()
+    assert stats["agent_latency"]["backend"] == {"p50": 20.0, "p90": 28.0, "count": 2}
+    assert stats["task_type_performance"]["debugging"]["total"] == 1
+    tracker.close()
@@ -0,0 +1,95 @@
+"""
+Unit tests for critical path analysis and slack-based scheduling.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.realtime_poc.big_three_realtime_agents.workflow.critical_path import (
+    analyze_critical_path,
+    annotate_plan,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.dag_scheduler import (
+    DAGScheduler,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import (
+    ExecutionStrategy,
+    WorkflowPlan,
+    WorkflowStage,
+    WorkflowTask,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_planner import (
+    WorkflowPlanner,
+)
+
+
+def _task(task_id, duration, dependencies=()):
+    return WorkflowTask(
+        task_id, f"Task {task_id}", "backend",
+        estimated_duration=duration, dependencies=list(dependencies),
+    )
+
+
+def test_slack_and_critical_path():
+    """Diamond with an uneven branch: the long branch has zero slack."""
+    tasks = [
+        _task("design", 30),
+        _task("docs", 10, ["design"]),
+        _task("api", 100, ["design"]),
+        _task("review", 20, ["docs", "api"]),
+        _task("side", 5),
+    ]
+
+    analysis = analyze_critical_path(tasks)
+
+    assert analysis.length == 150
+    assert analysis.tasks == ["design", "api", "review"]
+    assert analysis.slack == {"design": 0, "side": 145, "docs": 90, "api": 0, "review": 0}
+    assert analysis.earliest_start["review"] == 130
+
+
+def test_planner_exposes_critical_path():
+    planner = WorkflowPlanner(None, None)
+    plan = planner.create_multi_task_plan(
+        "Ship feature",
+        [
+            {"description": "Schema", "agent_id": "db", "duration": 60},
+            {"description": "Endpoints", "agent_id": "api", "duration": 90,
+             "dependencies": ["task_1"]},
+            {"description": "Changelog", "agent_id": "docs", "duration": 10},
+        ],
+        strategy=ExecutionStrategy.PARALLEL,
+    )
+
+    assert plan.critical_path == ["task_1", "task_2"]
+    assert plan.estimated_total_duration == 150
+    assert plan.get_task_by_id("task_3").slack == 140
+    assert "Critical Path: task_1 -> task_2" in planner.visualize_plan(plan)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_starts_critical_chain_first():
+    """With two slots, the chain starts at once and the makespan drops from 4 to 3 steps."""
+    tasks = [
+        _task("short_a", 10),
+        _task("short_b", 10),
+        _task("chain_1", 10),
+        _task("chain_2", 10, ["chain_1"]),
+        _task("chain_3", 10, ["chain_2"]),
+    ]
+    annotate_plan(WorkflowPlan("plan_1", "Goal", [WorkflowStage("stage_1", "All", tasks)], 0))
+    started = []
+
+    async def run(task):
+        started.append(task.task_id)
+        await asyncio.sleep(0.05)
+        return {"task_id": task.task_id, "status": "completed"}
+
+    loop = asyncio.get_running_loop()
+    begin = loop.time()
+    await DAGScheduler(run, max_concurrency=2).run(tasks)
+    elapsed = loop.time() - begin
+
+    assert started[:2] == ["chain_1", "short_a"]
+    assert elapsed < 0.05 * 3.5
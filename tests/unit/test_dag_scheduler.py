@@ -0,0 +1,104 @@
+"""
+Unit tests for the dependency-aware DAG scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.realtime_poc.big_three_realtime_agents.exceptions import WorkflowValidationError
+from apps.realtime_poc.big_three_realtime_agents.workflow.dag_scheduler import (
+    DAGScheduler,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import (
+    TaskStatus,
+    WorkflowTask,
+)
+
+
+def _task(task_id, agent_id="backend", dependencies=()):
+    return WorkflowTask(task_id, f"Task {task_id}", agent_id, dependencies=list(dependencies))
+
+
+class _Runner:
+    """Records start order and peak concurrency; fails tasks named in fail."""
+
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.started = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, task):
+        self.started.append(task.task_id)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        task.start()
+        await asyncio.sleep(self.delays.get(task.task_id, 0.01))
+        self.running -= 1
+        if task.task_id in self.fail:
+            task.fail("boom")
+            return {"task_id": task.task_id, "status": "failed", "error": "boom"}
+        task.complete({})
+        return {"task_id": task.task_id, "status": "completed"}
+
+
+@pytest.mark.asyncio
+async def test_tasks_start_when_dependencies_complete():
+    """A fast branch proceeds without waiting for a slow sibling."""
+    tasks = [
+        _task("slow"),
+        _task("fast"),
+        _task("after_fast", dependencies=["fast"]),
+        _task("join", dependencies=["slow", "after_fast"]),
+    ]
+    runner = _Runner(delays={"slow": 0.1})
+
+    results = await DAGScheduler(runner).run(tasks)
+
+    assert runner.started.index("after_fast") < runner.started.index("join")
+    assert runner.started[-1] == "join"
+    assert all(r["status"] == "completed" for r in results.values())
+    assert list(results) == ["slow", "fast", "after_fast", "join"]
+
+
+@pytest.mark.asyncio
+async def test_limits_and_failure_propagation():
+    """Global/expert limits hold; a failure skips only its dependents."""
+    tasks = [_task(f"t{i}", agent_id="db" if i < 3 else "web") for i in range(6)]
+    tasks.append(_task("child", dependencies=["t0"]))
+    tasks.append(_task("grandchild", dependencies=["child"]))
+    runner = _Runner(fail={"t0"})
+
+    results = await DAGScheduler(
+        runner, max_concurrency=3, expert_capacity=lambda agent: 1 if agent == "db" else None
+    ).run(tasks)
+
+    assert runner.peak <= 3
+    assert results["child"]["status"] == "skipped"
+    assert tasks[-1].status == TaskStatus.SKIPPED
+    assert results["t5"]["status"] == "completed"
+    assert "child" not in runner.started
+
+
+@pytest.mark.asyncio
+async def test_cycles_rejected_before_running():
+    """Cycles and unknown dependencies raise without executing anything."""
+    runner = _Runner()
+    with pytest.raises(WorkflowValidationError, match="cycle"):
+        await DAGScheduler(runner).run([_task("a", dependencies=["b"]), _task("b", dependencies=["a"])])
+    with pytest.raises(WorkflowValidationError, match="unknown"):
+        await DAGScheduler(runner).run([_task("a", dependencies=["missing"])])
+    assert runner.started == []
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_cancels_running_and_unstarted_tasks():
+    tasks = [_task("bad"), _task("slow"), _task("later", dependencies=["slow"])]
+    runner = _Runner(delays={"slow": 5}, fail={"bad"})
+
+    results = await asyncio.wait_for(DAGScheduler(runner, fail_fast=True).run(tasks), 2)
+
+    assert [r["status"] for r in results.values()] == ["failed", "cancelled", "cancelled"]
+    assert tasks[2].status == TaskStatus.CANCELLED
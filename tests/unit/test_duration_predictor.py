@@ -0,0 +1,98 @@
+"""
+Unit tests for the learned task-duration predictor.
+"""
+
+import random
+
+from apps.realtime_poc.big_three_realtime_agents.learning.duration_predictor import (
+    DurationPredictor,
+    collect_training_samples,
+)
+from apps.realtime_poc.big_three_realtime_agents.learning.outcome_tracker import (
+    OutcomeTracker,
+)
+from apps.realtime_poc.big_three_realtime_agents.learning.train_duration_model import (
+    main as train_duration_model_main,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import (
+    ExecutionStrategy,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_planner import (
+    WorkflowPlanner,
+)
+
+
+def _record_history(tracker):
+    rng = random.Random(3)
+    for _ in range(40):
+        tracker.record_outcome(
+            "Fix crash in login page", "debugger", True, duration=60 * rng.uniform(0.8, 1.25)
+        )
+        tracker.record_outcome(
+            "Build REST API with database migrations", "backend-architect", True,
+            duration=600 * rng.uniform(0.8, 1.25),
+        )
+
+
+def _train(tmp_path):
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=100)
+    _record_history(tracker)
+    tracker.flush()
+
+    predictor = DurationPredictor()
+    assert predictor.fit(collect_training_samples(tracker))
+    tracker.close()
+    return predictor
+
+
+def test_predicts_per_expert_quantiles_and_round_trips(tmp_path):
+    """Estimates follow each expert's history; P90 >= P50; model reloads."""
+    predictor = _train(tmp_path)
+
+    fast = predictor.predict("Fix crash in login page", "debugger")
+    slow = predictor.predict("Build REST API with database migrations", "backend-architect")
+    assert 45 <= fast.p50 <= 80
+    assert 450 <= slow.p50 <= 800
+    assert fast.p90 >= fast.p50 and slow.p90 >= slow.p50
+
+    model_file = tmp_path / "duration_model.json"
+    predictor.save(model_file)
+    assert DurationPredictor.load(model_file).predict("Fix crash in login page", "debugger") == fast
+    assert DurationPredictor.load(tmp_path / "missing.json").predict("x", "y") is None
+
+
+def test_planner_uses_predicted_durations(tmp_path):
+    """Plans carry P50/P90 from the model; explicit durations still win."""
+    planner = WorkflowPlanner(None, None, duration_predictor=_train(tmp_path))
+
+    plan = planner.create_multi_task_plan(
+        "Ship login fix",
+        [
+            {"description": "Fix crash in login page", "agent_id": "debugger"},
+            {"description": "Build REST API with database migrations",
+             "agent_id": "backend-architect"},
+            {"description": "Write release notes", "agent_id": "writer", "duration": 30},
+        ],
+        strategy=ExecutionStrategy.SEQUENTIAL,
+    )
+
+    tasks = plan.get_all_tasks()
+    assert tasks[2].estimated_duration == 30 and tasks[2].estimated_duration_p90 is None
+    assert plan.estimated_total_duration == sum(t.estimated_duration for t in tasks)
+    assert plan.estimated_total_duration < plan.estimated_total_duration_p90 < sum(
+        t.estimated_duration_p90 or t.estimated_duration for t in tasks
+    )
+    assert "P90" in planner.visualize_plan(plan)
+
+
+def test_offline_entry_point_trains_and_saves_model(tmp_path):
+    """The training command fits from stored outcomes and writes the model file."""
+    assert train_duration_model_main(["--storage-dir", str(tmp_path), "--no-tiers"]) == 1
+
+    tracker = OutcomeTracker(tmp_path / "learning")
+    _record_history(tracker)
+    tracker.close()
+
+    assert train_duration_model_main(["--storage-dir", str(tmp_path), "--no-tiers"]) == 0
+    model = DurationPredictor.load(tmp_path / "learning" / "duration_model.json")
+    assert model.is_trained and model.sample_count == 80
@@ -0,0 +1,136 @@
+"""
+Unit tests for pool-backed workflow execution.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.realtime_poc.big_three_realtime_agents.agents.pool.agent_pool import AgentStatus
+from apps.realtime_poc.big_three_realtime_agents.learning.learning_manager import (
+    LearningManager,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import (
+    ExecutionStrategy,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_planner import (
+    WorkflowPlanner,
+)
+
+
+class FakeCoder:
+    """Stands in for the Claude coder; tracks concurrent executions."""
+
+    def __init__(self, delay=0.02, block=False):
+        self.delay = delay
+        self.block = block
+        self.running = 0
+        self.peak = 0
+        self.tasks = []
+
+    async def execute_task(self, task, working_dir):
+        self.tasks.append(task)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(3600 if self.block else self.delay)
+        finally:
+            self.running -= 1
+        return {"output": f"done: {task.splitlines()[-1]}", "files_modified": []}
+
+
+@pytest.mark.asyncio
+async def test_planned_workflow_runs_on_pool_instances(tmp_path, pool_engine):
+    """Parallel tasks queue for the single instance and outcomes are recorded."""
+    coder = FakeCoder()
+    learning = LearningManager(tmp_path / "learning")
+    engine, pool_manager = pool_engine(coder, learning_manager=learning)
+
+    plan = WorkflowPlanner(pool_manager, None).create_multi_task_plan(
+        "Build API",
+        [{"description": f"Endpoint {i}", "agent_id": "BackendExpert"} for i in range(3)],
+        strategy=ExecutionStrategy.PARALLEL,
+    )
+    results = await engine.execute_plan(plan)
+
+    assert results["status"] == "completed"
+    task_results = results["stage_results"][0]["task_results"]
+    assert {r["instance_id"] for r in task_results} == {"BackendExpert#1"}
+    assert task_results[0]["output"].startswith("done")
+    assert coder.peak == 1
+    assert pool_manager.get_instance("BackendExpert#1").status == AgentStatus.IDLE
+    assert learning.tracker.get_agent_stats("BackendExpert")["successes"] == 3
+
+
+@pytest.mark.asyncio
+async def test_instance_reacquired_by_another_caller_is_not_released(pool_engine):
+    """Once the executor releases, the engine leaves the next holder's instance alone."""
+    coder = FakeCoder()
+    engine, pool_manager = pool_engine(coder)
+    plan = WorkflowPlanner(pool_manager, None).create_simple_plan("First", "BackendExpert")
+
+    async def other_caller():
+        while True:
+            instance = await pool_manager.acquire_expert("BackendExpert", "Other work")
+            if instance is not None:
+                pool_manager.mark_working(instance.instance_id)
+                return instance
+            await asyncio.sleep(0)
+
+    workflow = asyncio.ensure_future(engine.execute_plan(plan))
+    await asyncio.sleep(0.005)
+    other = await other_caller()
+    results = await workflow
+
+    assert results["status"] == "completed"
+    assert other.instance_id == "BackendExpert#1"
+    assert other.status == AgentStatus.WORKING
+    assert other.current_task == "Other work"
+
+
+@pytest.mark.asyncio
+async def test_failures_and_cancellation_release_instances(pool_engine):
+    """Unknown experts fail fast; cancelled tasks give their instance back."""
+    coder = FakeCoder(block=True)
+    engine, pool_manager = pool_engine(coder, acquire_timeout=0.1)
+
+    plan = WorkflowPlanner(pool_manager, None).create_multi_task_plan(
+        "Mixed", [{"description": "Ghost work", "agent_id": "GhostExpert"}]
+    )
+    results = await engine.execute_plan(plan)
+    assert "not found" in results["stage_results"][0]["task_results"][0]["error"]
+
+    plan = WorkflowPlanner(pool_manager, None).create_simple_plan("Hang", "BackendExpert")
+    running = asyncio.ensure_future(engine.execute_plan(plan))
+    await asyncio.sleep(0.05)
+    assert pool_manager.get_instance("BackendExpert#1").status == AgentStatus.WORKING
+
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+    assert pool_manager.get_instance("BackendExpert#1").status == AgentStatus.IDLE
+
+
+class RaisingCoder:
+    async def execute_task(self, task, working_dir):
+        raise RuntimeError("compiler crashed")
+
+
+@pytest.mark.asyncio
+async def test_coder_error_fails_task_without_changing_executor_contract(pool_engine):
+    """The executor still returns the error as output; the engine fails the task."""
+    engine, pool_manager = pool_engine(RaisingCoder())
+
+    instance = await pool_manager.acquire_expert("BackendExpert", "Direct call")
+    direct = await engine.pool.executor.execute_task(instance.instance_id, "Direct call")
+    assert direct["success"] is True
+    assert direct["output"] == "Execution error: compiler crashed"
+    assert direct["error"] == "compiler crashed"
+
+    plan = WorkflowPlanner(pool_manager, None).create_simple_plan("Build", "BackendExpert")
+    results = await engine.execute_plan(plan)
+
+    task_result = results["stage_results"][0]["task_results"][0]
+    assert task_result["status"] == "failed"
+    assert task_result["error"] == "compiler crashed"
+    assert pool_manager.get_instance("BackendExpert#1").status == AgentStatus.IDLE
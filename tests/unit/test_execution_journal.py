@@ -0,0 +1,119 @@
+"""
+Unit tests for workflow checkpointing and resume.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from apps.realtime_poc.big_three_realtime_agents.workflow.execution_journal import (
+    ExecutionJournal,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import (
+    TaskStatus,
+    WorkflowPlan,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_planner import (
+    WorkflowPlanner,
+)
+
+
+class BlockingCoder:
+    """Fake coder that hangs on tasks mentioning block_on."""
+
+    def __init__(self, block_on=None):
+        self.block_on = block_on
+        self.prompts = []
+        self.blocked = asyncio.Event()
+
+    async def execute_task(self, task, working_dir):
+        self.prompts.append(task)
+        if self.block_on and self.block_on in task:
+            self.blocked.set()
+            await asyncio.sleep(3600)
+        return {"output": "ok", "files_modified": []}
+
+
+def _engine(pool_engine, coder, journal):
+    engine, _ = pool_engine(coder, expert_id="Refactorer", max_instances=2, journal=journal)
+    return engine
+
+
+def _plan():
+    return WorkflowPlanner(None, None).create_multi_task_plan(
+        "Refactor modules",
+        [{"description": f"Refactor module {i}", "agent_id": "Refactorer", "duration": 60}
+         for i in range(1, 4)],
+    )
+
+
+def test_plan_round_trip():
+    plan = _plan()
+    plan.stages[0].tasks[0].complete({"output": "done"})
+
+    restored = WorkflowPlan.from_dict(json.loads(json.dumps(plan.to_dict())))
+
+    assert restored.plan_id == plan.plan_id
+    assert restored.stages[0].strategy == plan.stages[0].strategy
+    assert restored.stages[0].tasks[0].status == TaskStatus.COMPLETED
+    assert restored.stages[0].tasks[0].completed_at == plan.stages[0].tasks[0].completed_at
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_completed_and_reruns_interrupted(tmp_path, pool_engine):
+    journal = ExecutionJournal(tmp_path / "journal", fsync=False)
+
+    # First run dies while module 2 is in flight
+    coder = BlockingCoder(block_on="Refactor module 2")
+    running = asyncio.ensure_future(_engine(pool_engine, coder, journal).execute_plan(_plan()))
+    await asyncio.wait_for(coder.blocked.wait(), 5)
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+
+    execution_id = journal.unfinished()[0]
+    with open(journal.storage_dir / f"{execution_id}.jsonl", "a") as f:
+        f.write('{"event": "task_fin')  # torn write
+
+    state = journal.load(execution_id)
+    assert list(state.completed) == ["task_1"]
+    assert state.in_flight == ["task_2"]
+
+    # Restart: a fresh engine resumes from the journal
+    coder = BlockingCoder()
+    results = await _engine(pool_engine, coder, journal).resume(execution_id)
+
+    assert results["status"] == "completed"
+    assert results["restored_tasks"] == 1
+    assert len(coder.prompts) == 2
+    assert "attempt 2" in coder.prompts[0]
+    task_results = results["stage_results"][0]["task_results"]
+    assert task_results[0]["restored"] is True
+    assert task_results[1]["idempotency_key"] == f"{execution_id}:task_2"
+    assert journal.unfinished() == []
+
+
+class ThreadRecordingJournal(ExecutionJournal):
+    """Journal that notes which thread each append runs on."""
+
+    def __init__(self, storage_dir):
+        super().__init__(storage_dir, fsync=False)
+        self.threads = set()
+
+    def _append(self, execution_id, event):
+        self.threads.add(threading.get_ident())
+        super()._append(execution_id, event)
+
+
+@pytest.mark.asyncio
+async def test_journal_writes_run_off_the_event_loop(tmp_path, pool_engine):
+    journal = ThreadRecordingJournal(tmp_path / "journal")
+
+    results = await _engine(pool_engine, BlockingCoder(), journal).execute_plan(_plan())
+
+    assert results["status"] == "completed"
+    assert journal.threads and threading.get_ident() not in journal.threads
+    state = journal.load(results["execution_id"])
+    assert state.is_finished and len(state.completed) == 3
@@ -0,0 +1,72 @@
+"""
+Unit tests for ExpertBandit.
+"""
+
+import json
+
+from apps.realtime_poc.big_three_realtime_agents.learning.expert_bandit import (
+    BanditConfig,
+    ExpertBandit,
+)
+from apps.realtime_poc.big_three_realtime_agents.learning.outcome_tracker import (
+    OutcomeTracker,
+)
+
+
+def test_prefers_fast_cheap_expert_and_logs_decisions(tmp_path):
+    """Equal success rates are broken by latency and cost; decisions are logged."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=100)
+    log_file = tmp_path / "decisions.jsonl"
+    bandit = ExpertBandit(tracker, BanditConfig(seed=7), log_file=log_file)
+
+    for _ in range(30):
+        tracker.record_outcome("Build REST API", "fast", True, duration=10, cost=1000)
+        tracker.record_outcome("Build REST API", "slow", True, duration=290, cost=45000)
+
+    stats = bandit.get_arm_stats("backend")
+    assert stats["fast"]["mean"] > stats["slow"]["mean"]
+    assert stats["fast"]["pulls"] == 30
+
+    choices = [bandit.select("Build API endpoint", ["slow", "fast"]) for _ in range(50)]
+    assert choices.count("fast") >= 40
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    decisions = [r for r in records if r["event"] == "decision"]
+    assert len(decisions) == 50
+    assert decisions[0]["category"] == "backend"
+    assert any(r["event"] == "reward" for r in records)
+    tracker.close()
+
+
+def test_zero_exploration_is_greedy():
+    """max_exploration=0 always picks the best posterior mean."""
+    bandit = ExpertBandit(config=BanditConfig(max_exploration=0, seed=1))
+    bandit.update("general", "good", True)
+    bandit.update("general", "bad", False)
+
+    assert all(bandit.select("misc", ["bad", "good"], category="general") == "good"
+               for _ in range(20))
+    assert bandit.reward(False) == 0.0
+    assert bandit.reward(True, duration=0, cost=0) == 1.0
+    # Unknown duration is neither rewarded as instant nor penalized as slow
+    assert bandit.reward(True, duration=None, cost=0) == (1.0 + 0.3 * 0.5 + 0.2) / 1.5
+
+
+def test_rewards_reference_their_decision(tmp_path):
+    """Reward records carry the decision_id of the decision they score."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=100)
+    log_file = tmp_path / "decisions.jsonl"
+    bandit = ExpertBandit(tracker, BanditConfig(seed=3), log_file=log_file)
+
+    first = bandit.select("Build REST API", ["backend"])
+    second = bandit.select("Build REST API", ["backend"])
+    tracker.record_outcome("Build REST API", first, True, duration=5)
+    tracker.record_outcome("Build REST API", second, False)
+    tracker.record_outcome("Build REST API", "backend", True)
+    tracker.close()
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    decision_ids = [r["decision_id"] for r in records if r["event"] == "decision"]
+    rewards = [r for r in records if r["event"] == "reward"]
+    assert [r["decision_id"] for r in rewards] == decision_ids + [None]
+    assert rewards[0]["reward"] > 0 and rewards[1]["reward"] == 0
@@ -0,0 +1,82 @@
+"""
+Unit tests for time-bucketed outcome rollups.
+"""
+
+from datetime import datetime, timedelta
+
+from apps.realtime_poc.big_three_realtime_agents.learning.outcome_rollups import (
+    OutcomeRollups,
+)
+from apps.realtime_poc.big_three_realtime_agents.learning.outcome_tracker import (
+    OutcomeTracker,
+)
+
+
+def _outcome(moment, agent_id, success, duration):
+    return {
+        "timestamp": moment.isoformat(),
+        "status": "success" if success else "failure",
+        "task": "Build REST API",
+        "task_type": "backend",
+        "agent_id": agent_id,
+        "duration": duration,
+    }
+
+
+def test_detects_regression_last_day_vs_previous_week():
+    """A drop in success rate and a latency jump are flagged per agent."""
+    now = datetime.now()
+    rollups = OutcomeRollups()
+
+    for day in range(2, 8):
+        for _ in range(3):
+            rollups.update(_outcome(now - timedelta(days=day), "backend", True, 10))
+            rollups.update(_outcome(now - timedelta(days=day), "stable", True, 10))
+    for hour in range(1, 7):
+        rollups.update(_outcome(now - timedelta(hours=hour), "backend", hour % 2 == 0, 30))
+        rollups.update(_outcome(now - timedelta(hours=hour), "stable", True, 11))
+
+    comparison = rollups.compare_windows(agent_id="backend", now=now)
+    assert comparison["current"]["total"] == 6
+    assert comparison["baseline"]["total"] == 18
+    assert comparison["success_rate_delta"] == -0.5
+    assert comparison["duration_ratio"] == 3.0
+
+    regressions = rollups.detect_regressions(now=now)
+    assert [(r["agent_id"], r["reasons"]) for r in regressions] == [
+        ("backend", ["success_rate", "latency"])
+    ]
+    assert sum(b["total"] for b in rollups.trend("day", agent_id="stable")) == 24
+
+
+def test_rollups_persist_with_watermark(tmp_path):
+    """Reloading folds only outcomes past the persisted watermark."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=1)
+    for _ in range(3):
+        tracker.record_outcome("Build REST API", "backend", True, duration=5)
+    tracker.close()
+
+    assert OutcomeRollups(tmp_path / "rollups.json").watermark == 3
+
+    reloaded = OutcomeTracker(tmp_path)
+    stats = reloaded.compare_windows(agent_id="backend")["current"]
+    assert stats["total"] == 3
+    assert stats["mean_duration"] == 5
+    reloaded.close()
+
+
+def test_rollups_saved_periodically_not_per_flush(tmp_path):
+    """Flushes skip the rollup rewrite; a crash before close re-folds from the log."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=1)
+    for _ in range(4):
+        tracker.record_outcome("Build REST API", "backend", True, duration=5)
+
+    assert (tmp_path / "outcomes.jsonl").exists()
+    assert not (tmp_path / "rollups.json").exists()
+
+    # No close(): the next tracker catches up from the log
+    crashed = OutcomeTracker(tmp_path)
+    assert crashed.compare_windows(agent_id="backend")["current"]["total"] == 4
+    crashed.close()
+    tracker.close()
+    assert OutcomeRollups(tmp_path / "rollups.json").watermark == 4
@@ -0,0 +1,135 @@
+"""
+Unit tests for OutcomeTracker JSONL persistence.
+"""
+
+import gc
+import json
+import weakref
+
+from apps.realtime_poc.big_three_realtime_agents.learning.outcome_tracker import (
+    OutcomeTracker,
+)
+
+
+def test_outcomes_are_batched_and_reloaded(tmp_path):
+    """Outcomes are buffered until a batch fills, then appended as JSONL."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=3, flush_interval=60)
+    tracker.record_success("Build API", "backend-architect", {"duration_seconds": 5})
+    tracker.record_failure("Build UI", "frontend-developer", "timeout")
+
+    log_file = tmp_path / "outcomes.jsonl"
+    assert not log_file.exists()
+
+    tracker.record_success("Write tests", "test-engineer", {})
+    assert len(log_file.read_text().splitlines()) == 3
+
+    tracker.record_success("Deploy", "devops", {})
+    tracker.close()
+
+    reloaded = OutcomeTracker(tmp_path)
+    assert [o["task"] for o in reloaded.get_recent_outcomes()] == [
+        "Build API", "Build UI", "Write tests", "Deploy",
+    ]
+    reloaded.close()
+
+
+def test_partial_trailing_line_is_recovered(tmp_path):
+    """A record cut off by a crash is dropped; earlier records survive."""
+    log_file = tmp_path / "outcomes.jsonl"
+    complete = json.dumps({"status": "success", "task": "ok", "agent_id": "a"})
+    log_file.write_text(complete + "\n" + '{"status": "succ')
+
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=1)
+    assert len(tracker.get_recent_outcomes()) == 1
+
+    tracker.record_failure("next", "a", "boom")
+    lines = log_file.read_text().splitlines()
+    assert [json.loads(line)["task"] for line in lines] == ["ok", "next"]
+    tracker.close()
+
+
+def test_log_rotates_and_streams_all_segments(tmp_path):
+    """Rotated segments are read back in order."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=1, max_log_bytes=200)
+    for i in range(10):
+        tracker.record_success(f"task {i}", "agent", {})
+    tracker.close()
+
+    assert list(tmp_path.glob("outcomes.*.jsonl"))
+
+    reloaded = OutcomeTracker(tmp_path)
+    assert [o["task"] for o in reloaded.iter_outcomes()] == [f"task {i}" for i in range(10)]
+    reloaded.close()
+
+
+def test_legacy_json_is_migrated(tmp_path):
+    """Legacy outcomes.json is converted to the JSONL log once."""
+    legacy = [{"status": "success", "task": "old", "agent_id": "a"}]
+    (tmp_path / "outcomes.json").write_text(json.dumps(legacy))
+
+    tracker = OutcomeTracker(tmp_path)
+
+    assert tracker.get_success_rate("a") == 1.0
+    assert (tmp_path / "outcomes.jsonl").exists()
+    assert not (tmp_path / "outcomes.json").exists()
+    tracker.close()
+
+
+def test_incremental_agent_stats_match_rebuild(tmp_path):
+    """Per-agent/task-type aggregates update on record and survive rebuild."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=1)
+    for duration in (10, 20, 30, 40):
+        tracker.record_outcome("Create API endpoint", "backend", True, duration=duration)
+    tracker.record_outcome("Fix login bug", "backend", False, error="boom")
+
+    stats = tracker.get_agent_stats("backend")
+    assert stats["total"] == 5
+    assert stats["success_rate"] == 0.8
+    assert stats["mean_duration"] == 25
+    assert stats["p50_duration"] in (20, 30)
+    assert tracker.get_agent_stats("backend", task_type="backend")["success_rate"] == 1.0
+    assert tracker.get_task_type_stats("debugging")["failures"] == 1
+
+    before = tracker.get_agent_stats("backend")
+    tracker.rebuild_stats()
+    assert tracker.get_agent_stats("backend") == before
+    assert OutcomeTracker(tmp_path).get_success_rate("backend") == 0.8
+    tracker.close()
+
+
+def test_memory_holds_only_recent_window(tmp_path):
+    """Only the recent window is kept in memory; full history streams from disk."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=4, recent_window=5)
+    for i in range(12):
+        tracker.record_success(f"task {i}", "agent" if i % 2 else "other", {})
+
+    assert [o["task"] for o in tracker.get_recent_outcomes(limit=100)] == [
+        f"task {i}" for i in range(7, 12)
+    ]
+    assert len(tracker.get_outcomes_for_agent("agent")) == 6
+    tracker.close()
+
+    reloaded = OutcomeTracker(tmp_path, recent_window=3)
+    assert len(reloaded.get_recent_outcomes()) == 3
+    assert reloaded.stats.overall.count == 12
+    assert reloaded.record_outcome("next", "agent", True)["outcome_id"] == "success_12"
+    reloaded.close()
+
+
+def test_unclosed_tracker_can_be_collected(tmp_path):
+    """The exit hook does not keep trackers alive."""
+    tracker = OutcomeTracker(tmp_path)
+    ref = weakref.ref(tracker)
+    del tracker
+    gc.collect()
+    assert ref() is None
+
+
+def test_record_success_without_duration_records_none(tmp_path):
+    """A result without duration_seconds is recorded as unknown, not 0s."""
+    tracker = OutcomeTracker(tmp_path)
+    tracker.record_success("Build API", "backend-architect", {"status": "ok"})
+
+    outcome = tracker.get_recent_outcomes(1)[0]
+    assert outcome.get("duration") is None
+    tracker.close()
@@ -0,0 +1,86 @@
+"""
+Unit tests for incremental PatternAnalyzer.
+"""
+
+from apps.realtime_poc.big_three_realtime_agents.learning.outcome_tracker import (
+    OutcomeTracker,
+)
+from apps.realtime_poc.big_three_realtime_agents.learning.pattern_analyzer import (
+    PatternAnalyzer,
+)
+
+
+def test_old_signals_survive_beyond_recent_window(tmp_path):
+    """Outcomes older than the last hundred still inform recommendations."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=100)
+    analyzer = PatternAnalyzer(tracker)
+
+    for _ in range(5):
+        tracker.record_outcome("Write database migration", "db-expert", True)
+    for i in range(150):
+        tracker.record_outcome(f"Style landing page variant {i}", "frontend", True)
+
+    agent, confidence = analyzer.get_best_agent_for_task("Plan schema migration")
+    assert agent == "db-expert"
+    assert confidence == 1.0
+
+    patterns = analyzer.analyze_agent_task_patterns()
+    assert patterns["agent_success_rates"]["db-expert"]["total"] == 5
+    assert patterns["task_keywords"]["migration"] == 5
+    assert patterns["best_agents_by_keyword"]["migration"]["agent_id"] == "db-expert"
+    assert ("database", 5) in analyzer.get_related_keywords("migration")
+    tracker.close()
+
+
+def test_decay_prefers_recent_performance(tmp_path):
+    """With a short half-life, recent successes outweigh old ones."""
+    tracker = OutcomeTracker(tmp_path, flush_batch_size=100)
+    analyzer = PatternAnalyzer(tracker, half_life=5)
+
+    for _ in range(10):
+        tracker.record_outcome("Optimize query performance", "old-agent", True)
+    for _ in range(10):
+        tracker.record_outcome("Optimize query performance", "old-agent", False)
+    for _ in range(4):
+        tracker.record_outcome("Optimize query performance", "new-agent", True)
+
+    agent, _ = analyzer.get_best_agent_for_task("Optimize query performance")
+    assert agent == "new-agent"
+
+    rates = analyzer.analyze_agent_task_patterns()["agent_success_rates"]
+    assert rates["old-agent"]["rate"] == 0.5
+    assert rates["old-agent"]["weighted_rate"] < 0.5
+
+    # A new analyzer folds the existing history on startup
+    rebuilt = PatternAnalyzer(tracker, half_life=5)
+    assert rebuilt.get_best_agent_for_task("Optimize query performance")[0] == "new-agent"
+    tracker.close()
+
+
+def test_minhash_lsh_finds_similar_tasks_across_history(tmp_path):
+    """Similar tasks are found anywhere in history; unrelated ones are not."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.workflow_memory import (
+        WorkflowMemory,
+    )
+
+    tracker = OutcomeTracker(tmp_path / "learning", flush_batch_size=100)
+    analyzer = PatternAnalyzer(tracker, similarity_threshold=0.4)
+
+    tracker.record_outcome("Build REST API for blog posts", "backend", True)
+    for i in range(200):
+        tracker.record_outcome(f"Tune dashboard chart colors batch{i}", "frontend", True)
+
+    similar = analyzer.find_similar_tasks("Build blog REST API", limit=3)
+    assert [o["task"] for o in similar] == ["Build REST API for blog posts"]
+    assert set(similar[0]) == {"task", "agent_id", "status", "timestamp"}
+    assert similar[0]["agent_id"] == "backend"
+    assert analyzer.find_similar_tasks("Rotate TLS certificates") == []
+
+    workflows = WorkflowMemory(tmp_path / "workflows")
+    workflows.store_execution("exec_1", {"goal": "Build REST API for blog posts"})
+    workflows.store_execution("exec_2", {"goal": "Write onboarding docs"})
+
+    matches = WorkflowMemory(tmp_path / "workflows").find_similar("blog REST API build")
+    assert [m["execution_id"] for m in matches] == ["exec_1"]
+    assert matches[0]["similarity"] > 0.5
+    tracker.close()
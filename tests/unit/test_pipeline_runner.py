@@ -0,0 +1,95 @@
+"""
+Unit tests for PIPELINE stage execution.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.realtime_poc.big_three_realtime_agents.workflow.pipeline_runner import (
+    PipelineRunner,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import (
+    ExecutionStrategy,
+    TaskStatus,
+    WorkflowStage,
+    WorkflowTask,
+)
+
+
+def _stage(items, queue_size=1, step_concurrency=1):
+    steps = [
+        WorkflowTask(f"step_{name}", name, f"{name}-expert")
+        for name in ("analyze", "fix", "test")
+    ]
+    return WorkflowStage(
+        "stage_1", "Pipeline", steps, ExecutionStrategy.PIPELINE,
+        items=items, queue_size=queue_size, step_concurrency=step_concurrency,
+    )
+
+
+@pytest.mark.asyncio
+async def test_steps_overlap_and_pass_results_downstream():
+    """Later items are analyzed while earlier ones are already being tested."""
+    events = []
+
+    async def execute(task):
+        events.append(("start", task.task_id))
+        await asyncio.sleep(0.01)
+        events.append(("end", task.task_id))
+        return {"task_id": task.task_id, "status": "completed", "input": task.input_data}
+
+    stage = _stage([f"file{i}.py" for i in range(4)])
+    step_results, item_results = await PipelineRunner(execute).run(stage)
+
+    assert events.index(("start", "step_test#0")) < events.index(("end", "step_analyze#3"))
+    assert [r["status"] for r in item_results] == ["completed"] * 4
+    assert all(step.status == TaskStatus.COMPLETED for step in stage.tasks)
+
+    fix_result = step_results[1]["item_results"][2]
+    assert fix_result["input"]["item"] == "file2.py"
+    assert fix_result["input"]["upstream"]["task_id"] == "step_analyze#2"
+
+
+@pytest.mark.asyncio
+async def test_failed_items_stop_and_queues_bound_inflight_work():
+    """Failed items skip later steps; bounded queues limit items in flight."""
+    started = []
+
+    async def execute(task):
+        started.append(task.task_id)
+        await asyncio.sleep(0.005)
+        if task.task_id == "step_fix#1":
+            return {"task_id": task.task_id, "status": "failed", "error": "patch rejected"}
+        return {"task_id": task.task_id, "status": "completed"}
+
+    stage = _stage([f"file{i}.py" for i in range(10)], queue_size=1, step_concurrency=2)
+    step_results, item_results = await PipelineRunner(execute).run(stage)
+
+    assert item_results[1]["status"] == "failed"
+    assert item_results[1]["failed_step"] == "step_fix"
+    assert "step_test#1" not in started
+    assert step_results[2]["items_completed"] == 9
+    assert stage.tasks[1].status == TaskStatus.FAILED
+
+    # Analyze can't run arbitrarily far ahead of test
+    first_test = started.index(next(t for t in started if t.startswith("step_test")))
+    assert sum(1 for t in started[:first_test] if t.startswith("step_analyze")) < 10
+
+
+@pytest.mark.asyncio
+async def test_item_tasks_keep_step_timeout_and_p90():
+    """Per-item tasks inherit the step's timeout and P90 estimate."""
+    seen = []
+
+    async def execute(task):
+        seen.append((task.timeout, task.estimated_duration_p90))
+        return {"task_id": task.task_id, "status": "completed"}
+
+    stage = _stage(["file0.py"])
+    for step in stage.tasks:
+        step.timeout = 30
+        step.estimated_duration_p90 = 600
+    await PipelineRunner(execute).run(stage)
+
+    assert seen == [(30, 600)] * 3
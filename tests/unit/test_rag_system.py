@@ -2,6 +2,8 @@
 Unit tests for RAG System (from refactoring.md).
 """
 
+import json
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
@@ -117,3 +119,505 @@ async def test_retrieve_for_task():
 
     assert context is not None
     assert "relevant_code" in context or "similar_tasks" in context
+
+
+class FakeEmbeddingModel:
+    """Deterministic bag-of-characters embedding for tests."""
+
+    def __init__(self):
+        self.encode_calls = 0
+
+    def encode(self, text):
+        self.encode_calls += 1
+        if isinstance(text, list):
+            return FakeVector([self._embed(t) for t in text])
+        return FakeVector(self._embed(text))
+
+    def _embed(self, text):
+        vector = [0.0] * 16
+        for ch in text:
+            vector[ord(ch) % 16] += 1.0
+        return vector
+
+
+class FakeVector(list):
+    def tolist(self):
+        return list(self)
+
+
+class FakeCollection:
+    """Minimal in-memory stand-in for a ChromaDB collection."""
+
+    def __init__(self):
+        self.items = {}
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        for i, item_id in enumerate(ids):
+            self.items[item_id] = (embeddings[i], documents[i], metadatas[i])
+
+    add = upsert
+
+    def delete(self, ids):
+        for item_id in ids:
+            self.items.pop(item_id, None)
+
+    def get(self, include=None):
+        return {
+            "ids": list(self.items),
+            "documents": [v[1] for v in self.items.values()],
+            "metadatas": [v[2] for v in self.items.values()],
+        }
+
+    def query(self, query_embeddings, n_results):
+        query = query_embeddings[0]
+        scored = sorted(
+            self.items.items(),
+            key=lambda kv: sum((a - b) ** 2 for a, b in zip(kv[1][0], query)),
+        )[:n_results]
+        return {
+            "ids": [[k for k, _ in scored]],
+            "documents": [[v[1] for _, v in scored]],
+            "metadatas": [[v[2] for _, v in scored]],
+            "distances": [[0.0 for _ in scored]],
+        }
+
+
+def _rag_with_fakes():
+    from apps.realtime_poc.big_three_realtime_agents.memory.rag_system import RAGSystem
+    from apps.realtime_poc.big_three_realtime_agents.memory.vector_store import (
+        ChromaVectorStore,
+    )
+
+    rag = RAGSystem(memory_manager=Mock(), embedding_model=FakeEmbeddingModel())
+    rag.code_collection = ChromaVectorStore(FakeCollection())
+    rag.experience_collection = ChromaVectorStore(FakeCollection())
+    return rag
+
+
+def test_index_codebase_is_incremental(tmp_path):
+    """Re-indexing only embeds changed files and drops removed ones."""
+    (tmp_path / "a.py").write_text("def a():\n    return 1\n")
+    (tmp_path / "b.py").write_text("def b():\n    return 2\n")
+
+    rag = _rag_with_fakes()
+
+    stats = rag.index_codebase(tmp_path)
+    assert stats["added"] == 2
+
+    stats = rag.index_codebase(tmp_path)
+    assert stats["unchanged"] == 2
+    assert stats["added"] == 0
+
+    (tmp_path / "a.py").write_text("def a():\n    return 42\n")
+    (tmp_path / "b.py").unlink()
+
+    stats = rag.index_codebase(tmp_path)
+    assert stats["updated"] == 1
+    assert stats["removed"] == 1
+    assert rag.code_manifest.paths() == ["a.py"]
+    assert all(
+        meta["path"] == "a.py"
+        for _, _, meta in rag.code_collection.collection.items.values()
+    )
+
+
+def test_reindex_paths_handles_deleted_files(tmp_path):
+    """Watcher-driven re-index removes chunks of deleted files."""
+    target = tmp_path / "mod.py"
+    target.write_text("x = 1\n")
+
+    rag = _rag_with_fakes()
+    rag.index_codebase(tmp_path)
+
+    target.unlink()
+    stats = rag.reindex_paths(tmp_path, [target])
+
+    assert stats["removed"] == 1
+    assert rag.code_collection.collection.items == {}
+
+
+def test_python_chunker_splits_by_symbol():
+    """Python files are chunked per function/method with line ranges."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.code_chunker import (
+        chunk_file,
+    )
+
+    source = (
+        "import os\n"
+        "\n"
+        "class Store:\n"
+        "    limit = 3\n"
+        "\n"
+        "    def get(self, key):\n"
+        "        return key\n"
+        "\n"
+        "@decorated\n"
+        "def helper():\n"
+        "    return os.getcwd()\n"
+    )
+
+    chunks = chunk_file("store.py", source)
+    by_symbol = {c.symbol: c for c in chunks}
+
+    assert set(by_symbol) == {"<module>", "Store", "Store.get", "helper"}
+    assert (by_symbol["Store.get"].start_line, by_symbol["Store.get"].end_line) == (6, 7)
+    assert by_symbol["helper"].start_line == 9  # includes decorator
+    assert by_symbol["helper"].kind == "function"
+
+
+def test_chunker_falls_back_to_line_windows():
+    """Non-Python files use overlapping line windows."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.code_chunker import (
+        chunk_file,
+    )
+
+    source = "\n".join(f"const v{i} = {i};" for i in range(100))
+    chunks = chunk_file("app.js", source, window_lines=40, overlap=10)
+
+    assert [c.start_line for c in chunks] == [1, 31, 61]
+    assert chunks[-1].end_line == 100
+    assert all(c.kind == "window" for c in chunks)
+
+
+def test_search_code_returns_symbol_locations(tmp_path):
+    """Search results carry symbol names and line ranges."""
+    (tmp_path / "svc.py").write_text(
+        "def alpha():\n    return 'aaaa'\n\n\ndef beta():\n    return 'zzzz'\n"
+    )
+
+    rag = _rag_with_fakes()
+    rag.index_codebase(tmp_path)
+
+    results = rag.search_code("def beta():\n    return 'zzzz'", limit=1)
+
+    assert results[0]["path"] == "svc.py"
+    assert results[0]["symbol"] == "beta"
+    assert (results[0]["start_line"], results[0]["end_line"]) == (5, 6)
+
+
+@pytest.mark.asyncio
+async def test_augment_query_encodes_query_once():
+    """Code and experience searches share one cached query embedding."""
+    rag = _rag_with_fakes()
+    rag.memory.get_recent_conversation = Mock(return_value=[])
+    rag.memory.query_similar_patterns = Mock(return_value=[])
+    rag.index_experience(
+        {"experience_id": "exp_1", "goal": "login", "description": "built login page"}
+    )
+    model = rag.embedding_model
+    calls_before = model.encode_calls
+
+    await rag.augment_query("Create a   login page")
+    await rag.augment_query("Create a login page")
+
+    assert model.encode_calls - calls_before == 1
+
+
+def test_result_cache_invalidated_on_write(tmp_path):
+    """Writing to the code collection invalidates cached search results."""
+    (tmp_path / "one.py").write_text("def one():\n    return 1\n")
+
+    rag = _rag_with_fakes()
+    rag.index_codebase(tmp_path)
+    assert len(rag.search_code("one", limit=5)) == 1
+
+    (tmp_path / "two.py").write_text("def two():\n    return 2\n")
+    rag.index_codebase(tmp_path)
+
+    assert len(rag.search_code("one", limit=5)) == 2
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_numpy_vector_store_query_and_persistence(tmp_path, quantize):
+    """NumPy store returns nearest entries and survives reopening."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.numpy_vector_store import (
+        NumpyVectorStore,
+    )
+
+    store = NumpyVectorStore(tmp_path, "code", quantize=quantize)
+    store.upsert(
+        ids=["x", "y", "z"],
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.7, 0.0]],
+        documents=["doc x", "doc y", "doc z"],
+        metadatas=[{"path": "x.py"}, {"path": "y.py"}, {"path": "z.py"}],
+    )
+    store.delete(["z"])
+    store.upsert(["y"], [[0.0, 0.0, 1.0]], ["doc y2"], [{"path": "y.py"}])
+
+    results = store.query([0.9, 0.1, 0.0], n_results=2)
+    assert [r["id"] for r in results] == ["x", "y"]
+    assert results[0]["distance"] < results[1]["distance"]
+
+    reopened = NumpyVectorStore(tmp_path, "code", quantize=quantize)
+    assert reopened.count() == 2
+    assert reopened.query([0.0, 0.0, 1.0], n_results=1)[0]["document"] == "doc y2"
+
+
+def test_numpy_vector_store_duplicate_ids_in_batch(tmp_path):
+    """Duplicate IDs within one upsert keep only the last occurrence."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.numpy_vector_store import (
+        NumpyVectorStore,
+    )
+
+    store = NumpyVectorStore(tmp_path, "code")
+    store.upsert(
+        ids=["a", "b", "a"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.6, 0.8]],
+        documents=["a1", "b", "a2"],
+        metadatas=[{}, {}, {}],
+    )
+
+    assert store.count() == 2
+    assert int(store._alive.sum()) == 2
+    assert sorted(doc for _, doc, _ in store.get_all()) == ["a2", "b"]
+
+    reopened = NumpyVectorStore(tmp_path, "code")
+    assert reopened.count() == 2
+    assert reopened.query([0.6, 0.8], n_results=1)[0]["document"] == "a2"
+
+
+def test_rag_numpy_backend_persists_manifest(tmp_path):
+    """With the numpy backend, a restarted RAGSystem skips unchanged files."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.rag_system import RAGSystem
+
+    code_dir = tmp_path / "code"
+    code_dir.mkdir()
+    (code_dir / "m.py").write_text("def m():\n    return 1\n")
+    store_dir = tmp_path / "rag"
+
+    rag = RAGSystem(
+        Mock(), embedding_model=FakeEmbeddingModel(), vector_backend="numpy", storage_dir=store_dir
+    )
+    assert rag.index_codebase(code_dir)["added"] == 1
+
+    restarted = RAGSystem(
+        Mock(), embedding_model=FakeEmbeddingModel(), vector_backend="numpy", storage_dir=store_dir
+    )
+    assert restarted.index_codebase(code_dir)["unchanged"] == 1
+    assert restarted.search_code("def m", limit=1)[0]["symbol"] == "m"
+
+
+def test_persistent_collections_reused_until_model_changes(tmp_path):
+    """Experiences survive restarts and model changes; code is rebuilt on a model change."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.rag_system import RAGSystem
+
+    store_dir = tmp_path / "rag"
+
+    def open_rag(model_name="all-MiniLM-L6-v2"):
+        return RAGSystem(
+            Mock(),
+            embedding_model=FakeEmbeddingModel(),
+            vector_backend="numpy",
+            storage_dir=store_dir,
+            model_name=model_name,
+        )
+
+    rag = open_rag()
+    rag.index_experience(
+        {"experience_id": "exp_1", "goal": "login", "description": "built login page"}
+    )
+    assert rag.persistent
+
+    restarted = open_rag()
+    assert restarted.experience_collection.count() == 1
+    assert restarted.search_similar_experiences("login page", limit=1)
+
+    restarted.embedding_cache.get_or_compute("login page", lambda text: [1.0])
+    restarted.embedding_model = FakeEmbeddingModel()
+    assert len(restarted.embedding_cache._entries) == 0
+
+    switched = open_rag(model_name="other-model")
+    assert len(switched.code_manifest) == 0
+    # Experiences can't be rebuilt from the codebase: re-embedded, not dropped
+    assert switched.experience_collection.count() == 1
+    assert switched.search_similar_experiences("login page", limit=1)
+
+
+@pytest.mark.asyncio
+async def test_lazy_model_degrades_to_keyword_search(monkeypatch):
+    """Queries fall back to keywords while the model loads in the background."""
+    import sys
+    import threading
+    import types
+    from apps.realtime_poc.big_three_realtime_agents.memory.rag_system import RAGSystem
+    from apps.realtime_poc.big_three_realtime_agents.memory.vector_store import (
+        ChromaVectorStore,
+    )
+
+    release = threading.Event()
+    fake_model = FakeEmbeddingModel()
+
+    def slow_loader(name):
+        release.wait(timeout=5)
+        return fake_model
+
+    monkeypatch.setitem(
+        sys.modules,
+        "sentence_transformers",
+        types.SimpleNamespace(SentenceTransformer=slow_loader),
+    )
+
+    rag = RAGSystem(memory_manager=Mock(), warmup=True)
+    assert not rag.is_ready
+
+    rag.code_collection = ChromaVectorStore(FakeCollection())
+    rag.code_collection.upsert(
+        ids=["auth.py:1-2"],
+        embeddings=[[0.0] * 16],
+        documents=["def login(user):\n    return token"],
+        metadatas=[{"path": "auth.py", "symbol": "login"}],
+    )
+    rag.rebuild_lexical_index()
+
+    results = rag.search_code("login token", limit=3)
+    assert results[0]["match"] == "keyword"
+    assert results[0]["symbol"] == "login"
+
+    release.set()
+    assert await rag.wait_until_ready(timeout=5)
+    assert rag.search_code("login token", limit=3)[0]["match"] == "hybrid"
+
+
+@pytest.mark.asyncio
+async def test_augment_query_skips_slow_sources():
+    """A source exceeding its timeout is dropped; others still contribute."""
+    import time
+
+    rag = _rag_with_fakes()
+    rag.memory.get_recent_conversation = Mock(return_value=[])
+    rag.memory.query_similar_patterns = Mock(
+        side_effect=lambda *a, **kw: time.sleep(0.5) or [{"pattern": "slow"}]
+    )
+    rag.index_experience(
+        {"experience_id": "exp_1", "goal": "login", "description": "built login page"}
+    )
+
+    result = await rag.augment_query("Create a login page", source_timeout=0.1)
+    context = result["context"]
+
+    assert context["timed_out_sources"] == ["learned_patterns"]
+    assert context["learned_patterns"] == []
+    assert len(context["similar_experiences"]) == 1
+    rag.close()
+
+
+def test_hybrid_search_finds_exact_identifiers(tmp_path):
+    """BM25 surfaces symbol-name matches that the embedding ranks poorly."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.bm25_index import tokenize
+
+    assert tokenize("getUserById") == ["getuserbyid", "get", "user", "by", "id"]
+
+    code_dir = tmp_path / "code"
+    code_dir.mkdir()
+    (code_dir / "users.py").write_text(
+        "def get_user_by_id(uid):\n    return db.fetch(uid)\n\n\n"
+        "def list_users():\n    return db.all()\n"
+    )
+    (code_dir / "noise.py").write_text(
+        "".join(f"def helper_{i}():\n    return {i}\n\n\n" for i in range(20))
+    )
+
+    rag = _rag_with_fakes()
+    rag.hybrid_weights = {"vector": 0.0, "bm25": 1.0}
+    rag.index_codebase(code_dir)
+
+    results = rag.search_code("getUserById", limit=3)
+    assert results[0]["symbol"] == "get_user_by_id"
+    assert results[0]["scores"]["bm25"] > 0
+    assert results[0]["scores"]["rrf"] > 0
+
+
+def test_context_assembler_merges_and_respects_budget():
+    """Overlapping chunks merge, duplicates drop, output fits the budget."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.context_assembler import (
+        ContextAssembler,
+        ContextItem,
+    )
+
+    lines = [f"line_{i} = {i}" for i in range(1, 21)]
+    items = [
+        ContextItem("code", "\n".join(lines[0:12]), 0.9, path="a.py", start_line=1, end_line=12),
+        ContextItem("code", "\n".join(lines[9:20]), 0.8, path="a.py", start_line=10, end_line=20),
+        ContextItem("experience", "built login page", 0.7),
+        ContextItem("experience", "built  login page", 0.6),
+        ContextItem("experience", "x" * 4000, 0.5),
+    ]
+
+    assembled = ContextAssembler().assemble(items, token_budget=200)
+
+    code = assembled.by_source("code")
+    assert len(code) == 1
+    assert (code[0].start_line, code[0].end_line) == (1, 20)
+    assert code[0].text.splitlines() == lines
+    assert len(assembled.by_source("experience")) == 1
+    assert assembled.dropped == 1
+    assert 0 < assembled.tokens_used <= 200
+
+
+def test_context_assembler_counts_headings_in_budget():
+    """Headings and separators count toward the budget, not just item text."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.context_assembler import (
+        ContextAssembler,
+        ContextItem,
+        estimate_tokens,
+    )
+
+    items = [
+        ContextItem("code", "a" * 60, 0.9 - i / 100, path=f"m{i}.py") for i in range(4)
+    ] + [
+        ContextItem("experience", "b" * 60, 0.8 - i / 100) for i in range(4)
+    ] + [
+        ContextItem("pattern", "c" * 60, 0.7 - i / 100) for i in range(4)
+    ]
+
+    for budget in range(10, 200, 7):
+        assembled = ContextAssembler().assemble(items, token_budget=budget)
+        assert estimate_tokens(assembled.to_text()) == assembled.tokens_used
+        assert assembled.tokens_used <= budget
+
+
+@pytest.mark.asyncio
+async def test_retrieve_for_task_with_token_budget(tmp_path):
+    """A token budget bounds the retrieved context and reports usage."""
+    code_dir = tmp_path / "code"
+    code_dir.mkdir()
+    (code_dir / "api.py").write_text(
+        "".join(f"def handler_{i}():\n    return {i}\n\n\n" for i in range(30))
+    )
+
+    rag = _rag_with_fakes()
+    rag.memory.get_recent_conversation = Mock(return_value=[])
+    rag.memory.query_similar_patterns = Mock(return_value=[])
+    rag.index_codebase(code_dir)
+
+    context = await rag.retrieve_for_task("handler", "BackendExpert", token_budget=40)
+
+    assert context["tokens_used"] <= 40
+    assert context["relevant_code"]
+    assert "Relevant Code:" in context["context_text"]
+
+    result = await rag.augment_query("handler", token_budget=60)
+    assert result["tokens_used"] <= 60
+
+
+def test_experiences_reembedded_once_lazy_model_loads(tmp_path):
+    """A model change seen before the model loads re-embeds experiences on load."""
+    from apps.realtime_poc.big_three_realtime_agents.memory.rag_system import RAGSystem
+
+    store_dir = tmp_path / "rag"
+    rag = RAGSystem(
+        Mock(), embedding_model=FakeEmbeddingModel(), vector_backend="numpy",
+        storage_dir=store_dir,
+    )
+    rag.index_experience(
+        {"experience_id": "exp_1", "goal": "login", "description": "built login page"}
+    )
+
+    lazy = RAGSystem(Mock(), vector_backend="numpy", storage_dir=store_dir, model_name="other")
+    meta = json.loads((store_dir / "rag_meta.json").read_text())
+    assert meta["experiences_stale"] is True
+
+    lazy.embedding_model = FakeEmbeddingModel()
+    meta = json.loads((store_dir / "rag_meta.json").read_text())
+    assert "experiences_stale" not in meta
+    assert lazy.experience_collection.count() == 1
@@ -0,0 +1,102 @@
+"""
+Unit tests for content-addressed task result memoization.
+"""
+
+import subprocess
+import time
+
+import pytest
+
+from apps.realtime_poc.big_three_realtime_agents.workflow.result_cache import ResultCache
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import WorkflowTask
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_planner import (
+    WorkflowPlanner,
+)
+
+
+def _git_repo(path):
+    path.mkdir()
+    for command in (
+        ["git", "init", "-q"],
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", "commit", "-q",
+         "--allow-empty", "-m", "init"],
+    ):
+        subprocess.run(command, cwd=path, check=True)
+    return path
+
+
+def test_key_ttl_and_size_bound(tmp_path):
+    repo = _git_repo(tmp_path / "repo")
+    cache = ResultCache(tmp_path / "cache", ttl_seconds=60, max_bytes=400)
+    task = WorkflowTask("task_1", "Analyze  the API", "Reviewer")
+
+    key = cache.key(task, None, str(repo))
+    assert key == cache.key(WorkflowTask("x", "analyze the api", "Reviewer"), None, str(repo))
+    assert key != cache.key(task, "Item: a.py", str(repo))
+
+    (repo / "api.py").write_text("x = 1\n")
+    untracked_key = cache.key(task, None, str(repo))
+    assert untracked_key != key
+
+    # Editing an untracked file changes the key too, not just adding one
+    (repo / "api.py").write_text("x = 2\n")
+    assert cache.key(task, None, str(repo)) != untracked_key
+
+    cache.put(key, {"status": "completed", "output": "fine"})
+    assert cache.get(key)["output"] == "fine"
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get(key) is None
+
+    cache.ttl_seconds = 60
+    for i in range(5):
+        cache.put(f"k{i}", {"status": "completed", "output": "x" * 100})
+    assert cache.stats()["bytes"] <= 400
+    assert cache.get("k0") is None and cache.get("k4") is not None
+
+
+class CountingCoder:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = []
+
+    async def execute_task(self, task, working_dir):
+        self.calls.append(task)
+        if self.fail_on and self.fail_on in task:
+            raise RuntimeError("tests failed")
+        return {"output": "analysis done", "files_modified": []}
+
+
+def _engine(pool_engine, tmp_path, coder, cache):
+    engine, _ = pool_engine(
+        coder, expert_id="Reviewer", working_directory=tmp_path / "repo", result_cache=cache
+    )
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_rerun_reuses_successful_cacheable_tasks(tmp_path, pool_engine):
+    _git_repo(tmp_path / "repo")
+    cache = ResultCache(tmp_path / "cache")
+    tasks = [
+        {"description": "Analyze module layout", "agent_id": "Reviewer", "cacheable": True},
+        {"description": "Run the test suite", "agent_id": "Reviewer", "cacheable": True},
+    ]
+
+    coder = CountingCoder(fail_on="Run the test suite")
+    first = await _engine(pool_engine, tmp_path, coder, cache).execute_plan(
+        WorkflowPlanner(None, None).create_multi_task_plan("Review", tasks)
+    )
+    assert first["status"] == "failed"
+
+    coder = CountingCoder()
+    second = await _engine(pool_engine, tmp_path, coder, cache).execute_plan(
+        WorkflowPlanner(None, None).create_multi_task_plan("Review", tasks)
+    )
+
+    assert second["status"] == "completed"
+    assert len(coder.calls) == 1 and "Run the test suite" in coder.calls[0]
+    task_results = second["stage_results"][0]["task_results"]
+    assert task_results[0]["cached"] is True
+    assert task_results[0]["output"] == "analysis done"
@@ -0,0 +1,33 @@
+"""
+Unit tests for shared text normalization.
+"""
+
+from apps.realtime_poc.big_three_realtime_agents.learning.task_types import (
+    infer_task_type,
+)
+from apps.realtime_poc.big_three_realtime_agents.text_normalization import (
+    contains_phrase,
+    extract_keywords,
+    stem,
+    tokenize,
+)
+
+
+def test_tokenize_stems_and_drops_stop_words():
+    """Inflections share a stem; stop words and punctuation are dropped."""
+    assert tokenize("Fix the failing tests in CI/CD!") == ("fix", "fail", "test", "ci", "cd")
+    assert stem("dependencies") == "dependency"
+    assert stem("databases") == "database"
+    assert stem("fixes") == "fix"
+    assert stem("class") == "class"
+    assert tokenize.cache_info().currsize > 0
+
+
+def test_phrases_match_whole_normalized_words():
+    """Phrase checks agree across selectors, task typing and memory search."""
+    assert contains_phrase("Train a machine learning model", "machine learning")
+    assert contains_phrase("Set up ci/cd pipeline", "ci/cd")
+    assert contains_phrase("Write integration testing", "tests")
+    assert not contains_phrase("Rapid prototype", "api")
+    assert extract_keywords("Testing the tests for API endpoints") == ["test", "api", "endpoint"]
+    assert infer_task_type("Add endpoints to the REST APIs") == "backend"
@@ -0,0 +1,140 @@
+"""
+Unit tests for task timeouts, workflow deadlines and failure policies.
+"""
+
+import asyncio
+
+import pytest
+
+from apps.realtime_poc.big_three_realtime_agents.agents.pool.agent_pool import AgentStatus
+from apps.realtime_poc.big_three_realtime_agents.timeouts import (
+    WORKFLOW_TASK_TIMEOUT_MAX,
+    WORKFLOW_TASK_TIMEOUT_MIN,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_models import (
+    ExecutionStrategy,
+    FailurePolicy,
+    TaskStatus,
+    WorkflowTask,
+)
+from apps.realtime_poc.big_three_realtime_agents.workflow.workflow_planner import (
+    WorkflowPlanner,
+)
+
+
+class ScriptedCoder:
+    """Hangs on tasks mentioning "hang", raises on "boom", else succeeds."""
+
+    async def execute_task(self, task, working_dir):
+        if "hang" in task:
+            await asyncio.sleep(3600)
+        if "boom" in task:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.05)
+        return {"output": "ok", "files_modified": []}
+
+
+def _engine(pool_engine):
+    return pool_engine(ScriptedCoder(), expert_id="Worker", max_instances=3)
+
+
+def _plan(descriptions, policy=FailurePolicy.CONTINUE_ON_ERROR):
+    return WorkflowPlanner(None, None).create_multi_task_plan(
+        "Work",
+        [{"description": d, "agent_id": "Worker", "duration": 60} for d in descriptions],
+        strategy=ExecutionStrategy.PARALLEL,
+        failure_policy=policy,
+    )
+
+
+def _all_idle(pool_manager):
+    return all(i.status == AgentStatus.IDLE for i in pool_manager.active_instances.values())
+
+
+def test_task_timeout_derived_from_estimates(pool_engine):
+    engine, _ = _engine(pool_engine)
+
+    assert engine._task_timeout(WorkflowTask("t", "d", "a", estimated_duration=120)) == 360
+    p90 = WorkflowTask("t", "d", "a", estimated_duration=120, estimated_duration_p90=300)
+    assert engine._task_timeout(p90) == 900
+    assert engine._task_timeout(WorkflowTask("t", "d", "a", estimated_duration=1)) == (
+        WORKFLOW_TASK_TIMEOUT_MIN
+    )
+    assert engine._task_timeout(WorkflowTask("t", "d", "a", estimated_duration=10**6)) == (
+        WORKFLOW_TASK_TIMEOUT_MAX
+    )
+    assert engine._task_timeout(WorkflowTask("t", "d", "a", timeout=5)) == 5
+
+
+@pytest.mark.asyncio
+async def test_hung_task_times_out_and_continue_on_error_collects_rest(pool_engine):
+    engine, pool_manager = _engine(pool_engine)
+    plan = _plan(["hang forever", "normal work"])
+    plan.stages[0].tasks[0].timeout = 0.1
+
+    results = await asyncio.wait_for(engine.execute_plan(plan), 5)
+
+    hung, normal = results["stage_results"][0]["task_results"]
+    assert hung["status"] == "failed" and "timed out" in hung["error"]
+    assert normal["status"] == "completed"
+    assert _all_idle(pool_manager)
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_cancels_siblings(pool_engine):
+    engine, pool_manager = _engine(pool_engine)
+    plan = _plan(["boom now", "hang one", "hang two"], FailurePolicy.FAIL_FAST)
+
+    results = await asyncio.wait_for(engine.execute_plan(plan), 5)
+
+    statuses = [r["status"] for r in results["stage_results"][0]["task_results"]]
+    assert statuses == ["failed", "cancelled", "cancelled"]
+    assert results["status"] == "failed"
+    assert plan.stages[0].tasks[1].status == TaskStatus.CANCELLED
+    assert _all_idle(pool_manager)
+
+
+@pytest.mark.asyncio
+async def test_workflow_deadline_cancels_running_tasks(pool_engine):
+    engine, pool_manager = _engine(pool_engine)
+    plan = _plan(["hang one", "hang two"])
+
+    results = await asyncio.wait_for(engine.execute_plan(plan, deadline_seconds=0.2), 5)
+
+    assert results["status"] == "failed"
+    assert "deadline" in results["error"]
+    assert results["stage_results"][0]["cancelled"] == 2
+    assert _all_idle(pool_manager)
+
+
+@pytest.mark.asyncio
+async def test_zero_deadline_is_not_treated_as_unset(pool_engine):
+    engine, _ = _engine(pool_engine)
+    plan = _plan(["normal work"])
+    plan.metadata["deadline_seconds"] = 0
+
+    results = await asyncio.wait_for(engine.execute_plan(plan), 5)
+
+    assert results["deadline_seconds"] == 0
+    assert results["status"] == "failed"
+
+
+def test_planner_takes_task_timeouts_and_failure_policy():
+    planner = WorkflowPlanner(None, None)
+    plan = planner.create_multi_task_plan(
+        "Work",
+        [{"description": "quick check", "agent_id": "Worker", "duration": 60, "timeout": 15}],
+        failure_policy=FailurePolicy.FAIL_FAST,
+    )
+    assert plan.failure_policy == FailurePolicy.FAIL_FAST
+    assert plan.stages[0].tasks[0].timeout == 15
+
+    pipeline = planner.create_pipeline_plan(
+        "Fix files",
+        [{"description": "fix", "agent_id": "Worker", "duration": 60, "timeout": 30}],
+        ["a.py"],
+        failure_policy=FailurePolicy.FAIL_FAST,
+    )
+    assert pipeline.failure_policy == FailurePolicy.FAIL_FAST
+    assert pipeline.stages[0].tasks[0].timeout == 30